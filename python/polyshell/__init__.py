@@ -20,34 +20,90 @@
 # Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 #
 
+from __future__ import annotations
 
-from collections.abc import Sequence
+import sys
 from enum import Enum
-from typing import Literal, overload
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Literal, overload
 
+from polyshell._polyshell import PreparedPolygon as _PreparedPolygon
 from polyshell._polyshell import (
+    ReductionProfile,
+    ReductionStats,
+    RepairReport,
+    ThreadLimit,
     __version__,
+    get_num_threads,
+)
+from polyshell._polyshell import profile_polygon as _profile_polygon
+from polyshell._polyshell import reduce_polygon_array_f32
+from polyshell._polyshell import reduce_polygon_auto as _reduce_polygon_auto
+from polyshell._polyshell import (
+    reduce_polygon_auto_array,
+    reduce_polygon_batch,
+    reduce_polygon_batch_array,
+    reduce_polygon_batch_array_f32,
     reduce_polygon_char,
+    reduce_polygon_char_array,
+    reduce_polygon_char_array_unchecked,
+    reduce_polygon_char_unchecked,
+    reduce_polygon_indices,
+    reduce_polygon_parts,
     reduce_polygon_rdp,
+    reduce_polygon_rdp_array,
+    reduce_polygon_rdp_array_unchecked,
+    reduce_polygon_rdp_unchecked,
     reduce_polygon_vw,
+    reduce_polygon_vw_array,
+    reduce_polygon_vw_array_unchecked,
+    reduce_polygon_vw_unchecked,
+    set_num_threads,
+    submit_reduction,
+    validate_polygon,
+    validate_polygon_array,
 )
 
 __all__ = [
+    "PreparedPolygon",
     "ReductionMethod",
     "ReductionMode",
+    "ReductionProfile",
+    "ReductionStats",
+    "RepairReport",
+    "ThreadLimit",
+    "ValidatedPolygon",
     "reduce_polygon",
     "reduce_polygon_eps",
     "reduce_polygon_len",
     "reduce_polygon_auto",
+    "reduce_polygons",
+    "reduce_polygon_async",
+    "reduce_polygons_async",
+    "profile_polygon",
+    "set_num_threads",
+    "get_num_threads",
     "__version__",
 ]
 
 
-Polygon = Sequence[tuple[float, float]]
+if TYPE_CHECKING:
+    from asyncio import Future
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Sequence,
+    )
 
+    from numpy.typing import NDArray
+    from shapely import MultiPolygon as ShapelyMultiPolygon
+    from shapely import Polygon as ShapelyPolygon
 
-class NullClass:
-    pass
+    Ring = Sequence[tuple[float, float]] | NDArray[float]
+    Polygon = Ring | ShapelyPolygon | ShapelyMultiPolygon
 
 
 class ReductionMethod(str, Enum):
@@ -62,45 +118,256 @@ class ReductionMode(str, Enum):
     AUTO = "auto"
 
 
-# Feature gates
-try:
-    from shapely import Polygon as ShapelyPolygon
+# Optional dependencies are detected by duck typing, so are only imported once used
+def is_array(obj: any) -> bool:
+    """Check whether an object is a NumPy array, or any other array-like object."""
+    return hasattr(type(obj), "__array_interface__")
 
-    Polygon = Polygon | ShapelyPolygon
-except ImportError:
-    ShapelyPolygon = NullClass
 
-try:
-    from numpy import ndarray
-    from numpy.typing import NDArray
+def geom_type(obj: any) -> str | None:
+    """The geometry type of a Shapely geometry, or None for any other object."""
+    return getattr(obj, "geom_type", None)
+
+
+class ValidatedPolygon:
+    """A polygon which has passed validation, wound clockwise.
 
-    Polygon = Polygon | NDArray[float]
-except ImportError:
-    ndarray = NullClass
+    Reducing a validated polygon skips validation, so the same polygon can be reduced many
+    times at the cost of a single check. With repair, rings are first closed and wound
+    clockwise, and consecutive duplicates and the middle points of straight runs are dropped.
+    The changes made are reported by the repairs attribute. The validated coordinates are
+    read-only, so that they cannot be changed once checked.
+    """
 
+    __slots__ = ("_coords", "_positions", "repairs")
 
-def into_polygon(obj: any) -> Sequence[tuple[float, float]]:
-    """Cast a polygon object into a supported type."""
+    def __init__(self, polygon: Polygon, repair: bool = False):
+        if has_parts(polygon):
+            raise parts_not_implemented("ValidatedPolygon")
+
+        polygon = into_polygon(polygon)
+        if is_buffer(polygon):
+            coords, positions, self.repairs = validate_polygon_array(
+                polygon, repair=repair
+            )
+            coords.flags.writeable = False
+        else:
+            coords, positions, self.repairs = validate_polygon(polygon, repair=repair)
+            coords = tuple(coords)
+        self._coords = coords
+        self._positions = positions
+
+    @property
+    def coords(self) -> "tuple[tuple[float, float], ...] | NDArray[float]":
+        return self._coords
+
+    def __len__(self) -> int:
+        return len(self._coords)
+
+
+def into_polygon(obj: any, single: bool = False) -> Sequence[tuple[float, float]]:
+    """Cast a polygon object into a supported type.
+
+    With single, float32 arrays are kept in single precision rather than cast to float64.
+    """
     match obj:
+        case ValidatedPolygon(coords=coords):
+            return coords
+        case memoryview() as view:
+            return view
         case [*_] as seq:
             return seq
-        case ndarray() as arr:
-            return arr
-        case ShapelyPolygon(exterior=exterior):
-            return exterior.coords
+        case _ if is_array(obj):
+            from numpy import ascontiguousarray
+
+            # No copy is made if the array is already C-contiguous in this precision
+            dtype = "float32" if single and obj.dtype == "float32" else "float64"
+            return ascontiguousarray(obj, dtype=dtype)
+        case _ if geom_type(obj) == "Polygon":
+            return obj.exterior.coords
+        case _:
+            raise TypeError(f"{type(obj)} cannot be interpreted as a Polygon object")
+
+
+def into_index_polygon(obj: any) -> "NDArray[float]":
+    """Cast a polygon object into an array, against which indices are returned.
+
+    The indices of a validated polygon refer to its validated coordinates.
+    """
+    from numpy import ascontiguousarray
+
+    return ascontiguousarray(into_polygon(obj), dtype="float64").reshape(-1, 2)
+
+
+def reduce_repaired(reduce, polygon: ValidatedPolygon, *args) -> "NDArray[int]":
+    """Reduce a repaired polygon to indices, mapped back to positions in the unrepaired input."""
+    indices = reduce(into_index_polygon(polygon), *args)
+    positions = polygon._positions
+    if not is_array(positions):
+        from numpy import asarray
+
+        positions = asarray(positions, dtype=indices.dtype)
+    return positions[indices]
+
+
+def select_engine(
+    method: ReductionMethod,
+    array: bool,
+    checked: bool,
+    indices: bool = False,
+    single: bool = False,
+    live_index: bool = False,
+) -> "Callable[[Polygon, float, int], list[list[float]] | NDArray[float]]":
+    """Select the engine function reducing a polygon with the given method.
+
+    With indices, the engine returns the index of each retained vertex rather than its
+    coordinates, and the polygon must be given as an array. With single, the polygon is a
+    float32 array which is reduced, and returned, in single precision. With live_index,
+    Visvalingam-Whyatt keeps its spatial index in step with the polygon, and other methods
+    are unaffected.
+    """
+    if indices:
+        method = ReductionMethod(method)
+        return lambda polygon, eps, length: reduce_polygon_indices(
+            polygon, method, eps, length, checked=checked, live_index=live_index
+        )
+    if single:
+        method = ReductionMethod(method)
+        return lambda polygon, eps, length: reduce_polygon_array_f32(
+            polygon, method, eps, length, checked=checked, live_index=live_index
+        )
+
+    match method, array, checked:
+        case ReductionMethod.CHARSHAPE, False, True:
+            return reduce_polygon_char
+        case ReductionMethod.CHARSHAPE, True, True:
+            return reduce_polygon_char_array
+        case ReductionMethod.CHARSHAPE, False, False:
+            return reduce_polygon_char_unchecked
+        case ReductionMethod.CHARSHAPE, True, False:
+            return reduce_polygon_char_array_unchecked
+        case ReductionMethod.RDP, False, True:
+            return reduce_polygon_rdp
+        case ReductionMethod.RDP, True, True:
+            return reduce_polygon_rdp_array
+        case ReductionMethod.RDP, False, False:
+            return reduce_polygon_rdp_unchecked
+        case ReductionMethod.RDP, True, False:
+            return reduce_polygon_rdp_array_unchecked
+        case ReductionMethod.VW, False, True:
+            return partial(reduce_polygon_vw, live_index=live_index)
+        case ReductionMethod.VW, True, True:
+            return partial(reduce_polygon_vw_array, live_index=live_index)
+        case ReductionMethod.VW, False, False:
+            return partial(reduce_polygon_vw_unchecked, live_index=live_index)
+        case ReductionMethod.VW, True, False:
+            return partial(reduce_polygon_vw_array_unchecked, live_index=live_index)
         case _:
-            raise TypeError(
-                f"{type(obj)} cannot be interpreted as Polygon object {ShapelyPolygon}"
+            raise ValueError(
+                f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
             )
 
 
+def is_buffer(polygon: Polygon) -> bool:
+    """Check whether a polygon can be passed to the engine as a coordinate buffer."""
+    return isinstance(polygon, memoryview) or is_array(polygon)
+
+
+def is_single(polygon: Polygon) -> bool:
+    """Check whether a polygon is a float32 array, to be reduced in single precision."""
+    return is_array(polygon) and polygon.dtype == "float32"
+
+
+def has_parts(polygon: Polygon) -> bool:
+    """Check whether a polygon has holes or multiple parts."""
+    match geom_type(polygon):
+        case "MultiPolygon":
+            return True
+        case "Polygon":
+            return len(polygon.interiors) > 0
+        case _:
+            return False
+
+
+def parts_not_implemented(feature: str) -> NotImplementedError:
+    """The error raised by features which only reduce polygons without holes or parts."""
+    return NotImplementedError(
+        f"{feature} is not implemented for polygons with holes or multiple parts"
+    )
+
+
+def reduce_parts(
+    polygons: "Sequence[Polygon]",
+    epsilon: float,
+    length: int,
+    method: ReductionMethod,
+    live_index: bool = False,
+) -> "list[Polygon | list[tuple[float, float]]]":
+    """Reduce every part of a batch of polygons in parallel, preserving their holes.
+
+    The parts of each polygon are kept from colliding. Polygons with holes or parts are returned
+    as Shapely geometries of the same type, and any others as lists of coordinates.
+    """
+    parts = [polygon_rings(polygon) for polygon in polygons]
+    rings = [ring for polygon_parts in parts for ring in polygon_parts]
+    groups = [i for i, polygon_parts in enumerate(parts) for _ in polygon_parts]
+    reduced = iter(
+        reduce_polygon_parts(
+            rings, method, epsilon, length, groups=groups, live_index=live_index
+        )
+    )
+
+    return [
+        rebuild(polygon, list(islice(reduced, len(polygon_parts))))
+        for polygon, polygon_parts in zip(polygons, parts)
+    ]
+
+
+def polygon_rings(polygon: Polygon) -> "list[tuple[Sequence, list[Sequence]]]":
+    """The exterior and interior rings of every part of a polygon."""
+    match geom_type(polygon):
+        case "MultiPolygon":
+            return [
+                (part.exterior.coords, [ring.coords for ring in part.interiors])
+                for part in polygon.geoms
+            ]
+        case "Polygon":
+            return [
+                (polygon.exterior.coords, [ring.coords for ring in polygon.interiors])
+            ]
+        case _:
+            return [(into_polygon(polygon), [])]
+
+
+def rebuild(
+    polygon: Polygon, parts: "list[tuple[list, list[list]]]"
+) -> "Polygon | list[tuple[float, float]]":
+    """Rebuild a polygon from its reduced parts."""
+    if not has_parts(polygon):
+        ((exterior, _),) = parts
+        return exterior
+
+    from shapely import MultiPolygon as ShapelyMultiPolygon
+    from shapely import Polygon as ShapelyPolygon
+
+    polygons = [ShapelyPolygon(exterior, interiors) for exterior, interiors in parts]
+    if isinstance(polygon, ShapelyMultiPolygon):
+        return ShapelyMultiPolygon(polygons)
+    return polygons[0]
+
+
 @overload
 def reduce_polygon(
     polygon: Polygon,
     mode: Literal[ReductionMode.EPSILON],
     epsilon: float,
     method: ReductionMethod,
-) -> list[list[float]]:
+    *,
+    return_indices: bool = False,
+    repair: bool = False,
+    live_index: bool = False,
+    num_threads: int | None = None,
+) -> "list[list[float]] | NDArray[int]":
     pass
 
 
@@ -110,13 +377,23 @@ def reduce_polygon(
     mode: Literal[ReductionMode.LENGTH],
     length: int,
     method: ReductionMethod,
-) -> list[list[float]]:
+    *,
+    return_indices: bool = False,
+    repair: bool = False,
+    live_index: bool = False,
+    num_threads: int | None = None,
+) -> "list[list[float]] | NDArray[int]":
     pass
 
 
 @overload
 def reduce_polygon(
-    polygon: Polygon, mode: Literal[ReductionMode.AUTO], method: ReductionMethod
+    polygon: Polygon,
+    mode: Literal[ReductionMode.AUTO],
+    method: ReductionMethod,
+    *,
+    repair: bool = False,
+    num_threads: int | None = None,
 ) -> list[list[float]]:
     pass
 
@@ -125,32 +402,76 @@ def reduce_polygon(
     polygon: Polygon,
     mode: ReductionMode,
     *args,
+    num_threads: int | None = None,
     **kwargs,
 ) -> list[list[float]]:
-    match mode:
-        case ReductionMode.EPSILON:
-            return reduce_polygon_eps(polygon, *args, **kwargs)
-        case ReductionMode.LENGTH:
-            return reduce_polygon_len(polygon, *args, **kwargs)
-        case ReductionMode.AUTO:
-            return reduce_polygon_auto(polygon, *args, **kwargs)
-        case _:
-            raise ValueError(
-                f"Unknown reduction mode. Must be one of {[e.value for e in ReductionMode]}"
-            )
+    """Reduce a polygon, on at most num_threads threads if given.
+
+    With repair, the polygon is repaired before it is validated, as by ValidatedPolygon.
+    With live_index, Visvalingam-Whyatt keeps its spatial index of segments in step with the
+    polygon, which is faster for large reductions.
+    """
+    with ThreadLimit(num_threads):
+        match mode:
+            case ReductionMode.EPSILON:
+                return reduce_polygon_eps(polygon, *args, **kwargs)
+            case ReductionMode.LENGTH:
+                return reduce_polygon_len(polygon, *args, **kwargs)
+            case ReductionMode.AUTO:
+                return reduce_polygon_auto(polygon, *args, **kwargs)
+            case _:
+                raise ValueError(
+                    f"Unknown reduction mode. Must be one of {[e.value for e in ReductionMode]}"
+                )
 
 
 def reduce_polygon_eps(
-    polygon: Polygon, epsilon: float, method: ReductionMethod
-) -> list[list[float]]:
-    polygon = into_polygon(polygon)
+    polygon: Polygon,
+    epsilon: float,
+    method: ReductionMethod,
+    *,
+    return_indices: bool = False,
+    repair: bool = False,
+    live_index: bool = False,
+) -> "list[list[float]] | NDArray[int]":
+    if has_parts(polygon):
+        if return_indices:
+            raise parts_not_implemented("Returning indices")
+        if repair:
+            raise parts_not_implemented("Repair")
+        (reduced,) = reduce_parts(
+            [polygon], *batch_args_eps(epsilon, method), live_index
+        )
+        return reduced
+
+    if repair:
+        polygon = ValidatedPolygon(polygon, repair=True)
+    checked = not isinstance(polygon, ValidatedPolygon)
+    if return_indices and repair:
+        reduce = partial(
+            reduce_repaired,
+            select_engine(method, True, checked, indices=True, live_index=live_index),
+        )
+    else:
+        if return_indices:
+            polygon = into_index_polygon(polygon)
+        else:
+            polygon = into_polygon(polygon, single=True)
+        reduce = select_engine(
+            method,
+            is_buffer(polygon),
+            checked,
+            indices=return_indices,
+            single=is_single(polygon),
+            live_index=live_index,
+        )
     match method:
         case ReductionMethod.CHARSHAPE:
-            return reduce_polygon_char(polygon, epsilon, len(polygon))
+            return reduce(polygon, epsilon, sys.maxsize)  # no maximum length
         case ReductionMethod.RDP:
-            return reduce_polygon_rdp(polygon, epsilon)
+            return reduce(polygon, epsilon, 0)
         case ReductionMethod.VW:
-            return reduce_polygon_vw(polygon, epsilon, 0)
+            return reduce(polygon, epsilon, 0)
         case _:
             raise ValueError(
                 f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
@@ -161,32 +482,415 @@ def reduce_polygon_len(
     polygon: Polygon,
     length: int,
     method: ReductionMethod,
-) -> list[list[float]]:
-    polygon = into_polygon(polygon)
+    *,
+    return_indices: bool = False,
+    repair: bool = False,
+    live_index: bool = False,
+) -> "list[list[float]] | NDArray[int]":
+    if has_parts(polygon):
+        raise parts_not_implemented("Fixed length")
+
+    if repair:
+        polygon = ValidatedPolygon(polygon, repair=True)
+    checked = not isinstance(polygon, ValidatedPolygon)
+    if return_indices and repair:
+        reduce = partial(
+            reduce_repaired,
+            select_engine(method, True, checked, indices=True, live_index=live_index),
+        )
+    else:
+        if return_indices:
+            polygon = into_index_polygon(polygon)
+        else:
+            polygon = into_polygon(polygon, single=True)
+        reduce = select_engine(
+            method,
+            is_buffer(polygon),
+            checked,
+            indices=return_indices,
+            single=is_single(polygon),
+            live_index=live_index,
+        )
     match method:
         case ReductionMethod.CHARSHAPE:
-            return reduce_polygon_char(polygon, 0.0, length)  # maximum length
+            return reduce(polygon, 0.0, length)  # maximum length
         case ReductionMethod.RDP:
-            raise NotImplementedError("Fixed length is not implemented for RDP")
+            return reduce(polygon, 0.0, length)  # maximum length
         case ReductionMethod.VW:
-            # minimum length
-            return reduce_polygon_vw(polygon, float("inf"), length)
+            return reduce(polygon, float("inf"), length)  # minimum length
         case _:
             raise ValueError(
                 f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
             )
 
 
-def reduce_polygon_auto(polygon: Polygon, method: ReductionMethod) -> list[list[float]]:
+def reduce_polygon_auto(
+    polygon: Polygon, method: ReductionMethod, *, repair: bool = False
+) -> list[list[float]]:
+    """Reduce a polygon at a tolerance chosen from the knee of its error profile."""
+    if has_parts(polygon):
+        raise parts_not_implemented("Automatic reduction")
+
+    if repair:
+        polygon = ValidatedPolygon(polygon, repair=True)
     polygon = into_polygon(polygon)
+    match method:
+        case ReductionMethod.CHARSHAPE | ReductionMethod.RDP | ReductionMethod.VW:
+            reduce = (
+                reduce_polygon_auto_array
+                if is_buffer(polygon)
+                else _reduce_polygon_auto
+            )
+            return reduce(polygon, ReductionMethod(method))
+        case _:
+            raise ValueError(
+                f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
+            )
+
+
+def profile_polygon(polygon: Polygon, method: ReductionMethod) -> ReductionProfile:
+    """Run a reduction to completion, recording the order in which vertices are removed.
+
+    The returned profile lists the removal tolerance and rank of each vertex, in the order of the
+    original polygon, and extracts the polygon at any tolerance or length without reducing again.
+    """
+    if has_parts(polygon):
+        raise parts_not_implemented("Profiling")
+
+    polygon = into_polygon(polygon)
+    match method:
+        case ReductionMethod.CHARSHAPE | ReductionMethod.RDP | ReductionMethod.VW:
+            return _profile_polygon(polygon, ReductionMethod(method))
+        case _:
+            raise ValueError(
+                f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
+            )
+
+
+def reduce_polygons(
+    polygons: "Sequence[Polygon] | NDArray[float]",
+    mode: ReductionMode,
+    *args,
+    offsets: "NDArray[int] | None" = None,
+    live_index: bool = False,
+    num_threads: int | None = None,
+    **kwargs,
+) -> "list[list[tuple[float, float]]] | tuple[NDArray[float], NDArray[int]]":
+    """Reduce a batch of polygons in parallel, in the epsilon and length modes.
+
+    Polygons are either given as a sequence, or as a single (N, 2) coordinate array together with
+    an array of offsets, such that polygon i is made up of coordinates offsets[i]:offsets[i + 1].
+    Results are returned in the same layout as the input. A float32 coordinate array is reduced,
+    and returned, in single precision. With num_threads, at most that many threads are used.
+    Live indexing is as for reduce_polygon. Polygons with holes or parts are reduced as by
+    reduce_polygon, into Shapely geometries, in the epsilon mode only.
+    """
+    eps, length, method = batch_args(mode, *args, **kwargs)
+
+    if offsets is not None:
+        from numpy import ascontiguousarray
+
+        single = is_single(polygons)
+        reduce = (
+            reduce_polygon_batch_array_f32 if single else reduce_polygon_batch_array
+        )
+        with ThreadLimit(num_threads):
+            return reduce(
+                ascontiguousarray(polygons, dtype="float32" if single else "float64"),
+                ascontiguousarray(offsets, dtype="int64"),
+                method,
+                eps,
+                length,
+                live_index=live_index,
+            )
+    if any(has_parts(polygon) for polygon in polygons):
+        if mode == ReductionMode.LENGTH:
+            raise parts_not_implemented("Fixed length")
+        with ThreadLimit(num_threads):
+            return reduce_parts(polygons, eps, length, method, live_index)
+
+    polygons = [into_polygon(polygon) for polygon in polygons]
+    with ThreadLimit(num_threads):
+        return reduce_polygon_batch(
+            polygons, method, eps, length, live_index=live_index
+        )
+
+
+async def reduce_polygon_async(
+    polygon: Polygon,
+    mode: ReductionMode,
+    *args,
+    live_index: bool = False,
+    num_threads: int | None = None,
+    **kwargs,
+) -> "list[tuple[float, float]] | NDArray[float]":
+    """Reduce a polygon on the thread pool, without blocking the event loop.
+
+    Takes the same arguments as reduce_polygon, in the epsilon and length modes. Cancelling
+    the awaiting task skips the reduction if it has not yet started.
+    """
+    (reduced,) = await reduce_polygons_async(
+        [polygon],
+        mode,
+        *args,
+        live_index=live_index,
+        num_threads=num_threads,
+        **kwargs,
+    )
+    return reduced
+
+
+async def reduce_polygons_async(
+    polygons: "Iterable[Polygon] | AsyncIterable[Polygon]",
+    mode: ReductionMode,
+    *args,
+    max_pending: int | None = None,
+    live_index: bool = False,
+    num_threads: int | None = None,
+    **kwargs,
+) -> "list[list[tuple[float, float]] | NDArray[float]]":
+    """Reduce a batch of polygons on the thread pool, without blocking the event loop.
+
+    Polygons may be given by an iterable or an asynchronous iterable. Without max_pending,
+    every polygon is read and the batch reduced in parallel, as by reduce_polygons. With
+    max_pending, polygons are submitted one at a time, and no more are read while max_pending
+    are still being reduced. Cancelling the awaiting task skips every polygon not yet started.
+    """
+    import asyncio
+
+    eps, length, method = batch_args(mode, *args, **kwargs)
+
+    if max_pending is None:
+        batch = [polygon async for polygon in iterate(polygons)]
+        with ThreadLimit(num_threads):
+            future = submit(batch, eps, length, method, live_index=live_index)
+        return await future
+
+    if max_pending < 1:
+        raise ValueError("max_pending must be at least 1")
+
+    pending = asyncio.Semaphore(max_pending)
+    futures = []
+    polygons = iterate(polygons)
+    try:
+        while True:
+            # The next polygon is only read once there is room for it
+            await pending.acquire()
+            try:
+                polygon = await anext(polygons)
+            except StopAsyncIteration:
+                break
+            with ThreadLimit(num_threads):
+                future = submit([polygon], eps, length, method, live_index=live_index)
+            future.add_done_callback(lambda _: pending.release())
+            futures.append(future)
+        results = await asyncio.gather(*futures)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+    return [reduced for (reduced,) in results]
+
+
+async def iterate(
+    polygons: "Iterable[Polygon] | AsyncIterable[Polygon]",
+) -> "AsyncIterator[Polygon]":
+    """Iterate over polygons given by either an iterable or an asynchronous iterable."""
+    if hasattr(polygons, "__aiter__"):
+        async for polygon in polygons:
+            yield polygon
+    else:
+        for polygon in polygons:
+            yield polygon
+
+
+def submit(
+    polygons: list[Polygon],
+    eps: float,
+    length: int,
+    method: ReductionMethod,
+    live_index: bool = False,
+) -> "Future[list]":
+    """Submit a batch of polygons to the thread pool, returning a future of the reduced batch.
+
+    The future must be created from within a running event loop. Cancelling it skips every
+    polygon not yet started.
+    """
+    import asyncio
+
+    if any(has_parts(polygon) for polygon in polygons):
+        raise parts_not_implemented("Asynchronous reduction")
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def complete(result: list | None, error: BaseException | None):
+        # Called from a pool thread, so the result is handed back to the event loop
+        try:
+            loop.call_soon_threadsafe(resolve, future, result, error)
+        except RuntimeError:
+            pass  # the event loop has been closed
+
+    checked = not all(isinstance(polygon, ValidatedPolygon) for polygon in polygons)
+    rings = [into_polygon(polygon) for polygon in polygons]
+    task = submit_reduction(
+        rings, method, eps, length, complete, checked=checked, live_index=live_index
+    )
+
+    def cancel(future: "Future[list]"):
+        if future.cancelled():
+            task.cancel()
+
+    future.add_done_callback(cancel)
+    return future
+
+
+def resolve(future: "Future[list]", result: list | None, error: BaseException | None):
+    """Complete a future with the outcome of a reduction, unless it is already cancelled."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    elif result is None:
+        future.cancel()
+    else:
+        future.set_result(result)
+
+
+def batch_args(
+    mode: ReductionMode, *args, **kwargs
+) -> tuple[float, int, ReductionMethod]:
+    match mode:
+        case ReductionMode.EPSILON:
+            return batch_args_eps(*args, **kwargs)
+        case ReductionMode.LENGTH:
+            return batch_args_len(*args, **kwargs)
+        case ReductionMode.AUTO:
+            raise ValueError(
+                "Automatic reduction is not supported in batches. Must be one of "
+                f"{[ReductionMode.EPSILON.value, ReductionMode.LENGTH.value]}"
+            )
+        case _:
+            raise ValueError(
+                f"Unknown reduction mode. Must be one of {[e.value for e in ReductionMode]}"
+            )
+
+
+def batch_args_eps(
+    epsilon: float, method: ReductionMethod
+) -> tuple[float, int, ReductionMethod]:
     match method:
         case ReductionMethod.CHARSHAPE:
-            raise NotImplementedError
+            return epsilon, sys.maxsize, ReductionMethod(method)  # no maximum length
+        case ReductionMethod.RDP | ReductionMethod.VW:
+            return epsilon, 0, ReductionMethod(method)
+        case _:
+            raise ValueError(
+                f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
+            )
+
+
+def batch_args_len(
+    length: int, method: ReductionMethod
+) -> tuple[float, int, ReductionMethod]:
+    match method:
+        case ReductionMethod.CHARSHAPE:
+            return 0.0, length, ReductionMethod(method)  # maximum length
         case ReductionMethod.RDP:
-            raise NotImplementedError
+            return 0.0, length, ReductionMethod(method)  # maximum length
         case ReductionMethod.VW:
-            raise NotImplementedError
+            return float("inf"), length, ReductionMethod(method)  # minimum length
         case _:
             raise ValueError(
                 f"Unknown reduction method. Must be one of {[e.value for e in ReductionMethod]}"
             )
+
+
+class PreparedPolygon:
+    """A validated polygon which can be reduced repeatedly at little extra cost.
+
+    The triangulation and convex hull segments built during the first reduction are kept, and
+    reused by every later reduction. Reduced polygons are always wound clockwise.
+    """
+
+    def __init__(self, polygon: Polygon):
+        if geom_type(polygon) == "MultiPolygon":
+            raise TypeError("Multi-polygons must be prepared one part at a time")
+
+        self._holes = has_parts(polygon)
+        self._array = False
+        if self._holes:
+            interiors = [ring.coords for ring in polygon.interiors]
+            self._prepared = _PreparedPolygon(polygon.exterior.coords, interiors)
+        else:
+            polygon = into_polygon(polygon)
+            self._array = is_buffer(polygon)
+            self._prepared = _PreparedPolygon(polygon)
+
+    def reduce(
+        self,
+        mode: ReductionMode,
+        *args,
+        live_index: bool = False,
+        num_threads: int | None = None,
+        **kwargs,
+    ) -> "list[tuple[float, float]] | NDArray[float] | ShapelyPolygon":
+        """Reduce the polygon, taking the same arguments as reduce_polygon."""
+        with ThreadLimit(num_threads):
+            return self._reduce(mode, *args, live_index=live_index, **kwargs)
+
+    def _reduce(
+        self,
+        mode: ReductionMode,
+        *args,
+        live_index: bool = False,
+        **kwargs,
+    ) -> "list[tuple[float, float]] | NDArray[float] | ShapelyPolygon":
+        match mode:
+            case ReductionMode.EPSILON:
+                eps, length, method = batch_args_eps(*args, **kwargs)
+            case ReductionMode.LENGTH:
+                if self._holes:
+                    raise parts_not_implemented("Fixed length")
+                eps, length, method = batch_args_len(*args, **kwargs)
+            case ReductionMode.AUTO:
+                return self.reduce_auto(*args, **kwargs)
+            case _:
+                raise ValueError(
+                    f"Unknown reduction mode. Must be one of {[e.value for e in ReductionMode]}"
+                )
+
+        if self._holes:
+            from shapely import Polygon as ShapelyPolygon
+
+            exterior, interiors = self._prepared.reduce_parts(
+                method, eps, length, live_index=live_index
+            )
+            return ShapelyPolygon(exterior, interiors)
+        elif self._array:
+            return self._prepared.reduce_array(
+                method, eps, length, live_index=live_index
+            )
+        return self._prepared.reduce(method, eps, length, live_index=live_index)
+
+    def reduce_auto(
+        self, method: ReductionMethod
+    ) -> "list[tuple[float, float]] | NDArray[float]":
+        """Reduce at a tolerance chosen from the knee of the error profile."""
+        if self._holes:
+            raise parts_not_implemented("Automatic reduction")
+
+        reduced = self._prepared.reduce_auto(ReductionMethod(method))
+        if self._array:
+            from numpy import asarray
+
+            return asarray(reduced)
+        return reduced
+
+    def profile(self, method: ReductionMethod) -> ReductionProfile:
+        """Run a reduction to completion, recording the order in which vertices are removed."""
+        if self._holes:
+            raise parts_not_implemented("Profiling")
+
+        return self._prepared.profile(ReductionMethod(method))
@@ -21,21 +21,58 @@
 #
 
 
+import json
 import pickle
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from itertools import islice
 from pathlib import Path
+from time import perf_counter
+from typing import TextIO
 
 import typer
-from matplotlib import pyplot as plt
-from polyshell import ReductionMethod, ReductionMode, reduce_polygon
+from polyshell import (
+    ReductionMethod,
+    ReductionMode,
+    batch_args_eps,
+    reduce_parts,
+    reduce_polygon,
+)
+from shapely import (
+    MultiPolygon,
+    Polygon,
+    force_2d,
+    from_wkb,
+    get_num_coordinates,
+    to_wkb,
+)
+from shapely.geometry import mapping, shape
 
 app = typer.Typer(no_args_is_help=True)
 
 
+class Format(str, Enum):
+    GEOJSONSEQ = "geojsonseq"
+    WKB = "wkb"
+
+
+SUFFIXES = {
+    ".geojsonl": Format.GEOJSONSEQ,
+    ".geojsons": Format.GEOJSONSEQ,
+    ".geojsonseq": Format.GEOJSONSEQ,
+    ".jsonl": Format.GEOJSONSEQ,
+    ".wkb": Format.WKB,
+}
+
+
 @app.command()
 def plot_reduction(
     path: Path, mode: ReductionMode, val: float, method: ReductionMethod
 ):
     """Plot a polygon and its reduction."""
+    from matplotlib import pyplot as plt
+
     with open(path, "rb") as f:
         original_poly = pickle.load(f)
 
@@ -54,5 +91,164 @@ def plot_reduction(
     plt.show()
 
 
+class Throughput:
+    """Counts of the features and vertices streamed so far, and their rates."""
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.features = 0
+        self.vertices = 0
+        self.reduced = 0
+        self.invalid = 0
+
+    def __str__(self) -> str:
+        elapsed = max(perf_counter() - self.start, 1e-9)
+        return (
+            f"{self.features} features, {self.vertices} -> {self.reduced} vertices "
+            f"({self.features / elapsed:.0f} features/s, "
+            f"{self.vertices / elapsed:.0f} vertices/s)"
+        )
+
+
+def read_record(line: str, fmt: Format) -> tuple[any, dict | None]:
+    """Parse a geometry, and the GeoJSON object holding it, from a line of input."""
+    match fmt:
+        case Format.GEOJSONSEQ:
+            record = json.loads(line.lstrip("\x1e"))
+            geometry = record["geometry"] if record.get("type") == "Feature" else record
+            return (None if geometry is None else shape(geometry)), record
+        case Format.WKB:
+            return from_wkb(line.strip()), None
+
+
+def write_record(geometry: any, record: dict | None, fmt: Format) -> str:
+    """Serialise a reduced geometry in place of the original, as a line of output."""
+    match fmt:
+        case Format.GEOJSONSEQ:
+            if record.get("type") == "Feature":
+                record["geometry"] = None if geometry is None else mapping(geometry)
+            else:
+                record = mapping(geometry)
+            return json.dumps(record)
+        case Format.WKB:
+            return to_wkb(geometry, hex=True)
+
+
+def polygon_parts(geometry: any) -> list[Polygon]:
+    """The non-empty polygons making up a geometry, if any."""
+    match geometry:
+        case Polygon():
+            parts = [geometry]
+        case MultiPolygon():
+            parts = list(geometry.geoms)
+        case _:
+            parts = []
+    return [force_2d(part) for part in parts if not part.is_empty]
+
+
+def reduce_chunk(
+    geometries: list[any], epsilon: float, method: ReductionMethod
+) -> tuple[list[any], int]:
+    """Reduce the polygons of a chunk of geometries in one parallel batch.
+
+    If any polygon is invalid, the chunk is reduced geometry by geometry instead, and
+    invalid geometries are passed through unchanged. Returns the reduced geometries and
+    the number left invalid.
+    """
+    parts = [polygon_parts(geometry) for geometry in geometries]
+    try:
+        polygons = [
+            rebuild(geometry, part) for geometry, part in zip(geometries, parts) if part
+        ]
+        reduced = reduce_parts(polygons, *batch_args_eps(epsilon, method))
+    except ValueError:
+        if len(geometries) == 1:
+            return geometries, 1
+        results = [reduce_chunk([geometry], epsilon, method) for geometry in geometries]
+        reduced = [geometry for (geometry,), _ in results]
+        return reduced, sum(invalid for _, invalid in results)
+
+    # Polygons without holes are reduced to their coordinates
+    reduced = iter(reduced)
+    return [
+        into_geometry(next(reduced)) if part else geometry
+        for geometry, part in zip(geometries, parts)
+    ], 0
+
+
+def rebuild(geometry: any, parts: list[Polygon]) -> any:
+    """Rebuild a geometry from its polygon parts."""
+    return MultiPolygon(parts) if isinstance(geometry, MultiPolygon) else parts[0]
+
+
+def into_geometry(reduced: any) -> any:
+    """A reduced polygon as a Shapely geometry, built from its coordinates if need be."""
+    return Polygon(reduced) if isinstance(reduced, list) else reduced
+
+
+def read_chunks(lines: TextIO, size: int) -> Iterator[list[str]]:
+    """Split the non-blank lines of a file into chunks of at most the given size."""
+    lines = (line for line in lines if line.strip())
+    while chunk := list(islice(lines, size)):
+        yield chunk
+
+
+@app.command()
+def reduce(
+    source: Path,
+    destination: Path,
+    epsilon: float,
+    method: ReductionMethod,
+    chunk_size: int = typer.Option(1024, min=1, help="Features reduced per batch."),
+):
+    """Reduce every polygon in a GeoJSON-seq or hex WKB file, streaming to a new file.
+
+    Features are read and reduced in chunks, the next chunk being parsed while the last
+    is reduced in parallel, so that at most two chunks are held in memory at once. Other
+    geometries, and GeoJSON properties, are copied through unchanged.
+    """
+    fmt = SUFFIXES.get(source.suffix)
+    if fmt is None:
+        raise typer.BadParameter(
+            f"Unknown format {source.suffix!r}. Must be one of {list(SUFFIXES)}"
+        )
+
+    stats = Throughput()
+
+    def flush(dst: TextIO, records: list[tuple[any, dict | None]], future: Future):
+        reduced, invalid = future.result()
+        for (_, record), simplified in zip(records, reduced):
+            dst.write(write_record(simplified, record, fmt) + "\n")
+
+        stats.features += len(records)
+        stats.vertices += int(get_num_coordinates([g for g, _ in records]).sum())
+        stats.reduced += int(get_num_coordinates(reduced).sum())
+        stats.invalid += invalid
+        typer.echo(f"\r{stats}", nl=False, err=True)
+
+    with (
+        open(source) as src,
+        open(destination, "w") as dst,
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        pending = None
+        for chunk in read_chunks(src, chunk_size):
+            records = [read_record(line, fmt) for line in chunk]
+            geometries = [geometry for geometry, _ in records]
+            future = executor.submit(reduce_chunk, geometries, epsilon, method)
+
+            # Write the last chunk while this one is reduced
+            if pending is not None:
+                flush(dst, *pending)
+            pending = records, future
+
+        if pending is not None:
+            flush(dst, *pending)
+
+    typer.echo(f"\r{stats}", err=True)
+    if stats.invalid:
+        typer.echo(f"{stats.invalid} invalid features copied unchanged", err=True)
+
+
 if __name__ == "__main__":
     app()
@@ -20,29 +20,71 @@
 # Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 #
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from types import TracebackType
+
+from numpy import float32, float64, int64, uint32, uint64
+from numpy.typing import NDArray
 
 __all__ = [
+    "reduce_polygon_vw",
     "reduce_polygon_char",
     "reduce_polygon_rdp",
-    "reduce_polygon_rdp",
+    "reduce_polygon_vw_unchecked",
+    "reduce_polygon_char_unchecked",
+    "reduce_polygon_rdp_unchecked",
+    "reduce_polygon_vw_array",
+    "reduce_polygon_char_array",
+    "reduce_polygon_rdp_array",
+    "reduce_polygon_vw_array_unchecked",
+    "reduce_polygon_char_array_unchecked",
+    "reduce_polygon_rdp_array_unchecked",
+    "reduce_polygon_auto",
+    "reduce_polygon_auto_array",
+    "reduce_polygon_indices",
+    "reduce_polygon_array_f32",
+    "reduce_polygon_batch",
+    "reduce_polygon_batch_array",
+    "reduce_polygon_batch_array_f32",
+    "reduce_polygon_parts",
+    "submit_reduction",
+    "ReductionTask",
+    "profile_polygon",
+    "ReductionProfile",
+    "PreparedPolygon",
     "is_valid",
+    "validate_polygon",
+    "RepairReport",
+    "validate_polygon_array",
+    "ReductionStats",
+    "set_num_threads",
+    "get_num_threads",
+    "ThreadLimit",
+    "__version__",
 ]
 
+__version__: str
+
 SupportsIntoVec = Sequence[tuple[float, float]]
+SupportsBuffer = NDArray[float64] | memoryview
 
 def reduce_polygon_char(
     polygon: SupportsIntoVec, eps: float, len: int
 ) -> list[list[float]]:
     """Reduce a polygon while retaining coverage."""
 
-def reduce_polygon_rdp(polygon: SupportsIntoVec, eps: float) -> list[list[float]]:
+def reduce_polygon_rdp(
+    polygon: SupportsIntoVec, eps: float, len: int
+) -> list[list[float]]:
     """Reduce a polygon while retaining coverage."""
 
 def reduce_polygon_vw(
-    polygon: SupportsIntoVec, eps: float, len: int
+    polygon: SupportsIntoVec, eps: float, len: int, *, live_index: bool = False
 ) -> list[list[float]]:
-    """Reduce a polygon while retaining coverage."""
+    """Reduce a polygon while retaining coverage.
+
+    With live_index, the spatial index is updated as vertices are removed.
+    """
 
 def reduce_polygon_char_unchecked(
     polygon: SupportsIntoVec, eps: float, len: int
@@ -50,14 +92,283 @@ def reduce_polygon_char_unchecked(
     """Reduce a polygon while retaining coverage."""
 
 def reduce_polygon_rdp_unchecked(
-    polygon: SupportsIntoVec, eps: float
+    polygon: SupportsIntoVec, eps: float, len: int
 ) -> list[list[float]]:
     """Reduce a polygon while retaining coverage."""
 
 def reduce_polygon_vw_unchecked(
-    polygon: SupportsIntoVec, eps: float, len: int
+    polygon: SupportsIntoVec, eps: float, len: int, *, live_index: bool = False
 ) -> list[list[float]]:
     """Reduce a polygon while retaining coverage."""
 
+def reduce_polygon_char_array(
+    polygon: SupportsBuffer, eps: float, len: int
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage."""
+
+def reduce_polygon_rdp_array(
+    polygon: SupportsBuffer, eps: float, len: int
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage."""
+
+def reduce_polygon_vw_array(
+    polygon: SupportsBuffer, eps: float, len: int, *, live_index: bool = False
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage.
+
+    With live_index, the spatial index is updated as vertices are removed.
+    """
+
+def reduce_polygon_char_array_unchecked(
+    polygon: SupportsBuffer, eps: float, len: int
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage."""
+
+def reduce_polygon_rdp_array_unchecked(
+    polygon: SupportsBuffer, eps: float, len: int
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage."""
+
+def reduce_polygon_vw_array_unchecked(
+    polygon: SupportsBuffer, eps: float, len: int, *, live_index: bool = False
+) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array while retaining coverage."""
+
+def reduce_polygon_auto(polygon: SupportsIntoVec, method: str) -> list[list[float]]:
+    """Reduce a polygon at a tolerance chosen from its error profile."""
+
+def reduce_polygon_auto_array(polygon: SupportsBuffer, method: str) -> NDArray[float64]:
+    """Reduce a C-contiguous (N, 2) array at a tolerance chosen from its error profile."""
+
+def reduce_polygon_indices(
+    polygon: SupportsBuffer,
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    checked: bool = True,
+    live_index: bool = False,
+) -> NDArray[uint32] | NDArray[uint64]:
+    """Reduce a C-contiguous (N, 2) array, returning the indices of the retained vertices.
+
+    Indices are uint32 unless the ring is too long, in which case they are uint64.
+    """
+
+def reduce_polygon_array_f32(
+    polygon: NDArray[float32],
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    checked: bool = True,
+    live_index: bool = False,
+) -> NDArray[float32]:
+    """Reduce a C-contiguous (N, 2) float32 array in single precision."""
+
+def reduce_polygon_batch(
+    polygons: Sequence[SupportsIntoVec],
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    live_index: bool = False,
+) -> list[list[tuple[float, float]]]:
+    """Reduce a batch of polygons in parallel while retaining coverage."""
+
+def reduce_polygon_batch_array(
+    coords: SupportsBuffer,
+    offsets: NDArray[int64],
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    live_index: bool = False,
+) -> tuple[NDArray[float64], NDArray[int64]]:
+    """Reduce a batch of polygons, stored as coordinates and offsets, in parallel."""
+
+def reduce_polygon_batch_array_f32(
+    coords: NDArray[float32],
+    offsets: NDArray[int64],
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    live_index: bool = False,
+) -> tuple[NDArray[float32], NDArray[int64]]:
+    """Reduce a batch of float32 polygons, stored as coordinates and offsets, in parallel."""
+
+def reduce_polygon_parts(
+    parts: Sequence[tuple[SupportsIntoVec, Sequence[SupportsIntoVec]]],
+    method: str,
+    eps: float,
+    len: int,
+    *,
+    groups: Sequence[int] | None = None,
+    live_index: bool = False,
+) -> list[tuple[list[tuple[float, float]], list[list[tuple[float, float]]]]]:
+    """Reduce polygons with holes in parallel, shrinking each hole inwards.
+
+    Parts in the same group, by default all of them, are kept from colliding by reducing
+    them less. Invalid parts are reported by their group if groups are given, and otherwise
+    by their position.
+    """
+
+class ReductionTask:
+    """A batch of polygons reduced in the background, which may be cancelled."""
+
+    def cancel(self) -> None:
+        """Skip every polygon of the batch not yet started."""
+
+    @property
+    def cancelled(self) -> bool: ...
+    @property
+    def skipped(self) -> int:
+        """Number of polygons skipped since the task was cancelled."""
+
+def submit_reduction(
+    polygons: Sequence[SupportsIntoVec | SupportsBuffer],
+    method: str,
+    eps: float,
+    len: int,
+    callback: Callable[[list | None, BaseException | None], object],
+    *,
+    checked: bool = True,
+    live_index: bool = False,
+) -> ReductionTask:
+    """Reduce a batch of polygons in the background, returning without waiting for the result.
+
+    Once reduced, callback is called from a pool thread with the reduced polygons or an
+    exception. Both are None if the task was cancelled.
+    """
+
+class ReductionProfile:
+    """The removal order of every vertex of a polygon."""
+
+    @property
+    def tolerances(self) -> list[float]:
+        """The tolerance at which each vertex is removed."""
+
+    @property
+    def ranks(self) -> list[int]:
+        """The rank of each vertex, from zero for the most significant."""
+
+    def __len__(self) -> int: ...
+    def at_epsilon(self, eps: float) -> list[tuple[float, float]]:
+        """Extract the polygon reduced at the given tolerance."""
+
+    def at_length(self, len: int) -> list[tuple[float, float]]:
+        """Extract the polygon reduced to the given length."""
+
+def profile_polygon(polygon: SupportsIntoVec, method: str) -> ReductionProfile:
+    """Run a reduction to completion, recording the order in which vertices are removed."""
+
+class PreparedPolygon:
+    """A validated polygon, caching its triangulation and hull segments across reductions."""
+
+    def __init__(
+        self,
+        exterior: SupportsIntoVec,
+        interiors: Sequence[SupportsIntoVec] = ...,
+    ) -> None: ...
+    def reduce(
+        self, method: str, eps: float, len: int, *, live_index: bool = False
+    ) -> list[tuple[float, float]]:
+        """Reduce the exterior of the polygon."""
+
+    def reduce_auto(self, method: str) -> list[tuple[float, float]]:
+        """Reduce the exterior at a tolerance chosen from its error profile."""
+
+    def profile(self, method: str) -> ReductionProfile:
+        """Run a reduction to completion, recording the order in which vertices are removed."""
+
+    def reduce_array(
+        self, method: str, eps: float, len: int, *, live_index: bool = False
+    ) -> NDArray[float64]:
+        """Reduce the exterior of the polygon into an (N, 2) array."""
+
+    def reduce_parts(
+        self, method: str, eps: float, len: int, *, live_index: bool = False
+    ) -> tuple[list[tuple[float, float]], list[list[tuple[float, float]]]]:
+        """Reduce the exterior and interiors of the polygon."""
+
 def is_valid(polygon: SupportsIntoVec) -> bool:
     """Check a polygon is valid."""
+
+class RepairReport:
+    """The changes made to a polygon by the repair stage."""
+
+    @property
+    def closed(self) -> int:
+        """Number of rings which were not closed."""
+
+    @property
+    def reversed(self) -> int:
+        """Number of rings whose winding was reversed."""
+
+    @property
+    def duplicates(self) -> int:
+        """Number of consecutive duplicate points dropped."""
+
+    @property
+    def collinear(self) -> int:
+        """Number of points dropped from the middle of straight runs."""
+
+    def __bool__(self) -> bool:
+        """Whether the polygon was changed."""
+
+def validate_polygon(
+    polygon: SupportsIntoVec, *, repair: bool = False
+) -> tuple[list[tuple[float, float]], list[int], RepairReport]:
+    """Validate a polygon, returning it wound clockwise.
+
+    With repair, the polygon is repaired before it is validated. Also returns the position in
+    the given polygon of each returned coordinate.
+    """
+
+def validate_polygon_array(
+    polygon: SupportsBuffer, *, repair: bool = False
+) -> tuple[NDArray[float64], NDArray[uint32] | NDArray[uint64], RepairReport]:
+    """Validate a C-contiguous (N, 2) array, returning it wound clockwise.
+
+    With repair, the polygon is repaired before it is validated. Also returns the position in
+    the given array of each returned coordinate.
+    """
+
+class ReductionStats:
+    """Timings and counts collected from every reduction made within a with block."""
+
+    def __enter__(self) -> ReductionStats: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool: ...
+    @property
+    def phases(self) -> dict[str, float]:
+        """Seconds spent in each phase, summed over every thread."""
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Work done by the algorithms, and the deepest recursion reached."""
+
+def set_num_threads(num_threads: int | None = None) -> None:
+    """Set the number of threads reductions run on, or None for a thread per core.
+
+    Raises ValueError for zero threads.
+    """
+
+def get_num_threads() -> int:
+    """The number of threads reductions made on the calling thread run on."""
+
+class ThreadLimit:
+    """Run reductions made on the calling thread within a with block on a pool of the given size."""
+
+    def __init__(self, num_threads: int | None = None) -> None: ...
+    def __enter__(self) -> ThreadLimit: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool: ...
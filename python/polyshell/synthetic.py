@@ -0,0 +1,173 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Deterministic synthetic polygons of any size, for stress and scaling tests.
+
+Every generator returns a valid polygon of exactly n coordinates, closed and wound
+clockwise, as an (n, 2) float64 array. The same size and seed always give the same
+polygon. NumPy is required.
+"""
+
+from math import isqrt
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ["SHAPES", "coastline", "collinear", "comb", "generate", "spiral"]
+
+
+def _check_size(n: int, minimum: int):
+    if n < minimum:
+        raise ValueError(f"Polygon must have at least {minimum} coordinates, got {n}")
+
+
+def _into_ring(coords: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Wind unique coordinates clockwise, and close the ring."""
+    x, y = coords.T
+    if np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y) > 0:
+        coords = coords[::-1]
+    return np.concatenate([coords, coords[:1]])
+
+
+def coastline(
+    n: int, seed: int = 0, hurst: float = 0.5, amplitude: float = 0.5
+) -> NDArray[np.float64]:
+    """A fractal coastline, rough at every scale.
+
+    The logarithm of the radius is fractional Brownian noise around the circle, with the
+    given Hurst exponent and standard deviation, synthesised in the frequency domain so
+    that it joins up seamlessly. Vertices are evenly spaced in angle, so the polygon is
+    star-shaped about the origin and never self-intersects.
+    """
+    _check_size(n, 4)
+    m = n - 1
+    rng = np.random.default_rng(seed)
+
+    freqs = np.arange(1, m // 2 + 1)
+    spectrum = np.zeros(m // 2 + 1, dtype=np.complex128)
+    noise = rng.standard_normal((2, len(freqs)))
+    spectrum[1:] = (noise[0] + 1j * noise[1]) * freqs ** -(hurst + 0.5)
+
+    log_r = np.fft.irfft(spectrum, m)
+    if (std := log_r.std()) > 0:
+        log_r *= amplitude / std
+
+    theta = 2 * np.pi * np.arange(m) / m
+    r = np.exp(log_r)
+    return _into_ring(np.column_stack([r * np.cos(theta), r * np.sin(theta)]))
+
+
+def spiral(n: int, seed: int = 0) -> NDArray[np.float64]:
+    """A thick spiral arm, winding about the origin roughly sqrt(n) / 16 times.
+
+    Every turn lies within a quarter turn's pitch of the turns either side, so the
+    polygon is long and narrow, and most of its vertices see few others. The radii of
+    both sides are jittered by up to an eighth of the pitch.
+    """
+    _check_size(n, 32)
+    m = n - 1
+    rng = np.random.default_rng(seed)
+    turns = max(1, isqrt(n) // 16)
+
+    def side(count: int, offset: float, reverse: bool) -> NDArray[np.float64]:
+        theta = np.linspace(0, 2 * np.pi * turns, count)
+        if reverse:
+            theta = theta[::-1]
+        r = 1 + theta / (2 * np.pi) + offset + rng.uniform(-0.125, 0.125, count)
+        return np.column_stack([r * np.cos(theta), r * np.sin(theta)])
+
+    inner = side(m // 2, 0.0, reverse=False)
+    outer = side(m - m // 2, 0.5, reverse=True)
+    return _into_ring(np.concatenate([inner, outer]))
+
+
+def comb(n: int, seed: int = 0) -> NDArray[np.float64]:
+    """A comb of rectangular teeth separated by deep, narrow fjords.
+
+    Teeth and fjords are half a unit wide, and teeth stand between 1 and 16 units tall.
+    The base is bowed downwards to take up any remaining vertices.
+    """
+    _check_size(n, 6)
+    m = n - 1
+    rng = np.random.default_rng(seed)
+    teeth = (n - 2) // 4
+
+    x = np.arange(teeth, dtype=np.float64)
+    h = rng.uniform(1, 16, teeth)
+    zero = np.zeros(teeth)
+    top = np.stack(
+        [
+            np.column_stack([x, zero]),
+            np.column_stack([x, h]),
+            np.column_stack([x + 0.5, h]),
+            np.column_stack([x + 0.5, zero]),
+        ],
+        axis=1,
+    ).reshape(-1, 2)
+
+    width = teeth - 0.5
+    base_x = np.linspace(width, 0, m - 4 * teeth + 2)[1:-1]
+    base_y = -1 - np.sin(np.pi * base_x / width)
+    return _into_ring(np.concatenate([top, np.column_stack([base_x, base_y])]))
+
+
+def collinear(n: int, seed: int = 0) -> NDArray[np.float64]:
+    """A unit square whose sides are long runs of almost collinear vertices.
+
+    Each vertex is displaced from its side by up to a millionth of the spacing between
+    vertices, so that nearly every orientation test is close to degenerate.
+    """
+    _check_size(n, 5)
+    m = n - 1
+    rng = np.random.default_rng(seed)
+
+    corners = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+    runs = []
+    for i, start in enumerate(corners):
+        end = corners[(i + 1) % 4]
+        count = (m - 4 + i) // 4
+        t = np.arange(1, count + 1) / (count + 1)
+        normal = np.array([end[1] - start[1], start[0] - end[0]])
+        offset = rng.uniform(-1e-6, 1e-6, count) / (count + 1)
+        run = start + np.outer(t, end - start) + np.outer(offset, normal)
+        runs += [start[None], run]
+    return _into_ring(np.concatenate(runs))
+
+
+SHAPES = {
+    "coastline": coastline,
+    "spiral": spiral,
+    "comb": comb,
+    "collinear": collinear,
+}
+
+
+def generate(shape: str, n: int, seed: int = 0) -> NDArray[np.float64]:
+    """Generate a synthetic polygon of the named shape, with n coordinates."""
+    try:
+        generator = SHAPES[shape]
+    except KeyError:
+        raise ValueError(
+            f"Unknown shape {shape!r}. Must be one of {list(SHAPES)}"
+        ) from None
+    return generator(n, seed)
@@ -0,0 +1,72 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Time taken to import PolyShell in a fresh interpreter.
+
+Short-lived workers pay the import on every spawn, so it should take only milliseconds.
+Each import runs in a new process, and the modules it loads are checked to make sure
+that neither NumPy nor Shapely is imported until used.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+REPEATS = 20
+OPTIONAL = ["numpy", "shapely", "matplotlib"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import polyshell
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_once() -> tuple[float, set[str]]:
+    """Import PolyShell in a new interpreter, returning the time and modules loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, check=True, text=True
+    )
+    probe = json.loads(result.stdout)
+    return probe["elapsed"], {name.partition(".")[0] for name in probe["modules"]}
+
+
+def main():
+    times, loaded = [], set()
+    for _ in range(REPEATS):
+        elapsed, modules = import_once()
+        times.append(elapsed)
+        loaded |= modules
+
+    print(f"import polyshell ({REPEATS} runs)")
+    print(f"  median: {1000 * statistics.median(times):7.2f} ms")
+    print(f"  min:    {1000 * min(times):7.2f} ms")
+    for name in OPTIONAL:
+        print(f"  {name:>10}: {'loaded' if name in loaded else 'not loaded'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Throughput of reductions spread over processes, with and without limiting threads."""
+
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from polyshell import reduce_polygon, set_num_threads
+
+DATA = Path("../../tests/data")
+EPSILON = 1e-3
+TASKS = 8
+
+
+def init(num_threads: int | None):
+    set_num_threads(num_threads)
+
+
+def task(path: Path) -> int:
+    with open(path, "rb") as f:
+        poly = pickle.load(f)
+    return len(reduce_polygon(poly, "epsilon", EPSILON, "rdp"))
+
+
+def throughput(paths: list[Path], processes: int, num_threads: int | None) -> float:
+    """Polygons reduced per second by a pool of processes, each on the given threads."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        processes, mp_context=context, initializer=init, initargs=(num_threads,)
+    ) as executor:
+        # Start every worker before timing
+        list(executor.map(init, [num_threads] * processes))
+
+        start = time.perf_counter()
+        list(executor.map(task, paths * TASKS))
+        return len(paths) * TASKS / (time.perf_counter() - start)
+
+
+def main():
+    paths = sorted(DATA.glob("*/*.pkl"))
+    cpus = os.cpu_count() or 1
+
+    print(f"{len(paths) * TASKS} reductions on {cpus} cores")
+    for processes in sorted({1, max(cpus // 2, 1), cpus}):
+        for num_threads in dict.fromkeys((None, max(cpus // processes, 1), 1)):
+            rate = throughput(paths, processes, num_threads)
+            threads = "all" if num_threads is None else num_threads
+            print(
+                f"  {processes:>3} processes, {threads:>3} threads each: "
+                f"{rate:8.2f} polygons/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
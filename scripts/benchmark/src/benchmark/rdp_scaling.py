@@ -0,0 +1,97 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Growth of RDP reduction time with polygon size.
+
+Each of the large test polygons is reduced at decreasing tolerances, down to zero
+where recursion is deepest, and the exponent of time against size is fitted on a log-log
+scale. Running the script before and after a change to the engine shows any asymptotic
+change.
+
+Synthetic spirals of growing size are then reduced to zero tolerance. Their chains wind
+around the chords that span them, so the hull tree cannot prune its search and visits a
+hull for every block of vertices. They show the worst case of the farthest distance query.
+"""
+
+import math
+import pickle
+import timeit
+from pathlib import Path
+
+from polyshell import reduce_polygon
+from polyshell.synthetic import spiral
+
+DATA = Path(__file__).resolve().parents[4] / "tests" / "data"
+TOLERANCES = [1e-2, 1e-4, 0.0]
+SPIRAL_SIZES = [2**k for k in range(12, 19)]
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Least squares slope of log time against log size."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def time_reductions(polygons: list[tuple[str, any]], eps: float):
+    """Time RDP on each polygon, printing the fitted exponent of time against size."""
+    sizes, times = [], []
+    for name, poly in polygons:
+        elapsed = min(
+            timeit.repeat(
+                lambda: reduce_polygon(poly, "epsilon", eps, method="rdp"),
+                number=1,
+                repeat=5,
+            )
+        )
+        n = len(poly)
+        sizes.append(n)
+        times.append(elapsed)
+        per_vertex = 1e9 * elapsed / (n * math.log2(n))
+        print(
+            f"  {name:>16}: {n:>8} vertices, {1000 * elapsed:9.2f} ms, "
+            f"{per_vertex:7.2f} ns / (n log n)"
+        )
+    print(f"  fitted exponent: {fit_exponent(sizes, times):.2f}")
+
+
+def main():
+    polygons = []
+    for path in sorted(DATA.glob("*/*.pkl")):
+        with open(path, "rb") as f:
+            polygons.append((path.stem, pickle.load(f)))
+    polygons.sort(key=lambda item: len(item[1]))
+
+    for eps in TOLERANCES:
+        print(f"rdp, epsilon={eps}")
+        time_reductions(polygons, eps)
+
+    print("rdp, epsilon=0.0, spirals")
+    time_reductions([(f"spiral-{n}", spiral(n)) for n in SPIRAL_SIZES], 0.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Throughput of reduce_polygon across Python threads."""
+
+import os
+
+# Restrict the engine to a single core per call, so that any speed-up comes from Python threads
+os.environ.setdefault("RAYON_NUM_THREADS", "1")
+
+import pickle  # noqa: E402
+import time  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from polyshell import reduce_polygon  # noqa: E402
+
+DATA = Path("../../tests/data")
+
+
+def load_polygons(repeat: int) -> list[list[tuple[float, float]]]:
+    polygons = []
+    for path in sorted(DATA.glob("*/*.pkl")):
+        with open(path, "rb") as f:
+            polygons.append(pickle.load(f))
+    return polygons * repeat
+
+
+def throughput(polygons, method: str, eps: float, workers: int) -> float:
+    def runner(poly):
+        return reduce_polygon(poly, "epsilon", eps, method=method)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        list(pool.map(runner, polygons))
+        elapsed = time.perf_counter() - start
+
+    return len(polygons) / elapsed
+
+
+def main():
+    polygons = load_polygons(repeat=8)
+    max_workers = os.cpu_count() or 1
+    workers = [w for w in (1, 2, 4, 8, 16, 32, 64) if w <= max_workers]
+
+    for method, eps in [("vw", 1e-4), ("rdp", 1e-2), ("charshape", 1e-1)]:
+        print(f"{method}: {len(polygons)} polygons")
+        baseline = None
+        for w in workers:
+            rate = throughput(polygons, method, eps, w)
+            baseline = baseline or rate
+            print(f"  {w:>3} threads: {rate:8.2f} polygons/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
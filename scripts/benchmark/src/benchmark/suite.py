@@ -0,0 +1,305 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Benchmark suite across datasets, reduction ratios, methods, validation and threads.
+
+Every polygon in tests/data is reduced by each method, in both the epsilon and length
+modes, removing several proportions of its vertices. Each reduction is run on the
+polygon itself, which is validated on every call, and on a ValidatedPolygon, which
+reaches the unchecked engine functions. The size of the engine's thread pool is fixed
+when it first starts, so every thread count is run in a fresh worker process.
+
+Given sizes, synthetic polygons of each shape and size are reduced in place of the test
+data, to chart time and memory against the number of vertices.
+
+Wall time, peak resident memory and vertices per second are written as JSON. Given a
+baseline written by an earlier run, any case slowed by more than the tolerance is
+reported as a regression, and the script exits with a non-zero status.
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from polyshell import (
+    ReductionMode,
+    ValidatedPolygon,
+    __version__,
+    profile_polygon,
+    reduce_polygon,
+)
+from polyshell.synthetic import SHAPES, generate
+
+DATA = Path("../../tests/data")
+RATIOS = [0.5, 0.9, 0.99]
+METHODS = ["charshape", "rdp", "vw"]
+MODES = [ReductionMode.EPSILON, ReductionMode.LENGTH]
+THREADS = [1, 2, 4, 8, 16, 32]
+
+
+def reset_peak_rss():
+    """Reset the peak resident set size of this process, where the platform allows it.
+
+    Elsewhere the peak only ever grows, so is shared by every case run by a worker.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss() -> int:
+    """The peak resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return 1024 * int(line.split()[1])
+    except OSError:
+        pass
+
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else 1024 * rss
+
+
+def epsilon_for_ratio(poly, method: str, ratio: float) -> float:
+    """Choose the tolerance which removes the given proportion of vertices."""
+    tolerances = sorted(profile_polygon(poly, method).tolerances)
+    return tolerances[min(int(ratio * len(tolerances)), len(tolerances) - 1)]
+
+
+def run_case(polygon, mode: ReductionMode, value: float, method: str, repeat: int):
+    """Reduce a polygon repeatedly, returning the best time and the reduced length."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reduced = reduce_polygon(polygon, mode, value, method)
+        best = min(best, time.perf_counter() - start)
+    return best, len(reduced)
+
+
+def polygons(sizes: list[int], shapes: list[str]):
+    """Yield the name and coordinates of each polygon to benchmark.
+
+    These are the test data, or if sizes are given, synthetic polygons of each shape.
+    """
+    if not sizes:
+        for path in sorted(DATA.glob("*/*.pkl")):
+            with open(path, "rb") as f:
+                yield path.stem, pickle.load(f)
+
+    for shape in shapes:
+        for n in sizes:
+            yield shape, generate(shape, n)
+
+
+def worker(
+    threads: int, repeat: int, sizes: list[int], shapes: list[str]
+) -> list[dict]:
+    """Run every case on the current thread pool."""
+    results = []
+    for dataset, poly in polygons(sizes, shapes):
+        validated = ValidatedPolygon(poly)
+        n = len(poly)
+
+        for method in METHODS:
+            for ratio in RATIOS:
+                values = {
+                    ReductionMode.EPSILON: epsilon_for_ratio(poly, method, ratio),
+                    ReductionMode.LENGTH: max(4, round((1 - ratio) * n)),
+                }
+                for mode in MODES:
+                    for checked in [True, False]:
+                        polygon = poly if checked else validated
+
+                        reset_peak_rss()
+                        wall_time, reduced = run_case(
+                            polygon, mode, values[mode], method, repeat
+                        )
+                        results.append(
+                            {
+                                "dataset": dataset,
+                                "vertices": n,
+                                "method": method,
+                                "mode": mode.value,
+                                "ratio": ratio,
+                                "checked": checked,
+                                "threads": threads,
+                                "reduced": reduced,
+                                "wall_time": wall_time,
+                                "peak_rss": peak_rss(),
+                                "vertices_per_second": n / wall_time,
+                            }
+                        )
+    return results
+
+
+def spawn(threads: int, repeat: int, sizes: list[int], shapes: list[str]) -> list[dict]:
+    """Run every case in a worker process with a thread pool of the given size."""
+    env = {**os.environ, "RAYON_NUM_THREADS": str(threads)}
+    command = [sys.executable, "-m", "benchmark.suite", "--worker"]
+    command += ["--threads", str(threads), "--repeat", str(repeat)]
+    if sizes:
+        command += ["--sizes", *map(str, sizes), "--shapes", *shapes]
+    result = subprocess.run(
+        command, env=env, capture_output=True, check=True, text=True
+    )
+    return json.loads(result.stdout)
+
+
+def key(result: dict) -> tuple:
+    """The parameters identifying a case, shared between runs."""
+    fields = ["dataset", "vertices", "method", "mode", "ratio", "checked", "threads"]
+    return tuple(result[field] for field in fields)
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Describe every case slower than its baseline by more than the tolerance."""
+    previous = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get(key(result))
+        if base is None:
+            continue
+
+        slowdown = result["wall_time"] / base["wall_time"] - 1
+        if slowdown > tolerance:
+            dataset, n, method, mode, ratio, checked, threads = key(result)
+            regressions.append(
+                f"{dataset} ({n}) {method} {mode} {ratio:.0%} "
+                f"{'checked' if checked else 'unchecked'} {threads} threads: "
+                f"{1000 * base['wall_time']:.2f} ms -> "
+                f"{1000 * result['wall_time']:.2f} ms (+{slowdown:.0%})"
+            )
+    return regressions
+
+
+def plot(results: list[dict], path: Path):
+    """Plot time and peak memory against the number of vertices, for each method.
+
+    Cases are checked length reductions at 90%, on the largest thread pool.
+    """
+    # Imported here so as not to count towards the peak memory of workers
+    import matplotlib.pyplot as plt
+
+    threads = max(result["threads"] for result in results)
+    plotted = (ReductionMode.LENGTH.value, 0.9, True, threads)
+    fields = ("mode", "ratio", "checked", "threads")
+    cases = [
+        result
+        for result in results
+        if tuple(result[field] for field in fields) == plotted
+    ]
+
+    _, (time_ax, memory_ax) = plt.subplots(1, 2, figsize=(12, 5))
+    lines = sorted({(result["dataset"], result["method"]) for result in cases})
+    for dataset, method in lines:
+        line = sorted(
+            (result["vertices"], result["wall_time"], result["peak_rss"])
+            for result in cases
+            if result["dataset"] == dataset and result["method"] == method
+        )
+        n, wall_time, rss = zip(*line)
+        time_ax.plot(n, wall_time, "o-", label=f"{dataset} {method}")
+        memory_ax.plot(n, [r / 2**20 for r in rss], "o-", label=f"{dataset} {method}")
+
+    for ax, label in [(time_ax, "Wall time (s)"), (memory_ax, "Peak RSS (MiB)")]:
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Vertices")
+        ax.set_ylabel(label)
+    memory_ax.legend(fontsize="small")
+    plt.tight_layout()
+    plt.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    parser.add_argument("--baseline", type=Path, help="results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, nargs="+")
+    parser.add_argument(
+        "--sizes",
+        type=lambda n: int(float(n)),
+        nargs="+",
+        default=[],
+        help="reduce synthetic polygons of these sizes in place of the test data",
+    )
+    parser.add_argument(
+        "--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES)
+    )
+    parser.add_argument("--plot", type=Path, help="plot time and memory against size")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        results = worker(args.threads[0], args.repeat, args.sizes, args.shapes)
+        json.dump(results, sys.stdout)
+        return
+
+    cpus = os.cpu_count() or 1
+    threads = args.threads or [t for t in THREADS if t <= cpus]
+
+    results = []
+    for t in threads:
+        print(f"{t} threads", file=sys.stderr)
+        results += spawn(t, args.repeat, args.sizes, args.shapes)
+
+    report = {
+        "polyshell": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": cpus,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+    if args.plot is not None:
+        plot(results, args.plot)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
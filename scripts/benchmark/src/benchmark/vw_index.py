@@ -0,0 +1,69 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Static against live spatial indexing in Visvalingam-Whyatt."""
+
+import pickle
+import time
+from pathlib import Path
+
+from polyshell import profile_polygon
+from polyshell._polyshell import reduce_polygon_vw
+
+DATA = Path("../../tests/data")
+RATIOS = [0.5, 0.9, 0.99]
+
+
+def epsilon_for_ratio(poly, ratio: float) -> float:
+    """Choose the tolerance which removes the given proportion of vertices."""
+    tolerances = sorted(profile_polygon(poly, "vw").tolerances)
+    return tolerances[min(int(ratio * len(tolerances)), len(tolerances) - 1)]
+
+
+def timed(poly, eps: float, live_index: bool, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reduced = reduce_polygon_vw(poly, eps, 0, live_index=live_index)
+        best = min(best, time.perf_counter() - start)
+    return best, len(reduced)
+
+
+def main():
+    for path in sorted(DATA.glob("*/*.pkl")):
+        with open(path, "rb") as f:
+            poly = pickle.load(f)
+
+        print(f"{path.stem}: {len(poly)} vertices")
+        for ratio in RATIOS:
+            eps = epsilon_for_ratio(poly, ratio)
+            static, static_len = timed(poly, eps, live_index=False, repeat=5)
+            live, live_len = timed(poly, eps, live_index=True, repeat=5)
+            print(
+                f"  {ratio:>4.0%}: static {static * 1e3:8.2f} ms ({static_len}), "
+                f"live {live * 1e3:8.2f} ms ({live_len}), "
+                f"{static / live:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
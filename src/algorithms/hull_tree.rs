@@ -0,0 +1,375 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+use geo::{Coord, Distance, Euclidean, GeoFloat, Kernel, Line, Orientation};
+use rayon::prelude::*;
+use std::cmp::Ordering;
+use std::ops::Range;
+
+/// Number of consecutive vertices held by each leaf of the tree.
+const BLOCK: usize = 32;
+
+/// Convex hulls of the sub-chains of a ring, held in a segment tree.
+///
+/// A function which is convex in position, such as the distance to a line segment, is largest over
+/// a chain at a vertex of its convex hull. Any run of consecutive vertices is covered by the hulls
+/// of a logarithmic number of sub-chains, and the vertices of at most two partial blocks.
+///
+/// A hull lying across the chord, between the perpendiculars at its ends, gives its farthest
+/// distance by binary search. A hull overhanging either end only bounds it, and its children are
+/// searched if the bound beats the farthest distance found so far. Chains which wind around their
+/// chord, such as the arms of a spiral, overhang at every level, so in the worst case a query visits the hull of every block
+/// in the run: O(n / BLOCK) hulls, rather than O(log n). Even then, a query takes time linear in
+/// the length of the run, as a scan of its vertices would.
+pub struct HullTree<T: GeoFloat> {
+    coords: Vec<Coord<T>>,
+    /// Implicit binary tree with its root at index one, and the hull of block `i` at `width + i`
+    hulls: Vec<Hull<T>>,
+    width: usize,
+}
+
+/// A convex hull split into its lower and upper chains, each running from its leftmost to its
+/// rightmost vertex.
+#[derive(Clone, Debug, PartialEq)]
+struct Hull<T: GeoFloat> {
+    lower: Vec<Coord<T>>,
+    upper: Vec<Coord<T>>,
+}
+
+impl<T: GeoFloat> Default for Hull<T> {
+    fn default() -> Self {
+        Hull {
+            lower: Vec::new(),
+            upper: Vec::new(),
+        }
+    }
+}
+
+fn cmp_xy<T: GeoFloat>(a: &Coord<T>, b: &Coord<T>) -> Ordering {
+    a.x.partial_cmp(&b.x)
+        .unwrap()
+        .then(a.y.partial_cmp(&b.y).unwrap())
+}
+
+fn dot<T: GeoFloat>(a: Coord<T>, b: Coord<T>) -> T {
+    a.x * b.x + a.y * b.y
+}
+
+/// One chain of the convex hull of points sorted by x and then y, using Andrew's monotone chain.
+///
+/// The chain only turns in the given direction, dropping collinear points.
+fn monotone_chain<T: GeoFloat>(
+    points: impl IntoIterator<Item = Coord<T>>,
+    turn: Orientation,
+) -> Vec<Coord<T>> {
+    let turns = |chain: &[Coord<T>], p: Coord<T>| match chain {
+        [.., a, b] => T::Ker::orient2d(*a, *b, p) == turn,
+        _ => true,
+    };
+
+    let mut chain: Vec<Coord<T>> = Vec::new();
+    for p in points {
+        while !turns(&chain, p) {
+            chain.pop();
+        }
+        chain.push(p);
+    }
+    chain
+}
+
+/// Merge two runs of points sorted by x and then y.
+fn merge<T: GeoFloat>(a: &[Coord<T>], b: &[Coord<T>]) -> Vec<Coord<T>> {
+    let mut merged = Vec::with_capacity(a.len() + b.len());
+    let (mut i, mut j) = (0, 0);
+    while i < a.len() && j < b.len() {
+        if cmp_xy(&a[i], &b[j]) == Ordering::Greater {
+            merged.push(b[j]);
+            j += 1;
+        } else {
+            merged.push(a[i]);
+            i += 1;
+        }
+    }
+    merged.extend_from_slice(&a[i..]);
+    merged.extend_from_slice(&b[j..]);
+    merged
+}
+
+/// The vertex of a hull chain lying farthest in a direction.
+///
+/// Edge directions turn monotonically along a chain, through at most half a turn, so the
+/// projection of its vertices onto a direction either rises to a single peak, found by binary
+/// search, or is largest at an end.
+fn extreme_in<T: GeoFloat>(chain: &[Coord<T>], direction: Coord<T>) -> Coord<T> {
+    let (mut lo, mut hi) = (0, chain.len() - 1);
+    while lo < hi {
+        let mid = (lo + hi) / 2;
+        if dot(chain[mid + 1] - chain[mid], direction) > T::zero() {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    [chain[0], chain[lo], chain[chain.len() - 1]]
+        .into_iter()
+        .max_by(|&a, &b| dot(a, direction).partial_cmp(&dot(b, direction)).unwrap())
+        .unwrap()
+}
+
+fn farthest<T: GeoFloat>(coords: &[Coord<T>], line: &Line<T>) -> T {
+    coords.iter().fold(T::zero(), |farthest_distance, &coord| {
+        let distance = Euclidean.distance(coord, line);
+        if distance > farthest_distance {
+            distance
+        } else {
+            farthest_distance
+        }
+    })
+}
+
+impl<T: GeoFloat> Hull<T> {
+    /// Hull of a block of points.
+    fn new(mut points: Vec<Coord<T>>) -> Self {
+        points.sort_unstable_by(cmp_xy);
+        Hull {
+            lower: monotone_chain(points.iter().copied(), Orientation::CounterClockwise),
+            upper: monotone_chain(points, Orientation::Clockwise),
+        }
+    }
+
+    /// Hull of two hulls, merging their chains in linear time rather than sorting again.
+    ///
+    /// Vertices of the upper chain of either hull lie above its lower chain, so can never be on
+    /// the lower chain of the union, and vice versa.
+    fn union(&self, other: &Self) -> Self {
+        Hull {
+            lower: monotone_chain(
+                merge(&self.lower, &other.lower),
+                Orientation::CounterClockwise,
+            ),
+            upper: monotone_chain(merge(&self.upper, &other.upper), Orientation::Clockwise),
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        self.lower.is_empty()
+    }
+
+    /// The vertex lying farthest in a direction.
+    fn extreme(&self, direction: Coord<T>) -> Coord<T> {
+        let (lower, upper) = (
+            extreme_in(&self.lower, direction),
+            extreme_in(&self.upper, direction),
+        );
+        if dot(lower, direction) >= dot(upper, direction) {
+            lower
+        } else {
+            upper
+        }
+    }
+
+    fn farthest(&self, line: &Line<T>) -> T {
+        farthest(&self.lower, line).max(farthest(&self.upper, line))
+    }
+}
+
+impl<T: GeoFloat + Send + Sync> HullTree<T> {
+    /// Build the tree over the vertices of a ring, without the closing coordinate.
+    pub fn new(coords: Vec<Coord<T>>) -> Self {
+        let blocks = coords.len().div_ceil(BLOCK).max(1);
+        let width = blocks.next_power_of_two();
+
+        let mut hulls = vec![Hull::default(); 2 * width];
+        hulls[width..]
+            .par_iter_mut()
+            .zip(coords.par_chunks(BLOCK))
+            .for_each(|(hull, chunk)| *hull = Hull::new(chunk.to_vec()));
+
+        // Each level is built from the hulls of the level below
+        let mut level = width / 2;
+        while level > 0 {
+            let (upper, lower) = hulls.split_at_mut(2 * level);
+            let lower = &*lower;
+            upper[level..]
+                .par_iter_mut()
+                .enumerate()
+                .for_each(|(i, hull)| *hull = lower[2 * i].union(&lower[2 * i + 1]));
+            level /= 2;
+        }
+
+        HullTree {
+            coords,
+            hulls,
+            width,
+        }
+    }
+
+    /// The largest distance from the chord between two vertices to any vertex on the chain it
+    /// spans, from `from` up to but not including `to`, wrapping around the ring.
+    pub fn farthest_distance(&self, from: usize, to: usize) -> T {
+        let chord = Line::new(self.coords[from], self.coords[to]);
+        if from <= to {
+            self.farthest_in(&chord, from..to)
+        } else {
+            let tail = self.farthest_in(&chord, from..self.coords.len());
+            let head = self.farthest_in(&chord, 0..to);
+            tail.max(head)
+        }
+    }
+
+    fn farthest_in(&self, line: &Line<T>, range: Range<usize>) -> T {
+        // Blocks lying entirely within the range
+        let (first, last) = (range.start.div_ceil(BLOCK), range.end / BLOCK);
+        if first >= last {
+            return farthest(&self.coords[range], line);
+        }
+
+        let head = farthest(&self.coords[range.start..first * BLOCK], line);
+        let tail = farthest(&self.coords[last * BLOCK..range.end], line);
+        let mut farthest_distance = head.max(tail);
+
+        let (mut left, mut right) = (first + self.width, last + self.width);
+        while left < right {
+            if left & 1 == 1 {
+                farthest_distance = self.farthest_node(left, line, farthest_distance);
+                left += 1;
+            }
+            if right & 1 == 1 {
+                right -= 1;
+                farthest_distance = self.farthest_node(right, line, farthest_distance);
+            }
+            left /= 2;
+            right /= 2;
+        }
+
+        farthest_distance
+    }
+
+    /// The larger of `bound` and the farthest distance from a chord to the hull of a node.
+    ///
+    /// Where every vertex of the hull projects onto the chord, the farthest is one of the two
+    /// vertices extreme across it, found by binary search. Otherwise the extents of the hull along
+    /// and across the chord bound its distance, and the children are only searched when the bound
+    /// exceeds the farthest distance found so far. This descent is not bounded, and may reach
+    /// every leaf below the node.
+    fn farthest_node(&self, node: usize, line: &Line<T>, bound: T) -> T {
+        let hull = &self.hulls[node];
+        let along = line.delta();
+        let length_squared = dot(along, along);
+        if hull.is_empty() {
+            return bound;
+        }
+        // Leaves are small, and a chord of zero length has no direction to search in
+        if node >= self.width || length_squared == T::zero() {
+            return bound.max(hull.farthest(line));
+        }
+
+        let across = Coord {
+            x: -along.y,
+            y: along.x,
+        };
+        let [behind, ahead, below, above] =
+            [-along, along, -across, across].map(|direction| hull.extreme(direction));
+        let bound = bound
+            .max(Euclidean.distance(below, line))
+            .max(Euclidean.distance(above, line));
+
+        // Projections onto the chord and its normal, scaled by the length of the chord
+        let (start, end) = (
+            dot(behind - line.start, along),
+            dot(ahead - line.start, along),
+        );
+        if start >= T::zero() && end <= length_squared {
+            return bound;
+        }
+
+        let overhang = (-start).max(end - length_squared).max(T::zero());
+        let offset = dot(above - line.start, across).max(-dot(below - line.start, across));
+        if offset.hypot(overhang) / length_squared.sqrt() <= bound {
+            return bound;
+        }
+
+        let bound = self.farthest_node(2 * node, line, bound);
+        self.farthest_node(2 * node + 1, line, bound)
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use crate::algorithms::hull_tree::{Hull, HullTree};
+    use geo::{coord, Coord, Distance, Euclidean, Line};
+
+    /// Brute force farthest distance from the chord to the chain it spans.
+    fn farthest_chain(coords: &[Coord<f64>], from: usize, to: usize) -> f64 {
+        let chord = Line::new(coords[from], coords[to]);
+        let chain: Vec<usize> = if from <= to {
+            (from..to).collect()
+        } else {
+            (from..coords.len()).chain(0..to).collect()
+        };
+        chain
+            .into_iter()
+            .map(|i| Euclidean.distance(coords[i], &chord))
+            .fold(0.0, f64::max)
+    }
+
+    #[test]
+    fn farthest_test() {
+        // A zig-zag spanning several blocks, so that queries mix hulls and partial blocks
+        let coords = (0..200)
+            .map(|i| coord! { x: i as f64, y: ((i * 37) % 11) as f64 })
+            .collect::<Vec<_>>();
+        let tree = HullTree::new(coords.clone());
+
+        for (from, to) in [(0, 199), (5, 150), (40, 70), (3, 9), (150, 20), (199, 0)] {
+            let correct = farthest_chain(&coords, from, to);
+            assert!((tree.farthest_distance(from, to) - correct).abs() < 1e-12);
+        }
+    }
+
+    #[test]
+    fn spiral_test() {
+        // Chains of a spiral wrap around their chords, so hulls overhang both ends
+        let coords = (0..2000)
+            .map(|i| {
+                let t = i as f64 / 20.0;
+                coord! { x: t * t.cos(), y: t * t.sin() }
+            })
+            .collect::<Vec<_>>();
+        let tree = HullTree::new(coords.clone());
+
+        for (from, to) in [(0, 1999), (100, 1500), (1700, 300), (37, 1011), (64, 96)] {
+            let correct = farthest_chain(&coords, from, to);
+            assert!((tree.farthest_distance(from, to) - correct).abs() < 1e-9);
+        }
+    }
+
+    #[test]
+    fn union_test() {
+        let coords = (0..64)
+            .map(|i| coord! { x: ((i * 29) % 17) as f64, y: ((i * 13) % 23) as f64 })
+            .collect::<Vec<_>>();
+        let (left, right) = coords.split_at(32);
+
+        let union = Hull::new(left.to_vec()).union(&Hull::new(right.to_vec()));
+        assert_eq!(union, Hull::new(coords));
+    }
+}
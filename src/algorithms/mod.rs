@@ -19,6 +19,7 @@
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
 pub mod hull_melkman;
+pub mod hull_tree;
 pub mod simplify_charshape;
 pub mod simplify_rdp;
 pub mod simplify_vw;
@@ -18,13 +18,16 @@
 
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
-use crate::extensions::conversions::IntoCoord;
+use crate::extensions::conversions::{close_indices, gather, IntoCoord};
+use crate::extensions::profile::Profile;
+use crate::extensions::stats::{self, Counters, Phase};
 use crate::extensions::triangulate::Triangulate;
-use geo::{GeoFloat, Polygon};
-use spade::handles::DirectedEdgeHandle;
-use spade::{CdtEdge, Point2, SpadeNum, Triangulation};
+use geo::{Area, GeoFloat, LineString, Polygon, Triangle};
+use rayon::prelude::*;
+use spade::handles::{DirectedEdgeHandle, FixedVertexHandle};
+use spade::{CdtEdge, ConstrainedDelaunayTriangulation, Point2, SpadeNum, Triangulation};
 use std::cmp::Ordering;
-use std::collections::BinaryHeap;
+use std::collections::{BinaryHeap, HashSet};
 
 #[derive(Debug)]
 struct CharScore<'a, T>
@@ -56,22 +59,60 @@ impl<T: SpadeNum> PartialEq for CharScore<'_, T> {
     }
 }
 
-fn characteristic_shape<T>(orig: &Polygon<T>, eps: T, max_len: usize) -> Polygon<T>
+/// The position in the ring of each vertex on the boundary of the characteristic shape, closed by
+/// repeating the first.
+pub fn characteristic_indices<T>(
+    tri: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    eps: T,
+    len: usize,
+) -> Vec<usize>
 where
-    T: GeoFloat + SpadeNum,
+    T: GeoFloat + SpadeNum + Send + Sync,
 {
-    if orig.exterior().0.len() < 3 {
-        return orig.clone();
-    }
+    // One vertex of the length is taken by the closing coordinate, and a length of zero wraps
+    // round to no limit
+    let max_len = len.wrapping_sub(1);
 
-    let eps_2 = eps * eps;
+    // The boundary can never grow beyond every vertex, so the length is no limit
+    let indices = if max_len >= tri.num_vertices() {
+        characteristic_mask(tri, eps)
+            .into_iter()
+            .enumerate()
+            .filter_map(|(index, keep)| keep.then_some(index))
+            .collect()
+    } else {
+        // Extract boundary nodes
+        characteristic_tolerances(tri, eps, max_len)
+            .into_iter()
+            .enumerate()
+            .filter_map(|(index, (tolerance, _))| (tolerance > T::neg_infinity()).then_some(index))
+            .collect()
+    };
+    close_indices(indices)
+}
 
-    let tri = orig.triangulate();
+/// Grow a characteristic shape, returning the tolerance up to which each vertex is retained along
+/// with the length of the boundary when it was added.
+///
+/// A vertex joins the boundary at any tolerance no larger than the shortest edge popped up to and
+/// including its addition. Convex hull vertices are given an infinite tolerance, and vertices
+/// which never join the boundary a tolerance of negative infinity.
+fn characteristic_tolerances<T>(
+    tri: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    eps: T,
+    max_len: usize,
+) -> Vec<(T, usize)>
+where
+    T: GeoFloat + SpadeNum,
+{
+    let _span = stats::span(Phase::Reduction);
+    let mut counters = Counters::default();
+    let eps_2 = eps * eps;
 
-    let mut boundary_mask = vec![false; tri.num_vertices()];
+    let mut tolerances = vec![(T::neg_infinity(), 0); tri.num_vertices()];
     let mut len = 0;
     tri.convex_hull().for_each(|edge| {
-        boundary_mask[edge.from().index()] = true;
+        tolerances[edge.from().index()] = (T::infinity(), 0);
         len += 1;
     });
 
@@ -83,12 +124,19 @@ where
             edge: line,
         })
         .collect::<BinaryHeap<_>>();
+    counters.heap_pushes = pq.len() as u64;
+
+    // Smallest score popped so far
+    let mut threshold = T::infinity();
 
     while let Some(largest) = pq.pop() {
+        counters.heap_pops += 1;
         if largest.score < eps_2 || len >= max_len {
             break;
         }
 
+        threshold = threshold.min(largest.score);
+
         // Regularity check
         if largest.edge.is_constraint_edge() {
             continue;
@@ -96,25 +144,180 @@ where
 
         // Update boundary nodes and edges
         let coprime_node = largest.edge.opposite_vertex().unwrap();
-        boundary_mask[coprime_node.index()] = true;
+        if tolerances[coprime_node.index()].0 == T::neg_infinity() {
+            tolerances[coprime_node.index()] = (threshold.sqrt(), len);
+        }
         len += 1;
 
-        recompute_boundary(largest.edge, &mut pq);
+        counters.heap_pushes += recompute_boundary(largest.edge, &mut pq);
     }
 
+    counters.record();
+    tolerances
+}
+
+/// Grow a characteristic shape with no limit on its length, returning whether each vertex is on
+/// the boundary.
+///
+/// Without a length limit, the boundary reaches every vertex which can be reached from the
+/// convex hull by crossing edges no shorter than `eps`, whatever order edges are popped in. The
+/// pockets between each convex hull edge and the ring are closed off from one another by the
+/// ring, so are eroded concurrently.
+fn characteristic_mask<T>(tri: &ConstrainedDelaunayTriangulation<Point2<T>>, eps: T) -> Vec<bool>
+where
+    T: GeoFloat + SpadeNum + Send + Sync,
+{
+    let _span = stats::span(Phase::Reduction);
+    let eps_2 = eps * eps;
+
+    let hull = tri.convex_hull().map(|edge| edge.fix()).collect::<Vec<_>>();
+    let pockets = hull
+        .par_iter()
+        .map(|&edge| {
+            let mut boundary = Vec::new();
+            let mut stack = vec![tri.directed_edge(edge).rev()];
+            while let Some(edge) = stack.pop() {
+                // Regularity check
+                if edge.length_2() < eps_2 || edge.is_constraint_edge() {
+                    continue;
+                }
+
+                boundary.push(edge.opposite_vertex().unwrap().fix());
+                stack.extend([edge.prev().rev(), edge.next().rev()]);
+            }
+            boundary
+        })
+        .collect::<Vec<_>>();
+
+    let mut mask = vec![false; tri.num_vertices()];
+    for &edge in &hull {
+        mask[tri.directed_edge(edge).from().index()] = true;
+    }
+    for v in pockets.into_iter().flatten() {
+        mask[v.index()] = true;
+    }
+    mask
+}
+
+/// Build the error profile of a polygon exterior from its triangulation.
+///
+/// Vertices added earlier are more significant, so are ranked by the length of the boundary when
+/// added.
+pub fn charshape_profile<T>(tri: &ConstrainedDelaunayTriangulation<Point2<T>>) -> Profile<T>
+where
+    T: GeoFloat + SpadeNum,
+{
+    let coords = tri.vertices().map(|v| v.position().into_coord()).collect();
+    let (tolerances, steps) = characteristic_tolerances(tri, T::zero(), usize::MAX)
+        .into_iter()
+        .unzip();
+    Profile::new(coords, tolerances, steps)
+}
+
+/// Grow a characteristic shape outwards from inside a counter-clockwise ring.
+///
+/// The result is contained by the original ring, which is what is required of a reduced hole.
+fn characteristic_shape_inward<T>(ring: &LineString<T>, eps: T) -> LineString<T>
+where
+    T: GeoFloat + SpadeNum,
+{
+    let polygon = Polygon::new(ring.clone(), vec![]);
+
+    // A triangle cannot be reduced any further
+    if polygon.exterior().0.len() < 5 {
+        return polygon.exterior().clone();
+    }
+
+    let eps_2 = eps * eps;
+
+    let tri = polygon.triangulate();
+    let _span = stats::span(Phase::Reduction);
+    let mut counters = Counters::default();
+
+    // Seed the shape with the largest triangle inside the ring
+    let seed = {
+        let [first, second] = [0, 1].map(FixedVertexHandle::from_index);
+        let first = tri.get_edge_from_neighbors(first, second).unwrap();
+
+        let mut visited = HashSet::from([first.face().index()]);
+        let mut stack = vec![first];
+        let mut seed = (first, T::zero());
+
+        while let Some(edge) = stack.pop() {
+            let area = face_area(edge);
+            if area > seed.1 {
+                seed = (edge, area);
+            }
+
+            for next in [edge.prev(), edge.next()] {
+                if !next.is_constraint_edge() && visited.insert(next.rev().face().index()) {
+                    stack.push(next.rev());
+                }
+            }
+        }
+        seed.0
+    };
+
+    let mut boundary_mask = vec![false; tri.num_vertices()];
+    for v in [seed.from(), seed.to(), seed.opposite_vertex().unwrap()] {
+        boundary_mask[v.index()] = true;
+    }
+
+    let mut pq = [seed, seed.next(), seed.prev()]
+        .into_iter()
+        .map(|edge| edge.rev())
+        .map(|line| CharScore {
+            score: line.length_2(),
+            edge: line,
+        })
+        .collect::<BinaryHeap<_>>();
+    counters.heap_pushes = pq.len() as u64;
+
+    while let Some(largest) = pq.pop() {
+        counters.heap_pops += 1;
+        if largest.score < eps_2 {
+            break;
+        }
+
+        // Regularity check
+        if largest.edge.is_constraint_edge() {
+            continue;
+        }
+        let coprime_node = largest.edge.opposite_vertex().unwrap();
+        if boundary_mask[coprime_node.index()] {
+            counters.stale_skipped += 1;
+            continue;
+        }
+
+        // Update boundary nodes and edges
+        boundary_mask[coprime_node.index()] = true;
+
+        counters.heap_pushes += recompute_boundary(largest.edge, &mut pq);
+    }
+    counters.record();
+
     // Extract boundary nodes
-    let exterior = tri
-        .vertices()
+    tri.vertices()
         .zip(boundary_mask)
         .filter_map(|(v, keep)| keep.then_some(v.position().into_coord()))
-        .collect();
-    Polygon::new(exterior, vec![])
+        .collect()
+}
+
+fn face_area<T>(edge: DirectedEdgeHandle<'_, Point2<T>, (), CdtEdge<()>, ()>) -> T
+where
+    T: GeoFloat + SpadeNum,
+{
+    let [a, b, c] = [edge.from(), edge.to(), edge.opposite_vertex().unwrap()]
+        .map(|v| v.position().into_coord());
+    Triangle::new(a, b, c).unsigned_area()
 }
 
+/// Push the edges uncovered by adding the triangle beyond an edge, returning the number pushed.
 fn recompute_boundary<'a, T>(
     edge: DirectedEdgeHandle<'a, Point2<T>, (), CdtEdge<()>, ()>,
     pq: &mut BinaryHeap<CharScore<'a, T>>,
-) where
+) -> u64
+where
     T: GeoFloat + SpadeNum,
 {
     let choices = [edge.prev(), edge.next()];
@@ -125,6 +328,7 @@ fn recompute_boundary<'a, T>(
         };
         pq.push(e);
     }
+    choices.len() as u64
 }
 
 pub trait SimplifyCharshape<T, Epsilon = T> {
@@ -133,9 +337,68 @@ pub trait SimplifyCharshape<T, Epsilon = T> {
 
 impl<T> SimplifyCharshape<T> for Polygon<T>
 where
-    T: GeoFloat + SpadeNum,
+    T: GeoFloat + SpadeNum + Send + Sync,
 {
+    /// Interior rings must be wound counter-clockwise, and are reduced inwards.
     fn simplify_charshape(&self, eps: T, len: usize) -> Self {
-        characteristic_shape(self, eps, len - 1)
+        if self.exterior().0.len() < 3 {
+            return self.clone();
+        }
+
+        simplify_charshape_triangulated(self, &self.triangulate(), eps, len)
+    }
+}
+
+/// Reduce a polygon using an existing triangulation of its exterior.
+pub fn simplify_charshape_triangulated<T>(
+    polygon: &Polygon<T>,
+    tri: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    eps: T,
+    len: usize,
+) -> Polygon<T>
+where
+    T: GeoFloat + SpadeNum + Send + Sync,
+{
+    let exterior = gather(
+        &polygon.exterior().0,
+        &characteristic_indices(tri, eps, len),
+    );
+    let interiors = polygon
+        .interiors()
+        .par_iter()
+        .map(|ls| characteristic_shape_inward(ls, eps))
+        .collect();
+    Polygon::new(exterior, interiors)
+}
+
+#[cfg(test)]
+mod test {
+    use crate::algorithms::simplify_charshape::{characteristic_mask, characteristic_tolerances};
+    use crate::extensions::triangulate::Triangulate;
+    use geo::polygon;
+
+    #[test]
+    fn mask_test() {
+        let poly = polygon![
+            (x: 0.0, y: 0.0),
+            (x: 0.0, y: 4.0),
+            (x: 1.0, y: 1.0),
+            (x: 2.0, y: 4.0),
+            (x: 2.5, y: 2.0),
+            (x: 3.0, y: 4.0),
+            (x: 4.0, y: 0.5),
+            (x: 5.0, y: 4.0),
+            (x: 5.0, y: 0.0),
+            (x: 3.0, y: 0.2),
+        ];
+        let tri = poly.triangulate();
+
+        for eps in [0.0, 0.5, 1.0, 2.0, 3.0, 10.0] {
+            let serial = characteristic_tolerances(&tri, eps, usize::MAX)
+                .into_iter()
+                .map(|(tolerance, _)| tolerance > f64::NEG_INFINITY)
+                .collect::<Vec<_>>();
+            assert_eq!(characteristic_mask(&tri, eps), serial);
+        }
     }
 }
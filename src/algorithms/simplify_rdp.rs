@@ -18,13 +18,18 @@
 
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
-use crate::algorithms::visibility::visibility_intersection;
-use crate::extensions::conversions::IntoCoord;
-use crate::extensions::segments::FromSegments;
+use crate::algorithms::hull_tree::HullTree;
+use crate::algorithms::visibility::farthest_visible;
+use crate::extensions::conversions::{close_indices, gather, IntoCoord};
+use crate::extensions::profile::Profile;
+use crate::extensions::stats::{self, Counters, Phase};
 use crate::extensions::triangulate::Triangulate;
-use geo::{Distance, Euclidean, GeoFloat, Line, LineString, Polygon};
+use geo::{GeoFloat, Line, LineString, Polygon};
+use rayon::prelude::*;
 use spade::handles::{FixedVertexHandle, VertexHandle};
 use spade::{CdtEdge, ConstrainedDelaunayTriangulation, Point2, SpadeNum, Triangulation};
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
 
 struct CircularIterator<'a, T: SpadeNum> {
     current: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
@@ -66,17 +71,24 @@ impl<'a, T: SpadeNum> Iterator for CircularIterator<'a, T> {
     }
 }
 
+/// Recursively reduce the chain between `from` and `to`, which is split at the given depth,
+/// returning the position in the ring of each retained vertex.
 fn rdp_preserve<T>(
     from: VertexHandle<'_, Point2<T>, (), CdtEdge<()>>,
     to: VertexHandle<'_, Point2<T>, (), CdtEdge<()>>,
     cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
     eps: T,
-) -> Vec<Point2<T>>
+    depth: usize,
+) -> Vec<usize>
 where
     T: SpadeNum + GeoFloat + Send + Sync,
 {
-    if cdt.exists_constraint(from.fix(), to.fix()) {
-        return vec![from.position(), to.position()];
+    if cdt.exists_constraint(from.fix(), to.fix())
+        || hulls.farthest_distance(from.index(), to.index()) <= eps
+    {
+        stats::record_depth(depth);
+        return vec![from.index(), to.index()];
     }
 
     let chord = {
@@ -84,73 +96,345 @@ where
         Line::new(from, to)
     };
 
-    let farthest_distance =
-        CircularIterator::new(from, to, cdt).fold(T::zero(), |farthest_distance, v| {
-            let distance = Euclidean.distance(v.position().into_coord(), &chord);
-            if distance > farthest_distance {
-                distance
-            } else {
-                farthest_distance
-            }
-        });
-
-    if farthest_distance <= eps {
-        return vec![from.position(), to.position()];
+    let split_vertex = split_vertex(from, to, cdt, &chord);
+
+    let (mut left, right) = rayon::join(
+        || rdp_preserve(from, split_vertex, cdt, hulls, eps, depth + 1),
+        || rdp_preserve(split_vertex, to, cdt, hulls, eps, depth + 1),
+    );
+
+    left.pop();
+    left.extend_from_slice(&right);
+
+    left
+}
+
+/// Run the RDP algorithm to completion, returning the tolerance at which each vertex strictly
+/// between `from` and `to` is removed, along with the depth at which it is split.
+///
+/// A vertex is retained while the farthest distance of every chain split on the way to it exceeds
+/// the tolerance, so its tolerance is the smallest of these distances.
+fn rdp_tolerances<'a, T>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+    bound: T,
+    depth: usize,
+) -> Vec<(VertexHandle<'a, Point2<T>, (), CdtEdge<()>>, T, usize)>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    if cdt.exists_constraint(from.fix(), to.fix()) {
+        stats::record_depth(depth);
+        return vec![];
+    }
+
+    let farthest_distance = hulls.farthest_distance(from.index(), to.index());
+    if farthest_distance <= T::zero() {
+        stats::record_depth(depth);
+        // Collinear vertices are removed at any tolerance
+        return CircularIterator::new(from, to, cdt)
+            .skip(1)
+            .map(|v| (v, T::zero(), depth))
+            .collect();
     }
 
-    let (split_vertex, _) = visibility_intersection(from, to, cdt).into_iter().fold(
-        (from, -T::one()), // Placeholder, should always be overwritten
-        |(farthest_vertex, farthest_distance), v| {
-            let distance = Euclidean.distance(v.position().into_coord(), &chord);
-            if distance > farthest_distance {
-                (v, distance)
-            } else {
-                (farthest_vertex, farthest_distance)
-            }
-        },
+    let chord = {
+        let [from, to] = [from, to].map(|v| v.position().into_coord());
+        Line::new(from, to)
+    };
+
+    let split_vertex = split_vertex(from, to, cdt, &chord);
+    let bound = bound.min(farthest_distance);
+
+    let (mut left, right) = rayon::join(
+        || rdp_tolerances(from, split_vertex, cdt, hulls, bound, depth + 1),
+        || rdp_tolerances(split_vertex, to, cdt, hulls, bound, depth + 1),
     );
 
+    left.push((split_vertex, bound, depth));
+    left.extend_from_slice(&right);
+
+    left
+}
+
+/// Build the tree of sub-chain hulls over the vertices of a triangulated ring.
+pub fn hull_tree<T>(cdt: &ConstrainedDelaunayTriangulation<Point2<T>>) -> HullTree<T>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    let _span = stats::span(Phase::Reduction);
+    HullTree::new(cdt.vertices().map(|v| v.position().into_coord()).collect())
+}
+
+/// The vertex farthest from a chord which is visible from both of its endpoints.
+fn split_vertex<'a, T>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+    chord: &Line<T>,
+) -> VertexHandle<'a, Point2<T>, (), CdtEdge<()>>
+where
+    T: SpadeNum + GeoFloat,
+{
     // This should never occur
-    if split_vertex == from || split_vertex == to {
-        panic!("Attempted to split at endpoint");
+    farthest_visible(from, to, cdt, chord).expect("Attempted to split at endpoint")
+}
+
+/// A chain of the ring spanned by a chord, scored by its farthest distance from the chord.
+struct RDPScore<'a, T>
+where
+    T: SpadeNum,
+{
+    score: T,
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+}
+
+// These impls give us a max-heap
+impl<T: SpadeNum> Ord for RDPScore<'_, T> {
+    fn cmp(&self, other: &RDPScore<T>) -> Ordering {
+        self.score.partial_cmp(&other.score).unwrap()
     }
+}
+
+impl<T: SpadeNum> PartialOrd for RDPScore<'_, T> {
+    fn partial_cmp(&self, other: &RDPScore<T>) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl<T: SpadeNum> Eq for RDPScore<'_, T> {}
+
+impl<T: SpadeNum> PartialEq for RDPScore<'_, T> {
+    fn eq(&self, other: &RDPScore<T>) -> bool {
+        self.score == other.score
+    }
+}
+
+/// Score the chain spanned by a chord, or `None` if it is a single edge.
+fn score_chain<'a, T>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+) -> Option<RDPScore<'a, T>>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    if cdt.exists_constraint(from.fix(), to.fix()) {
+        return None;
+    }
+
+    Some(RDPScore {
+        score: hulls.farthest_distance(from.index(), to.index()),
+        from,
+        to,
+    })
+}
+
+/// RDP refined globally, always splitting the chain farthest from its chord next.
+///
+/// Splitting stops once every chain is within `eps` of its chord, which gives the same result as
+/// the recursive algorithm, or once the ring has `max_len` vertices.
+fn rdp_preserve_len<T>(
+    cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+    eps: T,
+    max_len: usize,
+) -> Vec<usize>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    let _span = stats::span(Phase::Reduction);
+    let mut counters = Counters::default();
+
+    // Convex hull vertices are never removed
+    let mut keep = vec![false; cdt.num_vertices()];
+    let mut len = 0;
+    let mut pq = BinaryHeap::new();
+    for edge in cdt.convex_hull() {
+        keep[edge.from().index()] = true;
+        len += 1;
+        pq.extend(score_chain(edge.from(), edge.to(), cdt, hulls));
+    }
+    counters.heap_pushes = pq.len() as u64;
+
+    while let Some(largest) = pq.pop() {
+        counters.heap_pops += 1;
+        if largest.score <= eps || len >= max_len {
+            break;
+        }
+
+        let chord = {
+            let [from, to] = [largest.from, largest.to].map(|v| v.position().into_coord());
+            Line::new(from, to)
+        };
+        let split_vertex = split_vertex(largest.from, largest.to, cdt, &chord);
+        keep[split_vertex.index()] = true;
+        len += 1;
+
+        let (left, right) = rayon::join(
+            || score_chain(largest.from, split_vertex, cdt, hulls),
+            || score_chain(split_vertex, largest.to, cdt, hulls),
+        );
+        for chain in left.into_iter().chain(right) {
+            pq.push(chain);
+            counters.heap_pushes += 1;
+        }
+    }
+    counters.record();
+
+    // Extract retained vertices in ring order, starting from the convex hull
+    let start = cdt
+        .convex_hull()
+        .next()
+        .map_or(0, |edge| edge.from().index());
+    let indices = (start..cdt.num_vertices())
+        .chain(0..start)
+        .filter(|&index| keep[index])
+        .collect();
+    close_indices(indices)
+}
+
+/// Reduce a counter-clockwise ring inwards, such that the result is contained by the original.
+///
+/// The triangle to the left of the first edge lies inside the ring, and at least one of its other
+/// edges is a diagonal. Splitting the ring along this diagonal gives two chains, each of which is
+/// reduced towards the diagonal inside the ring.
+fn rdp_inward<T>(ring: &LineString<T>, eps: T) -> LineString<T>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    let polygon = Polygon::new(ring.clone(), vec![]);
+
+    // A triangle cannot be reduced any further
+    if polygon.exterior().0.len() < 5 {
+        return polygon.exterior().clone();
+    }
+
+    let cdt = polygon.triangulate();
+    let hulls = hull_tree(&cdt);
+    let _span = stats::span(Phase::Reduction);
+    let apex = {
+        let [first, second] = [0, 1].map(FixedVertexHandle::from_index);
+        let edge = cdt.get_edge_from_neighbors(first, second).unwrap();
+        edge.opposite_vertex().unwrap()
+    };
+    let from = {
+        // The edge (n - 1, 0) is part of the ring, in which case split along (1, n - 1) instead
+        let index = usize::from(apex.index() == cdt.num_vertices() - 1);
+        cdt.get_vertex(FixedVertexHandle::from_index(index))
+            .unwrap()
+    };
 
     let (mut left, right) = rayon::join(
-        || rdp_preserve(from, split_vertex, cdt, eps),
-        || rdp_preserve(split_vertex, to, cdt, eps),
+        || rdp_preserve(from, apex, &cdt, &hulls, eps, 1),
+        || rdp_preserve(apex, from, &cdt, &hulls, eps, 1),
     );
 
     left.pop();
     left.extend_from_slice(&right);
 
-    left
+    gather(&polygon.exterior().0, &left)
 }
 
 pub trait SimplifyRDP<T, Epsilon = T> {
-    fn simplify_rdp(&self, eps: Epsilon) -> Self;
+    /// Reduce to the given tolerance, or to at most `len` coordinates if `len` is non-zero.
+    fn simplify_rdp(&self, eps: Epsilon, len: usize) -> Self;
 }
 
 impl<T> SimplifyRDP<T> for Polygon<T>
 where
     T: SpadeNum + GeoFloat + Send + Sync,
 {
-    fn simplify_rdp(&self, eps: T) -> Self {
+    /// Interior rings must be wound counter-clockwise, and are reduced inwards.
+    fn simplify_rdp(&self, eps: T, len: usize) -> Self {
         if self.exterior().0.len() < 3 {
             return self.clone();
         }
 
         let cdt = self.triangulate();
+        simplify_rdp_triangulated(self, &cdt, &hull_tree(&cdt), eps, len)
+    }
+}
 
-        let segments = cdt
-            .convex_hull()
-            .map(|edge| {
-                rdp_preserve(edge.from(), edge.to(), &cdt, eps)
-                    .into_iter()
-                    .map(|point| point.into_coord())
-                    .collect::<LineString<_>>()
-            })
-            .collect();
+/// Build the error profile of a polygon exterior from its triangulation.
+///
+/// Vertices split earlier are more significant, so are ranked by the depth of their split.
+pub fn rdp_profile<T>(
+    cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+) -> Profile<T>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    let _span = stats::span(Phase::Reduction);
 
-        Polygon::from_segments(segments)
+    // Convex hull vertices are never removed
+    let mut tolerances = vec![T::infinity(); cdt.num_vertices()];
+    let mut steps = vec![0; cdt.num_vertices()];
+
+    for edge in cdt.convex_hull() {
+        let chain = rdp_tolerances(edge.from(), edge.to(), cdt, hulls, T::infinity(), 1);
+        for (v, tolerance, depth) in chain {
+            tolerances[v.index()] = tolerance;
+            steps[v.index()] = depth;
+        }
     }
+
+    let coords = cdt.vertices().map(|v| v.position().into_coord()).collect();
+    Profile::new(coords, tolerances, steps)
+}
+
+/// Reduce the exterior of a polygon from its triangulation, and the tree of sub-chain hulls built
+/// over it, returning the position in the ring of each retained vertex.
+pub fn rdp_indices<T>(
+    cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+    eps: T,
+    len: usize,
+) -> Vec<usize>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    if len > 0 {
+        // To reduce to a fixed length the chains must be refined in a single global order
+        return rdp_preserve_len(cdt, hulls, eps, len - 1);
+    }
+
+    // If a fixed length is not desired, chains can be refined independently in parallel, and
+    // joined at the convex hull vertex they share
+    let _span = stats::span(Phase::Reduction);
+    cdt.convex_hull()
+        .map(|edge| rdp_preserve(edge.from(), edge.to(), cdt, hulls, eps, 1))
+        .reduce(|mut indices, chain| {
+            indices.extend(chain.into_iter().skip(1));
+            indices
+        })
+        .unwrap_or_default()
+}
+
+/// Reduce a polygon using an existing triangulation of its exterior, and the tree of sub-chain
+/// hulls built over it.
+pub fn simplify_rdp_triangulated<T>(
+    polygon: &Polygon<T>,
+    cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
+    hulls: &HullTree<T>,
+    eps: T,
+    len: usize,
+) -> Polygon<T>
+where
+    T: SpadeNum + GeoFloat + Send + Sync,
+{
+    let exterior = gather(&polygon.exterior().0, &rdp_indices(cdt, hulls, eps, len));
+
+    let interiors = polygon
+        .interiors()
+        .par_iter()
+        .map(|ls| rdp_inward(ls, eps))
+        .collect();
+
+    Polygon::new(exterior, interiors)
 }
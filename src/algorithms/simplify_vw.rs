@@ -29,10 +29,23 @@ use rayon::prelude::*;
 use rstar::primitives::CachedEnvelope;
 use rstar::{RTree, RTreeNum, RTreeObject};
 
-use crate::extensions::segments::{FromSegments, HullSegments};
+use crate::extensions::conversions::gather;
+use crate::extensions::profile::Profile;
+use crate::extensions::segments::HullSegments;
+use crate::extensions::stats::{self, Counters, Phase};
 use std::cmp::Ordering;
 use std::collections::BinaryHeap;
 
+/// Spatial index of the segments against which new chords are checked for self-intersection.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum SegmentIndex {
+    /// Bulk load the original segments once, and never update them.
+    #[default]
+    Static,
+    /// Remove the segments consumed by each removal, and insert the chord which replaces them.
+    Live,
+}
+
 /// Store triangle information. Score is used for ranking the priority queue which determines
 /// removal order.
 #[derive(Debug)]
@@ -67,19 +80,54 @@ impl<T: CoordFloat> PartialEq for VWScore<T> {
 /// Area and topology preserving Visvalingam-Whyatt algorithm
 /// adapted from the [geo implementation](https://github.com/georust/geo/blob/e8419735b5986f120ddf1de65ac68c1779c3df30/geo/src/algorithm/simplify_vw.rs)
 ///
+/// Returns the position in the line of each retained point.
+fn visvalingam_preserve<T>(
+    orig: &LineString<T>,
+    eps: T,
+    min_len: usize,
+    index: SegmentIndex,
+) -> Vec<usize>
+where
+    T: GeoFloat + RTreeNum,
+{
+    // Retained points are never assigned a tolerance
+    visvalingam_tolerances(orig, eps, min_len, index)
+        .into_iter()
+        .enumerate()
+        .filter_map(|(i, (tolerance, _))| tolerance.is_infinite().then_some(i))
+        .collect()
+}
+
+/// Run the Visvalingam-Whyatt algorithm, returning the tolerance at which each point is removed
+/// along with the length of the line at that point.
+///
+/// A point is removed at any tolerance no smaller than the largest score popped up to and including
+/// its removal. Points which are retained are given an infinite tolerance.
 ///
-fn visvalingam_preserve<T>(orig: &LineString<T>, eps: T, min_len: usize) -> Vec<Coord<T>>
+/// A static index is never updated. Self-intersection can never occur with stale segments, and if
+/// a segment were to intersect with a new segment, then it also intersects with a stale segment,
+/// so the check is conservative. A live index holds only the current segments, so that queries
+/// no longer visit stale candidates, and removals are never refused on their account.
+fn visvalingam_tolerances<T>(
+    orig: &LineString<T>,
+    eps: T,
+    min_len: usize,
+    index: SegmentIndex,
+) -> Vec<(T, usize)>
 where
     T: GeoFloat + RTreeNum,
 {
     let max = orig.0.len();
+    let mut tolerances = vec![(T::infinity(), 0); max];
     if max < 2 || max <= min_len || eps <= T::zero() {
-        return orig.0.to_vec();
+        return tolerances;
     }
 
+    let _span = stats::span(Phase::Reduction);
+    let mut counters = Counters::default();
     let mut len = orig.0.len();
 
-    let tree: RTree<CachedEnvelope<_>> =
+    let mut tree: RTree<CachedEnvelope<_>> =
         RTree::bulk_load(orig.lines().map(CachedEnvelope::new).collect::<Vec<_>>());
 
     // Point adjacency. Tuple at index contains indices into `orig`. Negative values or values
@@ -110,9 +158,14 @@ where
         })
         .filter(|point| point.score >= T::zero())
         .collect::<BinaryHeap<VWScore<T>>>();
+    counters.heap_pushes = pq.len() as u64;
+
+    // Largest score popped so far
+    let mut threshold = T::zero();
 
     // Iterate over points while there is an associated triangle with area between 0 and epsilon
     while let Some(smallest) = pq.pop() {
+        counters.heap_pops += 1;
         if smallest.score > eps {
             // Min-heap guarantees all future points have areas greater than epsilon
             break;
@@ -123,14 +176,17 @@ where
             break;
         }
 
+        threshold = threshold.max(smallest.score);
+
         let (left, right) = adjacent[smallest.current];
         // A point in this triangle has been removed since this `VScore` was created, so skip it
         if left != smallest.left as i32 || right != smallest.right as i32 {
+            counters.stale_skipped += 1;
             continue;
         }
 
         // Removal of this point would cause self-intersection, so skip it
-        if tree_intersect(&tree, &smallest, &orig.0) {
+        if tree_intersect(&tree, &smallest, &orig.0, &mut counters) {
             continue;
         }
 
@@ -140,33 +196,35 @@ where
         adjacent[right as usize] = (left, rr);
         // Remove the point from the adjacency list
         adjacent[smallest.current] = (0, 0);
+        tolerances[smallest.current] = (threshold, len);
         // Update the length of the linestring
         len -= 1;
-        // The rtree is never updated as self-intersection can never occur with stale segments and
-        // if a segment were to intersect with a new segment, then it also intersects with a stale
-        // segment
+
+        if index == SegmentIndex::Live {
+            let [a, b, c] = [smallest.left, smallest.current, smallest.right].map(|i| orig.0[i]);
+            tree.remove(&CachedEnvelope::new(Line::new(a, b)));
+            tree.remove(&CachedEnvelope::new(Line::new(b, c)));
+            tree.insert(CachedEnvelope::new(Line::new(a, c)));
+        }
 
         // Recompute the areas of adjacent triangles(s) using left and right adjacent points,
         // this may add new triangles to the heap
-        recompute_triangles(orig, &mut pq, ll, left, right, rr, max);
+        counters.heap_pushes += recompute_triangles(orig, &mut pq, ll, left, right, rr, max);
     }
 
-    // Filter out deleted points, returning remaining points
-    orig.0
-        .iter()
-        .zip(adjacent.iter())
-        .filter_map(|(tup, adj)| if *adj != (0, 0) { Some(*tup) } else { None })
-        .collect()
+    counters.record();
+    tolerances
 }
 
 /// Check whether the removal of a candidate point would cause a self-intersection.
 ///
 /// To do this efficiently, and rtree is queried for any existing line segments which fall within
-/// the bounding box of the new line segment created.
+/// the bounding box of the new line segment created. Each candidate tested is counted.
 fn tree_intersect<T>(
     tree: &RTree<CachedEnvelope<Line<T>>>,
     triangle: &VWScore<T>,
     orig: &[Coord<T>],
+    counters: &mut Counters,
 ) -> bool
 where
     T: GeoFloat + RTreeNum,
@@ -183,6 +241,7 @@ where
 
     tree.locate_in_envelope_intersecting(&bounding_rect)
         .any(|candidate| {
+            counters.intersection_candidates += 1;
             let (candidate_start, candidate_end) = candidate.points();
             candidate_start.0 != new_segment_start
                 && candidate_start.0 != new_segment_end
@@ -192,7 +251,9 @@ where
         })
 }
 
-/// Recompute adjacent triangle(s) using left and right adjacent points, pushing to the heap
+/// Recompute adjacent triangle(s) using left and right adjacent points, pushing to the heap.
+///
+/// Returns the number of triangles pushed.
 fn recompute_triangles<T: CoordFloat>(
     orig: &LineString<T>,
     pq: &mut BinaryHeap<VWScore<T>>,
@@ -201,7 +262,8 @@ fn recompute_triangles<T: CoordFloat>(
     right: i32,
     rr: i32,
     max: usize,
-) {
+) -> u64 {
+    let mut pushed = 0;
     let choices = [(ll, left, right), (left, right, rr)];
     for &(ai, current_point, bi) in &choices {
         if ai as usize >= max || bi as usize >= max {
@@ -228,22 +290,29 @@ fn recompute_triangles<T: CoordFloat>(
             right: bi as usize,
         };
         pq.push(v);
+        pushed += 1;
     }
+    pushed
 }
 
 /// Simplifies a geometry while preserving its topology and area.
 pub trait SimplifyVW<T, Epsilon = T> {
     /// Returns the simplified geometry using a topology and area preserving variant of the
     /// [Visvalingam-Whyatt](https://doi.org/10.1179/000870493786962263) algorithm.
-    fn simplify_vw(&self, eps: Epsilon, len: usize) -> Self;
+    fn simplify_vw(&self, eps: Epsilon, len: usize) -> Self {
+        self.simplify_vw_indexed(eps, len, SegmentIndex::Static)
+    }
+
+    /// Returns the simplified geometry, checking for self-intersection against the given index.
+    fn simplify_vw_indexed(&self, eps: Epsilon, len: usize, index: SegmentIndex) -> Self;
 }
 
 impl<T> SimplifyVW<T> for LineString<T>
 where
     T: GeoFloat + RTreeNum,
 {
-    fn simplify_vw(&self, eps: T, len: usize) -> Self {
-        LineString::from(visvalingam_preserve(self, eps, len))
+    fn simplify_vw_indexed(&self, eps: T, len: usize, index: SegmentIndex) -> Self {
+        gather(&self.0, &visvalingam_preserve(self, eps, len, index))
     }
 }
 
@@ -251,22 +320,131 @@ impl<T> SimplifyVW<T> for Polygon<T>
 where
     T: GeoFloat + RTreeNum + Send + Sync,
 {
-    fn simplify_vw(&self, eps: T, len: usize) -> Self {
+    /// Interior rings must be wound counter-clockwise. Their triangles then have positive score
+    /// when convex, so that the same reduction shrinks each ring into itself.
+    fn simplify_vw_indexed(&self, eps: T, len: usize, index: SegmentIndex) -> Self {
         // Get convex hull segments, as their endpoints are invariant under reduction
         let segments = self.hull_segments();
+        simplify_vw_segments(self, &segments, eps, len, index)
+    }
+}
 
-        if len > segments.len() {
-            // To reduce to a fixed length the algorithm must be synchronized
-            let ls = LineString::from_segments(segments);
-            let reduced_ls = ls.simplify_vw(eps, len);
-            Polygon::new(reduced_ls, vec![])
-        } else {
-            // If a fixed length is not desired, segments can be reduced in parallel
-            let reduced_segments = segments
-                .into_par_iter()
-                .map(|ls| ls.simplify_vw(eps, 2))
-                .collect::<Vec<_>>();
-            Polygon::from_segments(reduced_segments)
-        }
+/// Build the error profile of a polygon exterior, split into convex hull segments.
+///
+/// Points removed later are more significant, so are ranked by the length of their segment when
+/// removed.
+pub fn vw_profile<T>(exterior: &LineString<T>, segments: &[LineString<T>]) -> Profile<T>
+where
+    T: GeoFloat + RTreeNum + Send + Sync,
+{
+    segments_profile(exterior, segments, SegmentIndex::Static)
+}
+
+fn segments_profile<T>(
+    exterior: &LineString<T>,
+    segments: &[LineString<T>],
+    index: SegmentIndex,
+) -> Profile<T>
+where
+    T: GeoFloat + RTreeNum + Send + Sync,
+{
+    let tolerances = segments
+        .par_iter()
+        .map(|ls| visvalingam_tolerances(ls, T::infinity(), 2, index))
+        .collect::<Vec<_>>();
+
+    // Join the segments, skipping the shared endpoint at the end of each
+    let (mut coords, (mut tolerances, mut steps)): (Vec<_>, (Vec<_>, Vec<_>)) = segments
+        .iter()
+        .zip(tolerances)
+        .flat_map(|(ls, tolerances)| {
+            let len = ls.0.len().saturating_sub(1);
+            ls.0.iter().copied().zip(tolerances).take(len)
+        })
+        .unzip();
+
+    // Segments begin at a hull vertex, so rotate back to the start of the ring
+    let start = segments_start(exterior, segments);
+    coords.rotate_right(start);
+    tolerances.rotate_right(start);
+    steps.rotate_right(start);
+
+    Profile::new(coords, tolerances, steps)
+}
+
+/// Position in the ring of the hull vertex at which the first segment begins.
+fn segments_start<T: GeoFloat>(exterior: &LineString<T>, segments: &[LineString<T>]) -> usize {
+    segments
+        .first()
+        .and_then(|ls| ls.0.first())
+        .and_then(|first| exterior.0.iter().position(|coord| coord == first))
+        .unwrap_or(0)
+}
+
+/// Reduce the exterior of a polygon, already split into convex hull segments, returning the
+/// position in the ring of each retained point.
+pub fn simplify_vw_indices<T>(
+    exterior: &LineString<T>,
+    segments: &[LineString<T>],
+    eps: T,
+    len: usize,
+    index: SegmentIndex,
+) -> Vec<usize>
+where
+    T: GeoFloat + RTreeNum + Send + Sync,
+{
+    if len > segments.len() {
+        // To reduce to a fixed length, segments are reduced to completion in parallel and their
+        // removals merged into a single ranking, from which the most significant points are kept
+        let profile = segments_profile(exterior, segments, index);
+        let retained = profile.tolerances().iter().filter(|&&t| t > eps).count();
+        return profile.extract_len_indices(retained.max(len - 1));
     }
+
+    // If a fixed length is not desired, segments can be reduced in parallel
+    let reduced_segments = segments
+        .par_iter()
+        .map(|ls| visvalingam_preserve(ls, eps, 2, index))
+        .collect::<Vec<_>>();
+
+    // Segments follow the ring from the first hull vertex, wrapping past its closing point, and
+    // are joined at the endpoint they share
+    let ring_len = exterior.0.len().saturating_sub(1).max(1);
+    let mut offset = segments_start(exterior, segments);
+    let mut indices = Vec::new();
+    for (ls, reduced) in segments.iter().zip(reduced_segments) {
+        let skip = usize::from(!indices.is_empty());
+        indices.extend(
+            reduced
+                .into_iter()
+                .skip(skip)
+                .map(|i| (offset + i) % ring_len),
+        );
+        offset += ls.0.len().saturating_sub(1);
+    }
+    indices
+}
+
+/// Reduce a polygon whose exterior has already been split into convex hull segments.
+pub fn simplify_vw_segments<T>(
+    polygon: &Polygon<T>,
+    segments: &[LineString<T>],
+    eps: T,
+    len: usize,
+    index: SegmentIndex,
+) -> Polygon<T>
+where
+    T: GeoFloat + RTreeNum + Send + Sync,
+{
+    let indices = simplify_vw_indices(polygon.exterior(), segments, eps, len, index);
+    let exterior = gather(&polygon.exterior().0, &indices);
+
+    // Interior rings are never reduced below a triangle
+    let interiors = polygon
+        .interiors()
+        .par_iter()
+        .map(|ls| ls.simplify_vw_indexed(eps, 4, index))
+        .collect();
+
+    Polygon::new(exterior, interiors)
 }
@@ -19,118 +19,193 @@
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
 use crate::extensions::conversions::IntoCoord;
-use geo::{GeoNum, Kernel, Orientation};
-use spade::handles::{DirectedEdgeHandle, FixedVertexHandle, VertexHandle};
+use crate::extensions::stats::Counters;
+use geo::{Distance, Euclidean, GeoFloat, GeoNum, Kernel, Line, Orientation};
+use spade::handles::{
+    DirectedEdgeHandle, FixedDirectedEdgeHandle, FixedVertexHandle, VertexHandle,
+};
 use spade::{CdtEdge, ConstrainedDelaunayTriangulation, Point2, SpadeNum, Triangulation};
-use std::collections::BinaryHeap;
+use std::cell::RefCell;
+use std::collections::HashSet;
+
+/// A window (left, right) on an edge, through which the far side of the edge is seen.
+type Window = (
+    FixedDirectedEdgeHandle,
+    FixedVertexHandle,
+    FixedVertexHandle,
+);
+
+/// Buffers reused by every visibility query made on a thread.
+///
+/// Handles are held in their fixed form, so the buffers are not tied to any one triangulation.
+#[derive(Default)]
+struct Scratch {
+    windows: Vec<Window>,
+    visible: Vec<FixedVertexHandle>,
+    candidates: HashSet<FixedVertexHandle>,
+}
+
+thread_local! {
+    static SCRATCH: RefCell<Scratch> = RefCell::new(Scratch::default());
+}
 
-/// Take a given window (left, right) on an edge e and recurse on the visible edges
-fn visit_edge<'a, T>(
+/// Take a given window (left, right) on an edge e and visit every edge visible through it,
+/// returning the number of edges visited.
+///
+/// Windows yet to be visited are kept on an explicit stack, so the depth of the traversal is not
+/// limited by the size of the thread's stack.
+fn visit_edge<T>(
+    cdt: &ConstrainedDelaunayTriangulation<Point2<T>>,
     source: Point2<T>,
-    edge: DirectedEdgeHandle<'a, Point2<T>, (), CdtEdge<()>, ()>,
-    left: VertexHandle<Point2<T>, (), CdtEdge<()>, ()>,
-    right: VertexHandle<Point2<T>, (), CdtEdge<()>, ()>,
-    visible: &mut BinaryHeap<VertexHandle<'a, Point2<T>, (), CdtEdge<()>>>,
-) where
+    window: Window,
+    windows: &mut Vec<Window>,
+    visible: &mut Vec<FixedVertexHandle>,
+) -> u64
+where
     T: GeoNum + SpadeNum,
 {
-    if edge.is_constraint_edge() || edge.is_outer_edge() {
-        return;
-    }
+    let mut visited = 0;
+    windows.push(window);
 
-    // If coprime point is visible, push to stack
-    let coprime = edge.opposite_vertex().unwrap();
-    // TODO: Replace with LineSideInfo
-    if matches!(
-        T::Ker::orient2d(
-            source.into_coord(),
-            left.position().into_coord(),
-            coprime.position().into_coord()
-        ),
-        Orientation::Clockwise | Orientation::Collinear
-    ) && matches!(
-        T::Ker::orient2d(
-            source.into_coord(),
-            right.position().into_coord(),
-            coprime.position().into_coord()
-        ),
-        Orientation::CounterClockwise | Orientation::Collinear
-    ) {
-        visible.push(coprime);
-    }
+    while let Some((edge, left, right)) = windows.pop() {
+        visited += 1;
+        let edge = cdt.directed_edge(edge);
+        let [left, right] = [left, right].map(|v| cdt.vertex(v));
 
-    // Iterate over new edges
-    for edge in [edge.prev(), edge.next()] {
-        // Update horizons
-        let new_left = if matches!(
+        if edge.is_constraint_edge() || edge.is_outer_edge() {
+            continue;
+        }
+
+        // If coprime point is visible, push to stack
+        let coprime = edge.opposite_vertex().unwrap();
+        // TODO: Replace with LineSideInfo
+        if matches!(
             T::Ker::orient2d(
                 source.into_coord(),
                 left.position().into_coord(),
-                edge.to().position().into_coord()
+                coprime.position().into_coord()
             ),
-            Orientation::CounterClockwise,
-        ) {
-            // Vision is restricted by the new edge
-            left
-        } else {
-            edge.to()
-        };
-
-        let new_right = if matches!(
+            Orientation::Clockwise | Orientation::Collinear
+        ) && matches!(
             T::Ker::orient2d(
                 source.into_coord(),
                 right.position().into_coord(),
-                edge.from().position().into_coord()
+                coprime.position().into_coord()
             ),
-            Orientation::Clockwise,
+            Orientation::CounterClockwise | Orientation::Collinear
         ) {
-            // Vision is restricted by the new edge
-            right
-        } else {
-            edge.from()
-        };
-
-        if matches!(
-            T::Ker::orient2d(
-                source.into_coord(),
-                new_left.position().into_coord(),
-                new_right.position().into_coord()
-            ),
-            Orientation::CounterClockwise
-        ) {
-            // Left and right have changed side: this edge is not visible
-            continue;
+            visible.push(coprime.fix());
         }
 
-        visit_edge(source, edge.rev(), new_left, new_right, visible);
+        // Iterate over new edges, stacking the next edge first so the previous is visited first
+        for edge in [edge.next(), edge.prev()] {
+            // Update horizons
+            let new_left = if matches!(
+                T::Ker::orient2d(
+                    source.into_coord(),
+                    left.position().into_coord(),
+                    edge.to().position().into_coord()
+                ),
+                Orientation::CounterClockwise,
+            ) {
+                // Vision is restricted by the new edge
+                left
+            } else {
+                edge.to()
+            };
+
+            let new_right = if matches!(
+                T::Ker::orient2d(
+                    source.into_coord(),
+                    right.position().into_coord(),
+                    edge.from().position().into_coord()
+                ),
+                Orientation::Clockwise,
+            ) {
+                // Vision is restricted by the new edge
+                right
+            } else {
+                edge.from()
+            };
+
+            if matches!(
+                T::Ker::orient2d(
+                    source.into_coord(),
+                    new_left.position().into_coord(),
+                    new_right.position().into_coord()
+                ),
+                Orientation::CounterClockwise
+            ) {
+                // Left and right have changed side: this edge is not visible
+                continue;
+            }
+
+            windows.push((edge.rev().fix(), new_left.fix(), new_right.fix()));
+        }
     }
+    visited
 }
 
-fn visibility_vertex<T: GeoNum + SpadeNum>(
-    mut edge: DirectedEdgeHandle<Point2<T>, (), CdtEdge<()>, ()>,
+/// Sweep around the source of an edge in the given direction, pushing every visible vertex and
+/// returning the number of edges visited.
+///
+/// The sweep stops after the triangle containing the direction of `horizon`. Sight lines beyond
+/// it leave the region enclosed by the chain from the source to the horizon and the chord joining
+/// them, so can never reach a vertex on that chain.
+fn visibility_vertex<'a, T: GeoNum + SpadeNum>(
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+    mut edge: DirectedEdgeHandle<'a, Point2<T>, (), CdtEdge<()>, ()>,
     direction: Orientation,
-) -> BinaryHeap<VertexHandle<Point2<T>, (), CdtEdge<()>, ()>> {
-    let mut visible = BinaryHeap::from([edge.to()]);
+    horizon: VertexHandle<'a, Point2<T>, (), CdtEdge<()>, ()>,
+    scratch: &mut Scratch,
+) -> u64 {
+    scratch.visible.push(edge.to().fix());
     let source = edge.from().position();
 
     if edge.is_outer_edge() && edge.is_constraint_edge() {
         // There are no faces to iterate over
-        return visible;
+        return 0;
     }
 
+    let reverse = match direction {
+        Orientation::CounterClockwise => Orientation::Clockwise,
+        Orientation::Clockwise => Orientation::CounterClockwise,
+        Orientation::Collinear => panic!(),
+    };
+
     if matches!(direction, Orientation::Clockwise) {
         edge = edge.rev();
     }
 
+    let mut visited = 0;
     while let Some(coprime) = edge.opposite_vertex() {
-        visible.push(coprime);
+        visited += 1;
+        scratch.visible.push(coprime.fix());
 
-        let window = match direction {
-            Orientation::CounterClockwise => edge.next().rev(),
-            Orientation::Clockwise => edge.prev().rev(),
+        let (window, first) = match direction {
+            Orientation::CounterClockwise => (edge.next().rev(), edge.to()),
+            Orientation::Clockwise => (edge.prev().rev(), edge.from()),
             Orientation::Collinear => panic!(),
         };
-        visit_edge(source, window, window.from(), window.to(), &mut visible);
+        visited += visit_edge(
+            cdt,
+            source,
+            (window.fix(), window.from().fix(), window.to().fix()),
+            &mut scratch.windows,
+            &mut scratch.visible,
+        );
+
+        // Stop once the triangle, swept from its first vertex to the coprime, covers the horizon
+        let [first, last] = [first, coprime].map(|v| {
+            T::Ker::orient2d(
+                source.into_coord(),
+                v.position().into_coord(),
+                horizon.position().into_coord(),
+            )
+        });
+        if first != reverse && last != direction {
+            break;
+        }
 
         // Advance to next edge
         edge = match direction {
@@ -143,14 +218,22 @@ fn visibility_vertex<T: GeoNum + SpadeNum>(
             break;
         }
     }
-    visible
+    visited
 }
 
-pub fn visibility_intersection<'a, T: GeoNum + SpadeNum>(
-    from: VertexHandle<Point2<T>, (), CdtEdge<()>>,
-    to: VertexHandle<Point2<T>, (), CdtEdge<()>>,
+/// Call `f` on the vertices strictly between `from` and `to` which are visible from both,
+/// unordered and possibly more than once.
+///
+/// The sweeps share the calling thread's scratch buffers, which are reused between queries.
+fn for_each_visible_between<'a, T, F>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
     cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
-) -> Vec<VertexHandle<'a, Point2<T>, (), CdtEdge<()>>> {
+    mut f: F,
+) where
+    T: GeoNum + SpadeNum,
+    F: FnMut(VertexHandle<'a, Point2<T>, (), CdtEdge<()>>),
+{
     let from_edge = {
         let next = FixedVertexHandle::from_index((from.index() + 1) % cdt.num_vertices());
         cdt.get_edge_from_neighbors(from.fix(), next).unwrap()
@@ -165,50 +248,81 @@ pub fn visibility_intersection<'a, T: GeoNum + SpadeNum>(
         cdt.get_edge_from_neighbors(to.fix(), prev).unwrap()
     };
 
-    let from_vis = visibility_vertex(from_edge, Orientation::CounterClockwise);
-    let to_vis = visibility_vertex(to_edge, Orientation::Clockwise);
+    let between = |v: FixedVertexHandle| {
+        if from.index() <= to.index() {
+            v.index() > from.index() && v.index() < to.index()
+        } else {
+            v.index() < to.index() || v.index() > from.index()
+        }
+    };
 
-    binary_heap_intersection(from_vis, to_vis)
-        .into_sorted_vec()
-        .into_iter()
-        .filter(|v| {
-            if from.index() <= to.index() {
-                v.index() >= from.index() && v.index() <= to.index()
-            } else {
-                v.index() <= to.index() || v.index() >= from.index()
+    let visited = SCRATCH.with_borrow_mut(|scratch| {
+        scratch.visible.clear();
+        let mut visited =
+            visibility_vertex(cdt, from_edge, Orientation::CounterClockwise, to, scratch);
+        scratch.candidates.clear();
+        scratch
+            .candidates
+            .extend(scratch.visible.drain(..).filter(|&v| between(v)));
+
+        visited += visibility_vertex(cdt, to_edge, Orientation::Clockwise, from, scratch);
+        for v in scratch.visible.drain(..) {
+            if between(v) && scratch.candidates.contains(&v) {
+                f(cdt.vertex(v));
             }
-        })
-        .collect()
-}
+        }
+        visited
+    });
 
-fn binary_heap_intersection<T: Ord>(mut x: BinaryHeap<T>, mut y: BinaryHeap<T>) -> BinaryHeap<T> {
-    let mut intersection = BinaryHeap::new();
-    let Some(mut other) = y.pop() else {
-        return intersection;
-    };
+    Counters {
+        visibility_edges: visited,
+        ..Default::default()
+    }
+    .record();
+}
 
-    while let Some(item) = x.pop() {
-        while item < other {
-            other = match y.pop() {
-                Some(other) => other,
-                None => return intersection,
-            };
-        }
-        if item == other {
-            intersection.push(item);
+/// The vertex strictly between `from` and `to`, visible from both, which is farthest from the
+/// chord joining them. Ties are broken by the smallest index.
+pub fn farthest_visible<'a, T: GeoFloat + SpadeNum>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+    chord: &Line<T>,
+) -> Option<VertexHandle<'a, Point2<T>, (), CdtEdge<()>>> {
+    let mut farthest: Option<(VertexHandle<'a, Point2<T>, (), CdtEdge<()>>, T)> = None;
+    for_each_visible_between(from, to, cdt, |v| {
+        let distance = Euclidean.distance(v.position().into_coord(), chord);
+        match farthest {
+            Some((u, farthest_distance))
+                if farthest_distance > distance
+                    || (farthest_distance == distance && u.index() <= v.index()) => {}
+            _ => farthest = Some((v, distance)),
         }
-    }
-    intersection
+    });
+    farthest.map(|(v, _)| v)
+}
+
+/// The vertices strictly between `from` and `to` which are visible from both, in index order.
+#[cfg(test)]
+fn visibility_intersection<'a, T: GeoNum + SpadeNum>(
+    from: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    to: VertexHandle<'a, Point2<T>, (), CdtEdge<()>>,
+    cdt: &'a ConstrainedDelaunayTriangulation<Point2<T>>,
+) -> Vec<VertexHandle<'a, Point2<T>, (), CdtEdge<()>>> {
+    let mut visible = Vec::new();
+    for_each_visible_between(from, to, cdt, |v| visible.push(v));
+    visible.sort_by_key(|v| v.index());
+    visible.dedup();
+    visible
 }
 
 #[cfg(test)]
 mod test {
-    use crate::algorithms::visibility::{visibility_intersection, visit_edge};
+    use crate::algorithms::visibility::{farthest_visible, visibility_intersection, visit_edge};
     use crate::extensions::triangulate::Triangulate;
-    use geo::polygon;
+    use geo::{polygon, Line};
     use spade::handles::FixedVertexHandle;
     use spade::{Point2, Triangulation};
-    use std::collections::BinaryHeap;
 
     #[test]
     fn collinear_test() {
@@ -327,14 +441,12 @@ mod test {
             cdt.get_edge_from_neighbors(from, to).unwrap().rev()
         };
 
-        let mut vis = BinaryHeap::new();
-        visit_edge(source, edge, edge.from(), edge.to(), &mut vis);
+        let window = (edge.fix(), edge.from().fix(), edge.to().fix());
+        let mut vis = Vec::new();
+        visit_edge(&cdt, source, window, &mut Vec::new(), &mut vis);
 
-        let vis = vis
-            .into_sorted_vec()
-            .into_iter()
-            .map(|v| v.index())
-            .collect::<Vec<_>>();
+        let mut vis = vis.into_iter().map(|v| v.index()).collect::<Vec<_>>();
+        vis.sort();
         let correct = vec![1, 3, 5, 6];
 
         assert_eq!(vis, correct);
@@ -448,4 +560,28 @@ mod test {
 
         assert_eq!(vis, correct);
     }
+
+    #[test]
+    fn farthest_test() {
+        let poly = polygon![
+            (x: 0.0, y: 1.0),
+            (x: 0.5, y: 0.5),
+            (x: 1.0, y: 0.3),
+            (x: 1.5, y: 0.6),
+            (x: 2.0, y: 1.0),
+            (x: 2.0, y: 0.0),
+            (x: 0.0, y: 0.0),
+        ];
+
+        let cdt = poly.triangulate();
+
+        let [from, to] = [0, 4].map(|index| {
+            let handle = FixedVertexHandle::from_index(index);
+            cdt.get_vertex(handle).unwrap()
+        });
+        let chord = Line::new((0.0, 1.0), (2.0, 1.0));
+
+        let farthest = farthest_visible(from, to, &cdt, &chord).map(|v| v.index());
+        assert_eq!(farthest, Some(2));
+    }
 }
@@ -18,7 +18,13 @@
 
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
-use geo::{Coord, CoordNum};
+use crate::extensions::stats::{self, Phase};
+use geo::{Coord, CoordNum, LineString};
+use numpy::ndarray::Array2;
+use numpy::{Element, IntoPyArray, PyArray1, PyArray2};
+use pyo3::buffer::{Element as BufferElement, PyBuffer};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
 use spade::{Point2, SpadeNum};
 
 pub trait IntoCoord<T: CoordNum> {
@@ -36,3 +42,183 @@ where
         }
     }
 }
+
+/// Copy a C-contiguous `(N, 2)` buffer of coordinates into a `LineString`.
+///
+/// The buffer is read in place, avoiding the construction of an intermediate Python object per
+/// coordinate.
+pub fn linestring_from_buffer<T>(py: Python<'_>, buf: &PyBuffer<T>) -> PyResult<LineString<T>>
+where
+    T: CoordNum + BufferElement,
+{
+    let _span = stats::span(Phase::Input);
+    if !matches!(buf.shape(), [_, 2]) {
+        return Err(PyValueError::new_err(format!(
+            "Expected an array of shape (N, 2), found {:?}",
+            buf.shape()
+        )));
+    }
+    let Some(cells) = buf.as_slice(py) else {
+        return Err(PyValueError::new_err("Expected a C-contiguous array"));
+    };
+
+    let coords = cells
+        .chunks_exact(2)
+        .map(|pair| Coord {
+            x: pair[0].get(),
+            y: pair[1].get(),
+        })
+        .collect::<Vec<_>>();
+
+    Ok(LineString::new(coords))
+}
+
+/// Move the coordinates of a `LineString` into an `(N, 2)` NumPy array.
+pub fn linestring_into_pyarray<T>(py: Python<'_>, ls: LineString<T>) -> Bound<'_, PyArray2<T>>
+where
+    T: CoordNum + Element,
+{
+    let _span = stats::span(Phase::Output);
+    let flat = ls.into_iter().flat_map(|c| [c.x, c.y]).collect::<Vec<_>>();
+    coords_into_pyarray(py, flat)
+}
+
+/// Move a flat vector of interleaved coordinates into an `(N, 2)` NumPy array.
+pub fn coords_into_pyarray<T: Element>(py: Python<'_>, flat: Vec<T>) -> Bound<'_, PyArray2<T>> {
+    Array2::from_shape_vec((flat.len() / 2, 2), flat)
+        .expect("buffer length matches shape")
+        .into_pyarray(py)
+}
+
+/// Split a flat `(N, 2)` coordinate buffer into rings using an offsets buffer.
+///
+/// Ring `i` is made up of coordinates `offsets[i]..offsets[i + 1]`, following the layout used by
+/// Arrow and `shapely.to_ragged_array`.
+pub fn linestrings_from_buffers<T>(
+    py: Python<'_>,
+    coords: &PyBuffer<T>,
+    offsets: &PyBuffer<i64>,
+) -> PyResult<Vec<LineString<T>>>
+where
+    T: CoordNum + BufferElement,
+{
+    let coords = linestring_from_buffer(py, coords)?.0;
+    let _span = stats::span(Phase::Input);
+    let offsets = offsets.to_vec(py)?;
+
+    let bounds = offsets
+        .iter()
+        .map(|&offset| usize::try_from(offset).ok().filter(|&o| o <= coords.len()))
+        .collect::<Option<Vec<_>>>()
+        .ok_or_else(|| PyValueError::new_err("Offsets must lie within the coordinate array"))?;
+
+    bounds
+        .windows(2)
+        .map(|window| {
+            let &[start, end] = window else {
+                unreachable!()
+            };
+            if start > end {
+                return Err(PyValueError::new_err("Offsets must be non-decreasing"));
+            }
+            Ok(LineString::new(coords[start..end].to_vec()))
+        })
+        .collect()
+}
+
+/// Flatten rings into interleaved coordinates and offsets, the inverse of
+/// `linestrings_from_buffers`.
+pub fn flatten_linestrings<T: CoordNum>(rings: Vec<LineString<T>>) -> (Vec<T>, Vec<i64>) {
+    let _span = stats::span(Phase::Output);
+    let mut offsets = Vec::with_capacity(rings.len() + 1);
+    offsets.push(0);
+
+    let mut flat = Vec::with_capacity(2 * rings.iter().map(|ls| ls.0.len()).sum::<usize>());
+    for ls in rings {
+        flat.extend(ls.into_iter().flat_map(|c| [c.x, c.y]));
+        offsets.push((flat.len() / 2) as i64);
+    }
+
+    (flat, offsets)
+}
+
+/// Move flattened rings into a pair of NumPy arrays.
+pub fn flat_into_pyarrays<T: Element>(
+    py: Python<'_>,
+    (flat, offsets): (Vec<T>, Vec<i64>),
+) -> (Bound<'_, PyArray2<T>>, Bound<'_, PyArray1<i64>>) {
+    let _span = stats::span(Phase::Output);
+    (coords_into_pyarray(py, flat), offsets.into_pyarray(py))
+}
+
+/// Close a ring of indices by repeating its first index, unless it is already closed.
+pub fn close_indices(mut indices: Vec<usize>) -> Vec<usize> {
+    if let (Some(&first), Some(&last)) = (indices.first(), indices.last()) {
+        if first != last {
+            indices.push(first);
+        }
+    }
+    indices
+}
+
+/// Collect the coordinates at the given positions of a ring.
+pub fn gather<T: CoordNum>(coords: &[Coord<T>], indices: &[usize]) -> LineString<T> {
+    indices.iter().map(|&index| coords[index]).collect()
+}
+
+/// Map positions in a closed ring of `len` coordinates back to positions in the original ring,
+/// which was reversed if `reversed`, taking the closing coordinate to the first.
+pub fn ring_positions(indices: &mut [usize], len: usize, reversed: bool) {
+    let unique = len.saturating_sub(1).max(1);
+    for index in indices {
+        let position = if reversed { len - 1 - *index } else { *index };
+        *index = position % unique;
+    }
+}
+
+/// Move indices into a ring of length `len` into a NumPy array, of `uint32` where every index fits
+/// and `uint64` otherwise.
+pub fn indices_into_pyarray(py: Python<'_>, indices: Vec<usize>, len: usize) -> Bound<'_, PyAny> {
+    let _span = stats::span(Phase::Output);
+    if u32::try_from(len).is_ok() {
+        let indices = indices.into_iter().map(|i| i as u32).collect::<Vec<_>>();
+        indices.into_pyarray(py).into_any()
+    } else {
+        let indices = indices.into_iter().map(|i| i as u64).collect::<Vec<_>>();
+        indices.into_pyarray(py).into_any()
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use crate::extensions::conversions::{close_indices, gather, ring_positions};
+    use geo::{line_string, Winding};
+
+    #[test]
+    fn indices_test() {
+        let original = line_string![
+            (x: 0.0, y: 0.0),
+            (x: 1.0, y: 0.0),
+            (x: 1.0, y: 1.0),
+            (x: 0.5, y: 0.5),
+            (x: 0.0, y: 1.0),
+            (x: 0.0, y: 0.0),
+        ];
+        let mut reversed = original.clone();
+        reversed.make_cw_winding();
+
+        // Positions in the reversed ring of a reduction dropping the reflex vertex
+        let mut indices = close_indices(vec![0, 1, 3, 4]);
+        assert_eq!(indices, vec![0, 1, 3, 4, 0]);
+        let reduced = gather(&reversed.0, &indices);
+
+        ring_positions(&mut indices, original.0.len(), true);
+        assert_eq!(indices, vec![0, 4, 2, 1, 0]);
+        assert_eq!(gather(&original.0, &indices), reduced);
+
+        // The closing coordinate maps to the first whichever way round the ring is
+        let mut indices = vec![1, 2, 4, 5];
+        ring_positions(&mut indices, original.0.len(), false);
+        assert_eq!(indices, vec![1, 2, 4, 0]);
+    }
+}
@@ -19,6 +19,12 @@
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
 pub mod conversions;
+pub mod prepared;
+pub mod profile;
+pub mod reduce;
+pub mod repair;
 pub mod segments;
+pub mod stats;
+pub mod threads;
 pub mod triangulate;
 pub mod validation;
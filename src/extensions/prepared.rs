@@ -0,0 +1,140 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+use crate::algorithms::hull_tree::HullTree;
+use crate::algorithms::simplify_charshape::{charshape_profile, simplify_charshape_triangulated};
+use crate::algorithms::simplify_rdp::{hull_tree, rdp_profile, simplify_rdp_triangulated};
+use crate::algorithms::simplify_vw::{simplify_vw_segments, vw_profile, SegmentIndex};
+use crate::extensions::profile::Profile;
+use crate::extensions::reduce::{Reduce, ReductionMethod};
+use crate::extensions::segments::HullSegments;
+use crate::extensions::stats::{self, Phase};
+use crate::extensions::triangulate::Triangulate;
+use crate::extensions::validation::{InvalidPolygon, Validate};
+use geo::{GeoFloat, LineString, Polygon, Winding};
+use rstar::RTreeNum;
+use spade::{ConstrainedDelaunayTriangulation, Point2, SpadeNum};
+use std::sync::OnceLock;
+
+/// A validated polygon, which caches the structures built by each method across reductions.
+///
+/// The exterior is wound clockwise and interiors counter-clockwise, as expected by every method.
+/// The triangulation, hull tree and hull segments are only built when a method first needs them.
+pub struct PreparedPolygon<T: SpadeNum + GeoFloat> {
+    polygon: Polygon<T>,
+    triangulation: OnceLock<ConstrainedDelaunayTriangulation<Point2<T>>>,
+    hulls: OnceLock<HullTree<T>>,
+    segments: OnceLock<Vec<LineString<T>>>,
+    reversed: bool,
+}
+
+impl<T> PreparedPolygon<T>
+where
+    T: GeoFloat + SpadeNum + RTreeNum + Send + Sync,
+{
+    pub fn new(polygon: Polygon<T>) -> Result<Self, InvalidPolygon> {
+        let mut polygon = polygon.validate()?;
+        let reversed = !polygon.exterior().is_cw();
+        stats::timed(Phase::Winding, || {
+            polygon.exterior_mut(|ls| ls.make_cw_winding())
+        });
+        polygon.interiors_mut(|rings| rings.iter_mut().for_each(|ls| ls.make_ccw_winding()));
+
+        Ok(PreparedPolygon {
+            polygon,
+            triangulation: OnceLock::new(),
+            hulls: OnceLock::new(),
+            segments: OnceLock::new(),
+            reversed,
+        })
+    }
+
+    /// Whether the exterior was reversed to wind it clockwise.
+    pub fn is_reversed(&self) -> bool {
+        self.reversed
+    }
+
+    fn triangulation(&self) -> &ConstrainedDelaunayTriangulation<Point2<T>> {
+        self.triangulation
+            .get_or_init(|| self.polygon.triangulate())
+    }
+
+    fn hulls(&self) -> &HullTree<T> {
+        let cdt = self.triangulation();
+        self.hulls.get_or_init(|| hull_tree(cdt))
+    }
+
+    fn segments(&self) -> &[LineString<T>] {
+        self.segments.get_or_init(|| self.polygon.hull_segments())
+    }
+
+    pub fn reduce(&self, method: ReductionMethod, eps: T, len: usize) -> Polygon<T> {
+        self.reduce_indexed(method, eps, len, SegmentIndex::Static)
+    }
+
+    /// Reduce, checking Visvalingam-Whyatt removals for self-intersection against the given
+    /// index. Other methods ignore the index.
+    pub fn reduce_indexed(
+        &self,
+        method: ReductionMethod,
+        eps: T,
+        len: usize,
+        index: SegmentIndex,
+    ) -> Polygon<T> {
+        // Degenerate polygons cannot be triangulated
+        if self.polygon.exterior().0.len() < 3 {
+            return self.polygon.clone();
+        }
+
+        match method {
+            ReductionMethod::Charshape => {
+                simplify_charshape_triangulated(&self.polygon, self.triangulation(), eps, len)
+            }
+            ReductionMethod::Rdp => simplify_rdp_triangulated(
+                &self.polygon,
+                self.triangulation(),
+                self.hulls(),
+                eps,
+                len,
+            ),
+            ReductionMethod::Vw => {
+                simplify_vw_segments(&self.polygon, self.segments(), eps, len, index)
+            }
+        }
+    }
+
+    pub fn profile(&self, method: ReductionMethod) -> Profile<T> {
+        // Degenerate polygons cannot be triangulated
+        if self.polygon.exterior().0.len() < 3 {
+            return self.polygon.profile(method);
+        }
+
+        match method {
+            ReductionMethod::Charshape => charshape_profile(self.triangulation()),
+            ReductionMethod::Rdp => rdp_profile(self.triangulation(), self.hulls()),
+            ReductionMethod::Vw => vw_profile(self.polygon.exterior(), self.segments()),
+        }
+    }
+
+    pub fn reduce_auto(&self, method: ReductionMethod) -> Polygon<T> {
+        let profile = self.profile(method);
+        Polygon::new(profile.extract(profile.knee()), vec![])
+    }
+}
@@ -0,0 +1,225 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+use crate::extensions::conversions::{close_indices, gather};
+use geo::{Coord, GeoFloat, LineString};
+
+/// The order in which the vertices of a ring are removed, and the tolerance at which each goes.
+///
+/// A profile is built with a single reduction run to completion. The ring reduced at any
+/// tolerance `eps` is then made up of the vertices whose tolerance exceeds `eps`, and the ring
+/// reduced to `k` vertices of the `k` most significant vertices, both taken in ring order.
+#[derive(Clone, Debug)]
+pub struct Profile<T: GeoFloat> {
+    coords: Vec<Coord<T>>,
+    tolerances: Vec<T>,
+    order: Vec<usize>,
+}
+
+impl<T: GeoFloat> Profile<T> {
+    /// Build a profile from the unique vertices of a ring, without the closing coordinate.
+    ///
+    /// Vertices are ranked by decreasing tolerance, with ties broken by increasing step and then
+    /// by position.
+    pub fn new(coords: Vec<Coord<T>>, tolerances: Vec<T>, steps: Vec<usize>) -> Self {
+        debug_assert_eq!(coords.len(), tolerances.len());
+        debug_assert_eq!(coords.len(), steps.len());
+
+        let mut order = (0..coords.len()).collect::<Vec<_>>();
+        order.sort_by(|&a, &b| {
+            let by_tolerance = tolerances[b].partial_cmp(&tolerances[a]).unwrap();
+            by_tolerance.then(steps[a].cmp(&steps[b]))
+        });
+
+        Profile {
+            coords,
+            tolerances,
+            order,
+        }
+    }
+
+    /// The vertices of the ring, in order.
+    pub fn coords(&self) -> &[Coord<T>] {
+        &self.coords
+    }
+
+    /// The tolerance at which each vertex is removed.
+    pub fn tolerances(&self) -> &[T] {
+        &self.tolerances
+    }
+
+    /// The rank of each vertex, from zero for the most significant.
+    pub fn ranks(&self) -> Vec<usize> {
+        let mut ranks = vec![0; self.order.len()];
+        for (rank, &index) in self.order.iter().enumerate() {
+            ranks[index] = rank;
+        }
+        ranks
+    }
+
+    /// Reverse the orientation of the ring, keeping the first vertex in place.
+    pub fn reversed(self) -> Self {
+        let len = self.coords.len();
+        let flip = |index: usize| (len - index) % len;
+
+        let mut coords = self.coords;
+        let mut tolerances = self.tolerances;
+        if len > 1 {
+            coords[1..].reverse();
+            tolerances[1..].reverse();
+        }
+        let order = self.order.into_iter().map(flip).collect();
+
+        Profile {
+            coords,
+            tolerances,
+            order,
+        }
+    }
+
+    /// Extract the ring reduced at the given tolerance.
+    pub fn extract(&self, eps: T) -> LineString<T> {
+        gather(&self.coords, &self.extract_indices(eps))
+    }
+
+    /// The position of each vertex of the ring reduced at the given tolerance.
+    pub fn extract_indices(&self, eps: T) -> Vec<usize> {
+        let indices = self
+            .tolerances
+            .iter()
+            .enumerate()
+            .filter_map(|(index, &tolerance)| (tolerance > eps).then_some(index))
+            .collect();
+        close_indices(indices)
+    }
+
+    /// Extract the ring made up of the `len` most significant vertices.
+    ///
+    /// The length is clamped between the vertices which are never removed, and those which are
+    /// ever retained.
+    pub fn extract_len(&self, len: usize) -> LineString<T> {
+        gather(&self.coords, &self.extract_len_indices(len))
+    }
+
+    /// The position of each vertex of the ring made up of the `len` most significant vertices.
+    pub fn extract_len_indices(&self, len: usize) -> Vec<usize> {
+        let tolerance = |&index: &usize| self.tolerances[index];
+        let fixed = self
+            .order
+            .partition_point(|i| tolerance(i) == T::infinity());
+        let available = self
+            .order
+            .partition_point(|i| tolerance(i) > T::neg_infinity());
+
+        let mut indices = self.order[..len.clamp(fixed, available)].to_vec();
+        indices.sort_unstable();
+        close_indices(indices)
+    }
+
+    /// Select a tolerance at the knee of the error profile.
+    ///
+    /// Vertices are ordered from most to least significant, and the logarithm of their removal
+    /// tolerance plotted against the number of vertices retained. The knee is the point furthest
+    /// above the chord joining the ends of this curve, after both axes are normalised, beyond
+    /// which retaining more vertices brings little reduction in error.
+    pub fn knee(&self) -> T {
+        let tolerances = self
+            .order
+            .iter()
+            .map(|&index| self.tolerances[index])
+            .filter(|&tolerance| tolerance.is_finite() && tolerance > T::zero())
+            .collect::<Vec<_>>();
+
+        let (Some(&first), Some(&last)) = (tolerances.first(), tolerances.last()) else {
+            // There is nothing to remove
+            return T::zero();
+        };
+
+        let range = first.ln() - last.ln();
+        let scale = T::from(tolerances.len() - 1).unwrap();
+        let knee = if range > T::zero() {
+            tolerances
+                .iter()
+                .enumerate()
+                .map(|(i, &tolerance)| {
+                    let x = T::from(i).unwrap() / scale;
+                    let y = (first.ln() - tolerance.ln()) / range;
+                    (i, y - x)
+                })
+                .max_by(|(_, a), (_, b)| a.partial_cmp(b).unwrap())
+                .map_or(0, |(i, _)| i)
+        } else {
+            tolerances.len() - 1
+        };
+
+        // Choose a tolerance between the knee and the next vertex, retaining the knee
+        match tolerances.get(knee + 1) {
+            Some(&next) => (tolerances[knee] * next).sqrt(),
+            None => tolerances[knee] / (T::one() + T::one()),
+        }
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use crate::extensions::profile::Profile;
+    use geo::{coord, line_string};
+
+    fn square() -> Profile<f64> {
+        let coords = vec![
+            coord! { x: 0.0, y: 0.0 },
+            coord! { x: 1.0, y: 0.0 },
+            coord! { x: 1.0, y: 1.0 },
+            coord! { x: 0.0, y: 1.0 },
+        ];
+        let tolerances = vec![f64::INFINITY, 1.0, f64::INFINITY, 3.0];
+        let steps = vec![0, 3, 1, 2];
+        Profile::new(coords, tolerances, steps)
+    }
+
+    #[test]
+    fn extract_test() {
+        let correct = line_string![
+            (x: 0.0, y: 0.0),
+            (x: 1.0, y: 1.0),
+            (x: 0.0, y: 1.0),
+            (x: 0.0, y: 0.0),
+        ];
+        assert_eq!(square().extract(2.0), correct);
+        assert_eq!(square().extract_len(3), correct);
+    }
+
+    #[test]
+    fn ranks_test() {
+        assert_eq!(square().ranks(), vec![0, 3, 1, 2]);
+        assert_eq!(square().reversed().ranks(), vec![0, 2, 1, 3]);
+    }
+
+    #[test]
+    fn knee_test() {
+        let tolerances = vec![1e4, 1e3, 1e2, 1e1, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0];
+        let coords = vec![coord! { x: 0.0, y: 0.0 }; tolerances.len()];
+        let steps = vec![0; tolerances.len()];
+        let profile = Profile::new(coords, tolerances, steps);
+
+        let eps = profile.knee();
+        assert!(9.0 < eps && eps < 10.0);
+    }
+}
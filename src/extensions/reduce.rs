@@ -0,0 +1,249 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+use crate::algorithms::simplify_charshape::{
+    characteristic_indices, charshape_profile, SimplifyCharshape,
+};
+use crate::algorithms::simplify_rdp::{hull_tree, rdp_indices, rdp_profile, SimplifyRDP};
+use crate::algorithms::simplify_vw::{simplify_vw_indices, vw_profile, SegmentIndex, SimplifyVW};
+use crate::extensions::profile::Profile;
+use crate::extensions::segments::HullSegments;
+use crate::extensions::stats::{self, Phase};
+use crate::extensions::triangulate::Triangulate;
+use crate::extensions::validation::{colliding_parts, InvalidPolygon, Validate};
+use geo::{CoordNum, GeoFloat, Polygon, Winding};
+use rayon::prelude::*;
+use rstar::RTreeNum;
+use spade::SpadeNum;
+use std::cmp::Reverse;
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum ReductionMethod {
+    Charshape,
+    Rdp,
+    Vw,
+}
+
+/// Reduce a polygon using a method chosen at runtime.
+pub trait Reduce<T>: Sized {
+    fn reduce(&self, method: ReductionMethod, eps: T, len: usize) -> Self {
+        self.reduce_indexed(method, eps, len, SegmentIndex::Static)
+    }
+
+    /// Reduce, checking Visvalingam-Whyatt removals for self-intersection against the given
+    /// index. Other methods ignore the index.
+    fn reduce_indexed(
+        &self,
+        method: ReductionMethod,
+        eps: T,
+        len: usize,
+        index: SegmentIndex,
+    ) -> Self;
+
+    /// Reduce the exterior, returning the position in the ring of each retained vertex rather
+    /// than the reduced polygon.
+    fn reduce_indices(
+        &self,
+        method: ReductionMethod,
+        eps: T,
+        len: usize,
+        index: SegmentIndex,
+    ) -> Vec<usize>;
+
+    /// Build the error profile of the exterior, from which it can be reduced at any tolerance.
+    fn profile(&self, method: ReductionMethod) -> Profile<T>;
+
+    /// Reduce at the tolerance chosen from the knee of the error profile.
+    fn reduce_auto(&self, method: ReductionMethod) -> Self;
+
+    /// Validate the polygon and bring it into the orientation expected by the method.
+    fn prepare(self, method: ReductionMethod) -> Result<Self, InvalidPolygon>;
+}
+
+impl<T> Reduce<T> for Polygon<T>
+where
+    T: GeoFloat + SpadeNum + RTreeNum + Send + Sync,
+{
+    fn reduce_indexed(
+        &self,
+        method: ReductionMethod,
+        eps: T,
+        len: usize,
+        index: SegmentIndex,
+    ) -> Self {
+        match method {
+            ReductionMethod::Charshape => self.simplify_charshape(eps, len),
+            ReductionMethod::Rdp => self.simplify_rdp(eps, len),
+            ReductionMethod::Vw => self.simplify_vw_indexed(eps, len, index),
+        }
+    }
+
+    fn reduce_indices(
+        &self,
+        method: ReductionMethod,
+        eps: T,
+        len: usize,
+        index: SegmentIndex,
+    ) -> Vec<usize> {
+        // Degenerate polygons cannot be triangulated
+        if self.exterior().0.len() < 3 {
+            return (0..self.exterior().0.len()).collect();
+        }
+
+        match method {
+            ReductionMethod::Charshape => characteristic_indices(&self.triangulate(), eps, len),
+            ReductionMethod::Rdp => {
+                let cdt = self.triangulate();
+                rdp_indices(&cdt, &hull_tree(&cdt), eps, len)
+            }
+            ReductionMethod::Vw => {
+                simplify_vw_indices(self.exterior(), &self.hull_segments(), eps, len, index)
+            }
+        }
+    }
+
+    fn profile(&self, method: ReductionMethod) -> Profile<T> {
+        // Degenerate polygons cannot be triangulated
+        if self.exterior().0.len() < 3 {
+            let coords = self.exterior().0.clone();
+            let tolerances = vec![T::infinity(); coords.len()];
+            let steps = vec![0; coords.len()];
+            return Profile::new(coords, tolerances, steps);
+        }
+
+        match method {
+            ReductionMethod::Charshape => charshape_profile(&self.triangulate()),
+            ReductionMethod::Rdp => {
+                let cdt = self.triangulate();
+                rdp_profile(&cdt, &hull_tree(&cdt))
+            }
+            ReductionMethod::Vw => vw_profile(self.exterior(), &self.hull_segments()),
+        }
+    }
+
+    fn reduce_auto(&self, method: ReductionMethod) -> Self {
+        let profile = self.profile(method);
+        Polygon::new(profile.extract(profile.knee()), vec![])
+    }
+
+    fn prepare(self, method: ReductionMethod) -> Result<Self, InvalidPolygon> {
+        let mut polygon = self.validate()?;
+        if matches!(method, ReductionMethod::Rdp | ReductionMethod::Vw) {
+            stats::timed(Phase::Winding, || {
+                polygon.exterior_mut(|ls| ls.make_cw_winding())
+            });
+        }
+        // Interior rings are reduced inwards by reversing their orientation
+        polygon.interiors_mut(|rings| rings.iter_mut().for_each(|ls| ls.make_ccw_winding()));
+        Ok(polygon)
+    }
+}
+
+/// Map over a batch of polygons in parallel, returning results in input order.
+///
+/// Polygons are scheduled largest first, so that the end of the batch is made up of small jobs
+/// which keep every worker busy.
+pub fn par_map_balanced<T, R, F>(polygons: Vec<Polygon<T>>, f: F) -> Vec<R>
+where
+    T: CoordNum + Send,
+    R: Send,
+    F: Fn(Polygon<T>) -> R + Send + Sync,
+{
+    let mut jobs = polygons.into_iter().enumerate().collect::<Vec<_>>();
+    jobs.sort_unstable_by_key(|(_, polygon)| Reverse(polygon.exterior().0.len()));
+
+    let mut results = jobs
+        .into_par_iter()
+        .with_max_len(1)
+        .map(|(index, polygon)| (index, f(polygon)))
+        .collect::<Vec<_>>();
+    results.sort_unstable_by_key(|&(index, _)| index);
+
+    results.into_iter().map(|(_, result)| result).collect()
+}
+
+/// Number of times colliding parts are reduced again before being left unreduced.
+const RETRIES: usize = 4;
+
+/// Reduce the parts of multi-polygons in parallel, keeping the parts of each group disjoint.
+///
+/// Each part is reduced on its own, so parts lying close together can grow into one another, and
+/// an island can cross the hole around it. Colliding parts are reduced again with half the
+/// tolerance and twice the length, and are left unreduced if they still collide after `RETRIES`
+/// attempts.
+pub fn reduce_disjoint<T>(
+    parts: &[Polygon<T>],
+    groups: &[usize],
+    method: ReductionMethod,
+    eps: T,
+    len: usize,
+    index: SegmentIndex,
+) -> Vec<Polygon<T>>
+where
+    T: GeoFloat + SpadeNum + RTreeNum + Send + Sync,
+{
+    // Reduce the chosen parts in parallel, largest first
+    let reduce = |mut chosen: Vec<usize>, eps: T, len: usize| {
+        chosen.sort_unstable_by_key(|&part| Reverse(parts[part].exterior().0.len()));
+        chosen
+            .into_par_iter()
+            .with_max_len(1)
+            .map(|part| (part, parts[part].reduce_indexed(method, eps, len, index)))
+            .collect::<Vec<_>>()
+    };
+
+    let mut reduced = reduce((0..parts.len()).collect(), eps, len);
+    reduced.sort_unstable_by_key(|&(part, _)| part);
+    let mut reduced = reduced
+        .into_iter()
+        .map(|(_, polygon)| polygon)
+        .collect::<Vec<_>>();
+
+    let (mut eps, mut len) = (eps, len);
+    for _ in 0..RETRIES {
+        let colliding = colliding_parts(&reduced, groups);
+        if colliding.is_empty() {
+            return reduced;
+        }
+
+        eps = eps / (T::one() + T::one());
+        len = len.saturating_mul(2);
+        for (part, polygon) in reduce(colliding, eps, len) {
+            reduced[part] = polygon;
+        }
+    }
+
+    // The original parts are disjoint, so this ends once every colliding part is unreduced
+    let mut unreduced = vec![false; parts.len()];
+    loop {
+        let colliding = colliding_parts(&reduced, groups)
+            .into_iter()
+            .filter(|&part| !unreduced[part])
+            .collect::<Vec<_>>();
+        if colliding.is_empty() {
+            return reduced;
+        }
+
+        for part in colliding {
+            reduced[part] = parts[part].clone();
+            unreduced[part] = true;
+        }
+    }
+}
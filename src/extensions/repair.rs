@@ -0,0 +1,222 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+use geo::{Coord, GeoFloat, Kernel, LineString, Orientation, Polygon, Winding};
+use std::ops::AddAssign;
+
+/// The changes made to a polygon by [`Repair::repair`].
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct Repairs {
+    /// Number of rings which were not closed.
+    pub closed: usize,
+    /// Number of rings whose winding was reversed.
+    pub reversed: usize,
+    /// Number of consecutive duplicate points dropped.
+    pub duplicates: usize,
+    /// Number of points dropped from the middle of straight runs.
+    pub collinear: usize,
+}
+
+impl Repairs {
+    /// Whether the polygon was left unchanged.
+    pub fn is_empty(&self) -> bool {
+        *self == Repairs::default()
+    }
+}
+
+impl AddAssign for Repairs {
+    fn add_assign(&mut self, other: Repairs) {
+        self.closed += other.closed;
+        self.reversed += other.reversed;
+        self.duplicates += other.duplicates;
+        self.collinear += other.collinear;
+    }
+}
+
+/// Check whether `b` lies on the segment from `a` to `c`, continuing in the same direction.
+///
+/// Non-finite points are never straight, so are left in place to be rejected by validation.
+fn is_straight<T: GeoFloat>(a: Coord<T>, b: Coord<T>, c: Coord<T>) -> bool {
+    let finite = [a, b, c].iter().all(|p| p.x.is_finite() && p.y.is_finite());
+    let (ab, bc) = (b - a, c - b);
+    finite
+        && T::Ker::orient2d(a, b, c) == Orientation::Collinear
+        && ab.x * bc.x + ab.y * bc.y > T::zero()
+}
+
+/// Repair a single ring in one pass, winding it clockwise or counter-clockwise.
+///
+/// Along with the repaired ring, returns the position in the original ring of each of its
+/// coordinates.
+fn repair_ring<T: GeoFloat>(ls: &LineString<T>, cw: bool) -> (LineString<T>, Vec<usize>, Repairs) {
+    let mut repairs = Repairs::default();
+    let mut coords = ls.0.as_slice();
+
+    match (coords.first(), coords.last()) {
+        (Some(first), Some(last)) if first == last => coords = &coords[..coords.len() - 1],
+        (Some(_), Some(_)) => repairs.closed += 1,
+        _ => return (ls.clone(), Vec::new(), repairs),
+    }
+
+    let mut ring: Vec<Coord<T>> = Vec::with_capacity(coords.len() + 1);
+    let mut positions = Vec::with_capacity(coords.len() + 1);
+    for (position, &coord) in coords.iter().enumerate() {
+        if ring.last() == Some(&coord) {
+            repairs.duplicates += 1;
+            continue;
+        }
+        while let [.., a, b] = ring[..] {
+            if !is_straight(a, b, coord) {
+                break;
+            }
+            ring.pop();
+            positions.pop();
+            repairs.collinear += 1;
+        }
+        ring.push(coord);
+        positions.push(position);
+    }
+
+    // The pass treats the ring as a line, so tidy up where its ends meet
+    if ring.len() > 1 && ring.first() == ring.last() {
+        ring.pop();
+        positions.pop();
+        repairs.duplicates += 1;
+    }
+    let mut start = 0;
+    while ring.len() - start > 3 {
+        let n = ring.len();
+        if is_straight(ring[n - 2], ring[n - 1], ring[start]) {
+            ring.pop();
+            positions.pop();
+        } else if is_straight(ring[n - 1], ring[start], ring[start + 1]) {
+            start += 1;
+        } else {
+            break;
+        }
+        repairs.collinear += 1;
+    }
+    ring.drain(..start);
+    positions.drain(..start);
+
+    let mut ls = LineString::new(ring);
+    if !ls.is_closed() {
+        ls.close();
+        positions.push(positions[0]);
+    }
+    if ls.0.len() >= 4 && ls.is_cw() != cw {
+        ls.0.reverse();
+        positions.reverse();
+        repairs.reversed += 1;
+    }
+    (ls, positions, repairs)
+}
+
+pub trait Repair: Sized {
+    /// Close rings, wind them as expected, and drop consecutive duplicates and the middle points
+    /// of straight runs, reporting what was changed.
+    fn repair(&self) -> (Self, Repairs) {
+        let (repaired, _, repairs) = self.repair_positions();
+        (repaired, repairs)
+    }
+
+    /// Repair as [`Repair::repair`], also returning the position in the original exterior of each
+    /// coordinate of the repaired exterior.
+    fn repair_positions(&self) -> (Self, Vec<usize>, Repairs);
+}
+
+impl<T: GeoFloat> Repair for LineString<T> {
+    /// The ring is repaired as an exterior, so is wound clockwise. Rings must be repaired before
+    /// they are built into a `Polygon`, which closes them.
+    fn repair_positions(&self) -> (Self, Vec<usize>, Repairs) {
+        repair_ring(self, true)
+    }
+}
+
+impl<T: GeoFloat> Repair for Polygon<T> {
+    /// The exterior is wound clockwise, and interiors counter-clockwise. Rings of a `Polygon` are
+    /// always closed, so none are reported as closed.
+    fn repair_positions(&self) -> (Self, Vec<usize>, Repairs) {
+        let (exterior, positions, mut repairs) = repair_ring(self.exterior(), true);
+        let interiors = self
+            .interiors()
+            .iter()
+            .map(|ls| {
+                let (ls, _, ring_repairs) = repair_ring(ls, false);
+                repairs += ring_repairs;
+                ls
+            })
+            .collect();
+        (Polygon::new(exterior, interiors), positions, repairs)
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use crate::extensions::repair::{Repair, Repairs};
+    use geo::{polygon, LineString, Polygon, Winding};
+
+    #[test]
+    fn repair_test() {
+        // Open, counter-clockwise, with a duplicate and a straight run across the seam
+        let ring: LineString<f64> = vec![
+            (1.0, 0.0),
+            (2.0, 0.0),
+            (2.0, 2.0),
+            (2.0, 2.0),
+            (0.0, 2.0),
+            (0.0, 1.0),
+            (0.0, 0.0),
+        ]
+        .into();
+        let (repaired, positions, repairs) = ring.repair_positions();
+
+        let correct =
+            polygon![(x: 2.0, y: 0.0), (x: 2.0, y: 2.0), (x: 0.0, y: 2.0), (x: 0.0, y: 0.0)];
+        assert!(repaired.is_closed());
+        assert!(repaired.is_cw());
+        assert_eq!(repaired.0.len(), correct.exterior().0.len());
+        assert_eq!(repaired.0[0], correct.exterior().0[0]);
+        assert_eq!(positions, vec![1, 6, 4, 2, 1]);
+        assert!(positions
+            .iter()
+            .zip(&repaired.0)
+            .all(|(&position, &coord)| ring.0[position] == coord));
+        assert_eq!(
+            repairs,
+            Repairs {
+                closed: 1,
+                reversed: 1,
+                duplicates: 1,
+                collinear: 2,
+            }
+        );
+    }
+
+    #[test]
+    fn valid_test() {
+        let poly: Polygon<f64> =
+            polygon![(x: 0.0, y: 0.0), (x: 0.0, y: 1.0), (x: 1.0, y: 1.0), (x: 1.0, y: 0.0)];
+        let (repaired, repairs) = poly.repair();
+
+        assert!(repairs.is_empty());
+        assert_eq!(repaired, poly);
+    }
+}
@@ -19,6 +19,7 @@
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
 use crate::algorithms::hull_melkman::Melkman;
+use crate::extensions::stats::{self, Phase};
 use geo::{GeoNum, LineString, Polygon};
 
 pub trait HullSegments<T: GeoNum> {
@@ -27,6 +28,7 @@ pub trait HullSegments<T: GeoNum> {
 
 impl<T: GeoNum> HullSegments<T> for Polygon<T> {
     fn hull_segments(&self) -> Vec<LineString<T>> {
+        let _span = stats::span(Phase::Segmentation);
         let coord_vec = &self.exterior().0;
         self.hull_indices()
             .windows(2)
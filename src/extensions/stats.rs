@@ -0,0 +1,229 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+//! Opt-in timing of each phase of a reduction, and counting of the work done within it.
+//!
+//! Timings and counts are added to process-wide totals, but only while a [`Collector`] is active.
+//! Algorithms count into a local [`Counters`] and record it once they finish, so that their loops
+//! never touch shared state. When no collector is active, recording is a single relaxed load and
+//! no clock is read.
+
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering::Relaxed};
+use std::time::Instant;
+
+/// Number of collectors currently active.
+static ACTIVE: AtomicUsize = AtomicUsize::new(0);
+
+static PHASES: [AtomicU64; Phase::ALL.len()] = [const { AtomicU64::new(0) }; Phase::ALL.len()];
+static COUNTERS: [AtomicU64; Counters::NAMES.len()] =
+    [const { AtomicU64::new(0) }; Counters::NAMES.len()];
+static MAX_DEPTH: AtomicU64 = AtomicU64::new(0);
+
+/// Whether timings and counts are being collected.
+#[inline]
+pub fn enabled() -> bool {
+    ACTIVE.load(Relaxed) > 0
+}
+
+/// A stage of a reduction, timed separately.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum Phase {
+    /// Reading coordinates from a buffer.
+    Input,
+    Validation,
+    Winding,
+    /// Splitting the exterior between convex hull vertices.
+    Segmentation,
+    Triangulation,
+    /// The main loop of the reduction algorithm.
+    Reduction,
+    /// Writing the reduced coordinates into a NumPy array.
+    Output,
+}
+
+impl Phase {
+    pub const ALL: [Phase; 7] = [
+        Phase::Input,
+        Phase::Validation,
+        Phase::Winding,
+        Phase::Segmentation,
+        Phase::Triangulation,
+        Phase::Reduction,
+        Phase::Output,
+    ];
+
+    pub fn name(self) -> &'static str {
+        match self {
+            Phase::Input => "input",
+            Phase::Validation => "validation",
+            Phase::Winding => "winding",
+            Phase::Segmentation => "segmentation",
+            Phase::Triangulation => "triangulation",
+            Phase::Reduction => "reduction",
+            Phase::Output => "output",
+        }
+    }
+}
+
+/// Times a phase from its creation until it is dropped, if collection is enabled.
+#[must_use]
+pub struct Span {
+    phase: Phase,
+    start: Option<Instant>,
+}
+
+impl Drop for Span {
+    fn drop(&mut self) {
+        if let Some(start) = self.start {
+            let nanos = start.elapsed().as_nanos() as u64;
+            PHASES[self.phase as usize].fetch_add(nanos, Relaxed);
+        }
+    }
+}
+
+/// Start timing a phase, which ends when the returned span is dropped.
+#[inline]
+pub fn span(phase: Phase) -> Span {
+    Span {
+        phase,
+        start: enabled().then(Instant::now),
+    }
+}
+
+/// Run a closure, timing it as the given phase.
+#[inline]
+pub fn timed<R>(phase: Phase, f: impl FnOnce() -> R) -> R {
+    let _span = span(phase);
+    f()
+}
+
+/// Record the depth reached by a recursion.
+#[inline]
+pub fn record_depth(depth: usize) {
+    // Only contend for the maximum when it is exceeded
+    if enabled() && depth as u64 > MAX_DEPTH.load(Relaxed) {
+        MAX_DEPTH.fetch_max(depth as u64, Relaxed);
+    }
+}
+
+/// Work done by an algorithm, counted locally and recorded once it finishes.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct Counters {
+    pub heap_pushes: u64,
+    pub heap_pops: u64,
+    /// Heap entries popped after they were invalidated by an earlier removal.
+    pub stale_skipped: u64,
+    /// Segments found by the spatial index, and tested for intersection with a new chord.
+    pub intersection_candidates: u64,
+    /// Triangulation edges crossed by visibility queries.
+    pub visibility_edges: u64,
+}
+
+impl Counters {
+    pub const NAMES: [&'static str; 5] = [
+        "heap_pushes",
+        "heap_pops",
+        "stale_skipped",
+        "intersection_candidates",
+        "visibility_edges",
+    ];
+
+    fn values(&self) -> [u64; 5] {
+        [
+            self.heap_pushes,
+            self.heap_pops,
+            self.stale_skipped,
+            self.intersection_candidates,
+            self.visibility_edges,
+        ]
+    }
+
+    /// Add the counts to the process-wide totals, if collection is enabled.
+    #[inline]
+    pub fn record(&self) {
+        if !enabled() {
+            return;
+        }
+        for (total, value) in COUNTERS.iter().zip(self.values()) {
+            if value > 0 {
+                total.fetch_add(value, Relaxed);
+            }
+        }
+    }
+}
+
+/// Timings and counts, as collected over some stretch of time.
+#[derive(Clone, Debug, Default, PartialEq)]
+pub struct Stats {
+    /// Nanoseconds spent in each phase, in the order of [`Phase::ALL`], summed over every
+    /// thread.
+    pub phases: [u64; Phase::ALL.len()],
+    /// Counts, in the order of [`Counters::NAMES`].
+    pub counters: [u64; Counters::NAMES.len()],
+    pub max_depth: u64,
+}
+
+fn totals() -> ([u64; Phase::ALL.len()], [u64; Counters::NAMES.len()]) {
+    (
+        PHASES.each_ref().map(|total| total.load(Relaxed)),
+        COUNTERS.each_ref().map(|total| total.load(Relaxed)),
+    )
+}
+
+/// Collects the timings and counts recorded from its creation until it is finished or dropped.
+///
+/// Totals are shared by the whole process, so reductions running concurrently on other threads
+/// are collected too. Collectors may be nested.
+pub struct Collector {
+    phases: [u64; Phase::ALL.len()],
+    counters: [u64; Counters::NAMES.len()],
+    /// The deepest recursion recorded before this collector began.
+    outer_depth: u64,
+}
+
+impl Collector {
+    pub fn begin() -> Self {
+        let (phases, counters) = totals();
+        let outer_depth = MAX_DEPTH.swap(0, Relaxed);
+        ACTIVE.fetch_add(1, Relaxed);
+        Collector {
+            phases,
+            counters,
+            outer_depth,
+        }
+    }
+
+    pub fn finish(self) -> Stats {
+        let (phases, counters) = totals();
+        let max_depth = MAX_DEPTH.fetch_max(self.outer_depth, Relaxed);
+
+        Stats {
+            phases: std::array::from_fn(|i| phases[i] - self.phases[i]),
+            counters: std::array::from_fn(|i| counters[i] - self.counters[i]),
+            max_depth,
+        }
+    }
+}
+
+impl Drop for Collector {
+    fn drop(&mut self) {
+        ACTIVE.fetch_sub(1, Relaxed);
+    }
+}
@@ -0,0 +1,157 @@
+// Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// In applying this licence, ECMWF does not waive the privileges and immunities
+// granted to it by virtue of its status as an intergovernmental organisation nor
+// does it submit to any jurisdiction.
+
+// Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+
+//! The thread pools on which reductions run.
+//!
+//! By default, reductions run on rayon's global pool, which has a thread for every core. A
+//! default number of threads may be set for the whole process and overridden on the calling
+//! thread. Reductions then run on a dedicated pool of that size. Pools are built on first use and
+//! kept for reuse, so that each call does not pay to start its threads. At most `MAX_POOLS` pools
+//! are kept, the least recently used being shut down once its reductions complete.
+
+use pyo3::Python;
+use rayon::{ThreadPool, ThreadPoolBuilder};
+use std::cell::Cell;
+use std::sync::atomic::{AtomicUsize, Ordering::Relaxed};
+use std::sync::{Arc, LazyLock, Mutex, PoisonError};
+
+/// Number of threads reductions run on by default, or zero for the global pool.
+static DEFAULT_THREADS: AtomicUsize = AtomicUsize::new(0);
+
+/// Number of dedicated pools kept for reuse.
+const MAX_POOLS: usize = 4;
+
+/// Dedicated pools by number of threads, the most recently used first.
+static POOLS: LazyLock<Mutex<Vec<(usize, Arc<ThreadPool>)>>> = LazyLock::new(Default::default);
+
+thread_local! {
+    /// Number of threads reductions made on this thread run on, overriding the default.
+    static OVERRIDE: Cell<Option<usize>> = const { Cell::new(None) };
+}
+
+/// Set the number of threads reductions run on by default, or zero for the global pool.
+pub fn set_default_threads(num_threads: usize) {
+    DEFAULT_THREADS.store(num_threads, Relaxed);
+}
+
+/// Override the number of threads reductions made on the calling thread run on, returning the
+/// previous override.
+pub fn set_thread_override(num_threads: Option<usize>) -> Option<usize> {
+    OVERRIDE.replace(num_threads)
+}
+
+/// Number of threads configured for the calling thread, or zero for the global pool.
+fn configured_threads() -> usize {
+    OVERRIDE
+        .get()
+        .unwrap_or_else(|| DEFAULT_THREADS.load(Relaxed))
+}
+
+/// Number of threads reductions made on the calling thread run on.
+pub fn current_threads() -> usize {
+    match configured_threads() {
+        0 => rayon::current_num_threads(),
+        num_threads => num_threads,
+    }
+}
+
+/// The dedicated pool with the given number of threads.
+fn pool(num_threads: usize) -> Arc<ThreadPool> {
+    let mut pools = POOLS.lock().unwrap_or_else(PoisonError::into_inner);
+    let pool = match pools.iter().position(|&(n, _)| n == num_threads) {
+        Some(position) => pools.remove(position).1,
+        None => {
+            let pool = ThreadPoolBuilder::new()
+                .num_threads(num_threads)
+                .thread_name(move |i| format!("polyshell-{num_threads}-{i}"))
+                .build()
+                .expect("Failed to start thread pool");
+            Arc::new(pool)
+        }
+    };
+
+    // Pools evicted while in use are shut down once the last reduction on them completes
+    pools.insert(0, (num_threads, pool.clone()));
+    pools.truncate(MAX_POOLS);
+    pool
+}
+
+/// Run `f` on the pool configured for the calling thread, blocking until it completes.
+pub fn install<T, F>(f: F) -> T
+where
+    T: Send,
+    F: FnOnce() -> T + Send,
+{
+    match configured_threads() {
+        0 => f(),
+        num_threads => pool(num_threads).install(f),
+    }
+}
+
+/// Run `f` detached on the pool currently selected for the calling thread, returning at once
+/// without waiting for it to complete.
+pub fn spawn<F>(f: F)
+where
+    F: FnOnce() + Send + 'static,
+{
+    match configured_threads() {
+        0 => rayon::spawn(f),
+        num_threads => pool(num_threads).spawn(f),
+    }
+}
+
+/// Release the GIL, and run `f` on the pool configured for the calling thread.
+pub fn allow_threads<T, F>(py: Python<'_>, f: F) -> T
+where
+    T: Send,
+    F: FnOnce() -> T + Send,
+{
+    // The closure runs on the calling thread, so its override still applies
+    py.allow_threads(|| install(f))
+}
+
+#[cfg(test)]
+mod test {
+    use crate::extensions::threads::{
+        current_threads, install, pool, set_thread_override, MAX_POOLS, POOLS,
+    };
+    use rayon::prelude::*;
+
+    #[test]
+    fn override_test() {
+        let previous = set_thread_override(Some(2));
+        assert_eq!(current_threads(), 2);
+        assert_eq!(install(rayon::current_num_threads), 2);
+        assert_eq!(install(|| (0..100).into_par_iter().sum::<i32>()), 4950);
+
+        set_thread_override(Some(1));
+        assert_eq!(install(rayon::current_num_threads), 1);
+
+        set_thread_override(previous);
+    }
+
+    #[test]
+    fn eviction_test() {
+        for num_threads in 1..=6 {
+            assert_eq!(pool(num_threads).current_num_threads(), num_threads);
+        }
+        assert!(POOLS.lock().unwrap().len() <= MAX_POOLS);
+    }
+}
@@ -18,6 +18,7 @@
 
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
+use crate::extensions::stats::{self, Phase};
 use geo::{CoordsIter, GeoNum, Polygon};
 use spade::{ConstrainedDelaunayTriangulation, Point2, SpadeNum};
 
@@ -30,6 +31,7 @@ where
     T: SpadeNum + GeoNum,
 {
     fn triangulate(&self) -> ConstrainedDelaunayTriangulation<Point2<T>> {
+        let _span = stats::span(Phase::Triangulation);
         let num_vertices = self.exterior().0.len() - 1;
 
         let vertices = self
@@ -18,16 +18,27 @@
 
 // Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
 
+use crate::extensions::stats::{self, Phase};
+use geo::coordinate_position::{CoordPos, CoordinatePosition};
 use geo::sweep::{Cross, Intersections};
-use geo::{GeoFloat, GeoNum, HasDimensions, Line, Polygon};
+use geo::{
+    BoundingRect, GeoFloat, GeoNum, HasDimensions, Line, LineIntersection, LineString, Polygon,
+};
+use rayon::prelude::*;
+use rstar::primitives::{GeomWithData, Rectangle};
+use rstar::{RTree, RTreeNum};
 use std::error::Error;
 use std::fmt;
+use std::iter;
+use std::sync::atomic::{AtomicBool, Ordering::Relaxed};
 
 #[derive(Debug)]
 pub enum InvalidPolygon {
     TooFewPoints,
     OpenChain,
     SelfIntersection,
+    RingIntersection,
+    HoleOutside,
     NonFiniteCoord(usize),
 }
 
@@ -39,6 +50,8 @@ impl fmt::Display for InvalidPolygon {
             }
             InvalidPolygon::OpenChain => write!(f, "Polygon is not closed"),
             InvalidPolygon::SelfIntersection => write!(f, "Polygon has a self-intersection"),
+            InvalidPolygon::RingIntersection => write!(f, "Polygon has intersecting rings"),
+            InvalidPolygon::HoleOutside => write!(f, "Polygon has a hole outside its exterior"),
             InvalidPolygon::NonFiniteCoord(index) => {
                 write!(f, "Polygon has a non-finite coordinate at index {index}")
             }
@@ -48,8 +61,15 @@ impl fmt::Display for InvalidPolygon {
 
 impl Error for InvalidPolygon {}
 
+/// Polygons with fewer segments than this are swept in a single pass.
+const PARALLEL_THRESHOLD: usize = 1 << 12;
+
+/// Number of strips swept by each thread.
+const STRIPS_PER_THREAD: usize = 4;
+
 #[derive(Clone, Debug)]
 struct IndexedLine<T: GeoNum> {
+    ring: usize,
     index: usize,
     line: Line<T>,
 }
@@ -69,6 +89,7 @@ pub trait Validate: Sized {
     }
 
     fn validate(self) -> Result<Self, InvalidPolygon> {
+        let _span = stats::span(Phase::Validation);
         match self.check_validate() {
             Ok(()) => Ok(self),
             Err(e) => Err(e),
@@ -76,47 +97,271 @@ pub trait Validate: Sized {
     }
 }
 
-impl<T: GeoFloat> Validate for Polygon<T> {
-    fn check_validate(&self) -> Result<(), InvalidPolygon> {
-        let ls = self.exterior();
+/// Check a single ring for size, closure and finite-ness.
+fn check_ring<T: GeoFloat>(ls: &LineString<T>) -> Result<(), InvalidPolygon> {
+    // Check number of points
+    if ls.0.len() < 4 {
+        return Err(InvalidPolygon::TooFewPoints);
+    }
 
-        // Check number of points
-        if self.is_empty() {
-            return Ok(());
+    // Check for closure
+    if ls.0.first() != ls.0.last() {
+        return Err(InvalidPolygon::OpenChain);
+    }
+
+    // Check for finite-ness
+    for (index, coord) in ls.0.iter().enumerate() {
+        if !(coord.x.is_finite() && coord.y.is_finite()) {
+            return Err(InvalidPolygon::NonFiniteCoord(index));
         }
-        if ls.0.len() < 4 {
-            return Err(InvalidPolygon::TooFewPoints);
+    }
+
+    Ok(())
+}
+
+/// Split segments into vertical strips holding similar numbers of segments.
+///
+/// A segment is placed in every strip its horizontal extent overlaps, so any two segments which
+/// intersect share at least one strip.
+fn partition<T: GeoFloat>(lines: Vec<IndexedLine<T>>, count: usize) -> Vec<Vec<IndexedLine<T>>> {
+    let extent = |line: &Line<T>| (line.start.x.min(line.end.x), line.start.x.max(line.end.x));
+
+    // Coordinates are finite, so can always be compared
+    let mut xs = lines.iter().map(|l| extent(&l.line).0).collect::<Vec<_>>();
+    xs.par_sort_unstable_by(|a, b| a.partial_cmp(b).unwrap());
+
+    // Strip i spans the closed interval between bounds i - 1 and i
+    let bounds = (1..count)
+        .map(|i| xs[i * xs.len() / count])
+        .collect::<Vec<_>>();
+
+    let mut strips = vec![Vec::new(); count];
+    for line in lines {
+        let (min, max) = extent(&line.line);
+        let first = bounds.partition_point(|&bound| bound < min);
+        let last = bounds.partition_point(|&bound| bound <= max);
+        for strip in &mut strips[first..=last] {
+            strip.push(line.clone());
         }
+    }
+    strips
+}
 
-        // Check for closure
-        if ls.0.first() != ls.0.last() {
-            return Err(InvalidPolygon::OpenChain);
+/// Sweep a set of segments, returning on the first crossing.
+///
+/// Once a crossing is found, `stop` is set, and any other sweep sharing it gives up early.
+fn sweep<T: GeoFloat>(
+    rings: &[&LineString<T>],
+    lines: Vec<IndexedLine<T>>,
+    stop: &AtomicBool,
+) -> Result<(), InvalidPolygon> {
+    let intersections_iter = Intersections::from_iter(lines);
+
+    for (line1, line2, intersection) in intersections_iter {
+        if stop.load(Relaxed) {
+            return Ok(());
         }
 
-        // Check for finite-ness
-        for (index, coord) in ls.0.iter().enumerate() {
-            if !(coord.x.is_finite() && coord.y.is_finite()) {
-                return Err(InvalidPolygon::NonFiniteCoord(index));
+        let crossing = if line1.ring != line2.ring {
+            // Rings may touch at a point, but never cross
+            match intersection {
+                LineIntersection::SinglePoint {
+                    is_proper: false, ..
+                } => continue,
+                _ => InvalidPolygon::RingIntersection,
             }
+        } else {
+            let idx1 = line1.index;
+            let idx2 = line2.index;
+            let len = rings[line1.ring].0.len();
+
+            if (idx1 as isize - idx2 as isize).abs() > 1 && idx1 + idx2 + 2 < len {
+                InvalidPolygon::SelfIntersection
+            } else {
+                continue;
+            }
+        };
+
+        stop.store(true, Relaxed);
+        return Err(crossing);
+    }
+
+    Ok(())
+}
+
+impl<T: GeoFloat + Send + Sync> Validate for Polygon<T> {
+    /// Large polygons are split into vertical strips which are swept in parallel, stopping at the
+    /// first crossing found.
+    fn check_validate(&self) -> Result<(), InvalidPolygon> {
+        if self.is_empty() {
+            return Ok(());
+        }
+
+        let rings = iter::once(self.exterior())
+            .chain(self.interiors())
+            .collect::<Vec<_>>();
+        for ls in &rings {
+            check_ring(ls)?;
         }
 
-        // Check for self-intersections
-        let lines = ls
-            .lines()
+        // Check for self-intersections, and intersections between rings
+        let lines = rings
+            .iter()
             .enumerate()
-            .map(|(index, line)| IndexedLine { index, line });
+            .flat_map(|(ring, ls)| {
+                ls.lines()
+                    .enumerate()
+                    .map(move |(index, line)| IndexedLine { ring, index, line })
+            })
+            .collect::<Vec<_>>();
 
-        let intersections_iter = Intersections::from_iter(lines);
+        let stop = AtomicBool::new(false);
+        if lines.len() < PARALLEL_THRESHOLD {
+            sweep(&rings, lines, &stop)?;
+        } else {
+            let count = rayon::current_num_threads() * STRIPS_PER_THREAD;
+            partition(lines, count)
+                .into_par_iter()
+                .map(|strip| sweep(&rings, strip, &stop))
+                .find_any(Result::is_err)
+                .unwrap_or(Ok(()))?;
+        }
 
-        for (line1, line2, _) in intersections_iter {
-            let idx1 = line1.index;
-            let idx2 = line2.index;
+        if self.interiors().is_empty() {
+            return Ok(());
+        }
 
-            if (idx1 as isize - idx2 as isize).abs() > 1 && idx1 + idx2 + 2 < ls.0.len() {
-                return Err(InvalidPolygon::SelfIntersection);
-            }
+        // Rings never cross, so each hole lies wholly inside or outside the exterior
+        let exterior = Polygon::new(self.exterior().clone(), vec![]);
+        if self
+            .interiors()
+            .par_iter()
+            .any(|ls| ring_position(&exterior, ls) == Some(CoordPos::Outside))
+        {
+            return Err(InvalidPolygon::HoleOutside);
         }
 
         Ok(())
     }
 }
+
+/// Build a polygon from its rings as given, rejecting any ring which is open.
+///
+/// `Polygon::new` closes open rings, which would otherwise hide them from validation.
+pub fn closed_polygon<T: GeoFloat>(
+    exterior: LineString<T>,
+    interiors: Vec<LineString<T>>,
+) -> Result<Polygon<T>, InvalidPolygon> {
+    if !(exterior.is_closed() && interiors.iter().all(LineString::is_closed)) {
+        return Err(InvalidPolygon::OpenChain);
+    }
+    Ok(Polygon::new(exterior, interiors))
+}
+
+/// Position of a ring relative to a polygon, given by its first vertex not on the boundary.
+///
+/// Only meaningful for a ring which does not cross the boundary of the polygon. Returns `None` if
+/// every vertex lies on the boundary.
+fn ring_position<T: GeoFloat>(polygon: &Polygon<T>, ring: &LineString<T>) -> Option<CoordPos> {
+    ring.0
+        .iter()
+        .map(|coord| polygon.coordinate_position(coord))
+        .find(|&position| position != CoordPos::OnBoundary)
+}
+
+/// Find the parts of a multi-polygon which collide with another part of the same group.
+///
+/// Parts are assumed to be valid on their own. They may touch at a point, but any crossing
+/// between their rings, or a part lying inside another, is a collision. Returns the indices of the
+/// colliding parts in order.
+pub fn colliding_parts<T>(parts: &[Polygon<T>], groups: &[usize]) -> Vec<usize>
+where
+    T: GeoFloat + RTreeNum + Send + Sync,
+{
+    // Rings are numbered across every part, and mapped back to the part they belong to
+    let owners = parts
+        .iter()
+        .enumerate()
+        .flat_map(|(part, polygon)| iter::repeat_n(part, polygon.interiors().len() + 1))
+        .collect::<Vec<_>>();
+    let lines = parts
+        .iter()
+        .flat_map(|polygon| iter::once(polygon.exterior()).chain(polygon.interiors()))
+        .enumerate()
+        .flat_map(|(ring, ls)| {
+            ls.lines()
+                .enumerate()
+                .map(move |(index, line)| IndexedLine { ring, index, line })
+        })
+        .collect::<Vec<_>>();
+
+    let crossings = |lines: Vec<IndexedLine<T>>| {
+        Intersections::from_iter(lines)
+            .map(|(line1, line2, intersection)| {
+                (owners[line1.ring], owners[line2.ring], intersection)
+            })
+            .filter(|&(a, b, ref intersection)| {
+                a != b
+                    && groups[a] == groups[b]
+                    && !matches!(
+                        intersection,
+                        LineIntersection::SinglePoint {
+                            is_proper: false,
+                            ..
+                        }
+                    )
+            })
+            .map(|(a, b, _)| (a, b))
+            .collect::<Vec<_>>()
+    };
+    let crossed = if lines.len() < PARALLEL_THRESHOLD {
+        crossings(lines)
+    } else {
+        let count = rayon::current_num_threads() * STRIPS_PER_THREAD;
+        partition(lines, count)
+            .into_par_iter()
+            .flat_map_iter(crossings)
+            .collect()
+    };
+
+    // Parts which never cross may still lie one inside another, such as an island left in the
+    // body of a part once the hole around it has shrunk away
+    let tree = RTree::bulk_load(
+        parts
+            .iter()
+            .enumerate()
+            .filter_map(|(part, polygon)| {
+                let rect = polygon.bounding_rect()?;
+                let corners = [rect.min(), rect.max()].map(|c| [c.x, c.y]);
+                Some(GeomWithData::new(
+                    Rectangle::from_corners(corners[0], corners[1]),
+                    part,
+                ))
+            })
+            .collect(),
+    );
+    let inside = parts
+        .par_iter()
+        .enumerate()
+        .flat_map_iter(|(part, polygon)| {
+            let Some(first) = polygon.exterior().0.first() else {
+                return Vec::new();
+            };
+            tree.locate_all_at_point(&[first.x, first.y])
+                .map(|candidate| candidate.data)
+                .filter(|&other| other != part && groups[other] == groups[part])
+                .filter(|&other| {
+                    ring_position(&parts[other], polygon.exterior()) == Some(CoordPos::Inside)
+                })
+                .map(|other| (part, other))
+                .collect()
+        })
+        .collect::<Vec<_>>();
+
+    let mut colliding = vec![false; parts.len()];
+    for (a, b) in crossed.into_iter().chain(inside) {
+        colliding[a] = true;
+        colliding[b] = true;
+    }
+    (0..parts.len()).filter(|&part| colliding[part]).collect()
+}
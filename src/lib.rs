@@ -21,11 +21,28 @@
 use crate::extensions::validation::InvalidPolygon;
 use algorithms::simplify_charshape::SimplifyCharshape;
 use algorithms::simplify_rdp::SimplifyRDP;
-use algorithms::simplify_vw::SimplifyVW;
-use extensions::validation::Validate;
-use geo::{Polygon, Winding};
-use pyo3::exceptions::PyValueError;
+use algorithms::simplify_vw::{SegmentIndex, SimplifyVW};
+use extensions::conversions::{
+    flat_into_pyarrays, flatten_linestrings, indices_into_pyarray, linestring_from_buffer,
+    linestring_into_pyarray, linestrings_from_buffers, ring_positions,
+};
+use extensions::prepared::PreparedPolygon;
+use extensions::profile::Profile;
+use extensions::reduce::{par_map_balanced, reduce_disjoint, Reduce, ReductionMethod};
+use extensions::repair::{Repair, Repairs};
+use extensions::stats::{self, Collector, Counters, Phase, Stats};
+use extensions::threads;
+use extensions::validation::{closed_polygon, Validate};
+use geo::{GeoFloat, LineString, Polygon, Winding};
+use numpy::{PyArray1, PyArray2};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+use rstar::RTreeNum;
+use spade::SpadeNum;
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering::Relaxed};
+use std::sync::Arc;
 
 mod algorithms;
 mod extensions;
@@ -37,92 +54,1139 @@ impl From<InvalidPolygon> for PyErr {
     }
 }
 
+impl<'py> FromPyObject<'py> for ReductionMethod {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        match ob.extract::<String>()?.as_str() {
+            "charshape" => Ok(ReductionMethod::Charshape),
+            "rdp" => Ok(ReductionMethod::Rdp),
+            "vw" => Ok(ReductionMethod::Vw),
+            other => Err(PyValueError::new_err(format!(
+                "Unknown reduction method {other:?}"
+            ))),
+        }
+    }
+}
+
+/// Select the spatial index used to check for self-intersection.
+fn segment_index(live_index: bool) -> SegmentIndex {
+    if live_index {
+        SegmentIndex::Live
+    } else {
+        SegmentIndex::Static
+    }
+}
+
 #[pyfunction]
-fn reduce_polygon_vw(orig: Vec<[f64; 2]>, eps: f64, len: usize) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let mut polygon = Polygon::new(orig.into(), vec![]).validate()?;
-    polygon.exterior_mut(|ls| ls.make_cw_winding());
+#[pyo3(signature = (orig, eps, len, *, live_index = false))]
+fn reduce_polygon_vw(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    eps: f64,
+    len: usize,
+    live_index: bool,
+) -> PyResult<Vec<(f64, f64)>> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate a Polygon from a Vec of coordinates
+        let mut polygon = closed_polygon(orig.into(), vec![])?.validate()?;
+        stats::timed(Phase::Winding, || {
+            polygon.exterior_mut(|ls| ls.make_cw_winding())
+        });
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_vw(eps, len).into_inner();
-    let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+        // Reduce and extract coordinates
+        let index = segment_index(live_index);
+        let (exterior, _) = polygon.simplify_vw_indexed(eps, len, index).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
 
-    Ok(coords)
+        Ok(coords)
+    })
 }
 
 #[pyfunction]
+#[pyo3(signature = (orig, eps, len, *, live_index = false))]
 fn reduce_polygon_vw_unchecked(
+    py: Python<'_>,
     orig: Vec<[f64; 2]>,
     eps: f64,
     len: usize,
+    live_index: bool,
 ) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let polygon = Polygon::new(orig.into(), vec![]);
+    threads::allow_threads(py, || {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = Polygon::new(orig.into(), vec![]);
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_vw(eps, len).into_inner();
-    let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+        // Reduce and extract coordinates
+        let index = segment_index(live_index);
+        let (exterior, _) = polygon.simplify_vw_indexed(eps, len, index).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
 
-    Ok(coords)
+        Ok(coords)
+    })
 }
 
 #[pyfunction]
-fn reduce_polygon_char(orig: Vec<[f64; 2]>, eps: f64, len: usize) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let polygon = Polygon::new(orig.into(), vec![]).validate()?;
+fn reduce_polygon_char(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Vec<(f64, f64)>> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = closed_polygon(orig.into(), vec![])?.validate()?;
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_charshape(eps, len).into_inner();
-    let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+        // Reduce and extract coordinates
+        let (exterior, _) = polygon.simplify_charshape(eps, len).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
 
-    Ok(coords)
+        Ok(coords)
+    })
 }
 
 #[pyfunction]
 fn reduce_polygon_char_unchecked(
+    py: Python<'_>,
     orig: Vec<[f64; 2]>,
     eps: f64,
     len: usize,
 ) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let polygon = Polygon::new(orig.into(), vec![]);
+    threads::allow_threads(py, || {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = Polygon::new(orig.into(), vec![]);
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_charshape(eps, len).into_inner();
-    let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+        // Reduce and extract coordinates
+        let (exterior, _) = polygon.simplify_charshape(eps, len).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
 
-    Ok(coords)
+        Ok(coords)
+    })
 }
 
 #[pyfunction]
-fn reduce_polygon_rdp(orig: Vec<[f64; 2]>, eps: f64) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let mut polygon = Polygon::new(orig.into(), vec![]).validate()?;
-    polygon.exterior_mut(|ls| ls.make_cw_winding());
+fn reduce_polygon_rdp(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Vec<(f64, f64)>> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate a Polygon from a Vec of coordinates
+        let mut polygon = closed_polygon(orig.into(), vec![])?.validate()?;
+        stats::timed(Phase::Winding, || {
+            polygon.exterior_mut(|ls| ls.make_cw_winding())
+        });
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_rdp(eps).into_inner();
-    let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+        // Reduce and extract coordinates
+        let (exterior, _) = polygon.simplify_rdp(eps, len).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+
+        Ok(coords)
+    })
+}
+
+#[pyfunction]
+fn reduce_polygon_rdp_unchecked(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Vec<(f64, f64)>> {
+    threads::allow_threads(py, || {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = Polygon::new(orig.into(), vec![]);
+
+        // Reduce and extract coordinates
+        let (exterior, _) = polygon.simplify_rdp(eps, len).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+
+        Ok(coords)
+    })
+}
 
-    Ok(coords)
+#[pyfunction]
+#[pyo3(signature = (orig, eps, len, *, live_index = false))]
+fn reduce_polygon_vw_array<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+    live_index: bool,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = closed_polygon(linestring_from_buffer(py, &orig)?, vec![])?;
+
+    // Reduce without holding the GIL
+    let exterior = threads::allow_threads(py, || -> PyResult<_> {
+        let mut polygon = polygon.validate()?;
+        stats::timed(Phase::Winding, || {
+            polygon.exterior_mut(|ls| ls.make_cw_winding())
+        });
+
+        let index = segment_index(live_index);
+        let (exterior, _) = polygon.simplify_vw_indexed(eps, len, index).into_inner();
+        Ok(exterior)
+    })?;
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+#[pyfunction]
+#[pyo3(signature = (orig, eps, len, *, live_index = false))]
+fn reduce_polygon_vw_array_unchecked<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+    live_index: bool,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = Polygon::new(linestring_from_buffer(py, &orig)?, vec![]);
+
+    // Reduce without holding the GIL
+    let index = segment_index(live_index);
+    let (exterior, _) =
+        threads::allow_threads(py, || polygon.simplify_vw_indexed(eps, len, index)).into_inner();
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+#[pyfunction]
+fn reduce_polygon_char_array<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = closed_polygon(linestring_from_buffer(py, &orig)?, vec![])?;
+
+    // Reduce without holding the GIL
+    let exterior = threads::allow_threads(py, || -> PyResult<_> {
+        let polygon = polygon.validate()?;
+
+        let (exterior, _) = polygon.simplify_charshape(eps, len).into_inner();
+        Ok(exterior)
+    })?;
+
+    Ok(linestring_into_pyarray(py, exterior))
 }
 
 #[pyfunction]
-fn reduce_polygon_rdp_unchecked(orig: Vec<[f64; 2]>, eps: f64) -> PyResult<Vec<(f64, f64)>> {
-    // Instantiate a Polygon from a Vec of coordinates
-    let polygon = Polygon::new(orig.into(), vec![]);
+fn reduce_polygon_char_array_unchecked<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = Polygon::new(linestring_from_buffer(py, &orig)?, vec![]);
+
+    // Reduce without holding the GIL
+    let (exterior, _) =
+        threads::allow_threads(py, || polygon.simplify_charshape(eps, len)).into_inner();
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+#[pyfunction]
+fn reduce_polygon_rdp_array<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = closed_polygon(linestring_from_buffer(py, &orig)?, vec![])?;
+
+    // Reduce without holding the GIL
+    let exterior = threads::allow_threads(py, || -> PyResult<_> {
+        let mut polygon = polygon.validate()?;
+        stats::timed(Phase::Winding, || {
+            polygon.exterior_mut(|ls| ls.make_cw_winding())
+        });
+
+        let (exterior, _) = polygon.simplify_rdp(eps, len).into_inner();
+        Ok(exterior)
+    })?;
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
 
-    // Reduce and extract coordinates
-    let (exterior, _) = polygon.simplify_rdp(eps).into_inner();
+#[pyfunction]
+fn reduce_polygon_rdp_array_unchecked<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    eps: f64,
+    len: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = Polygon::new(linestring_from_buffer(py, &orig)?, vec![]);
+
+    // Reduce without holding the GIL
+    let (exterior, _) = threads::allow_threads(py, || polygon.simplify_rdp(eps, len)).into_inner();
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+#[pyfunction]
+fn reduce_polygon_auto(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    method: ReductionMethod,
+) -> PyResult<Vec<(f64, f64)>> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = closed_polygon(orig.into(), vec![])?.prepare(method)?;
+
+        // Reduce and extract coordinates
+        let (exterior, _) = polygon.reduce_auto(method).into_inner();
+        let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+
+        Ok(coords)
+    })
+}
+
+#[pyfunction]
+fn reduce_polygon_auto_array<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    method: ReductionMethod,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let polygon = closed_polygon(linestring_from_buffer(py, &orig)?, vec![])?;
+
+    // Reduce without holding the GIL
+    let exterior = threads::allow_threads(py, || -> PyResult<_> {
+        let (exterior, _) = polygon.prepare(method)?.reduce_auto(method).into_inner();
+        Ok(exterior)
+    })?;
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+/// Reduce a polygon, returning the index of each retained vertex in the original ring.
+#[pyfunction]
+#[pyo3(signature = (orig, method, eps, len, *, checked = true, live_index = false))]
+fn reduce_polygon_indices<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    method: ReductionMethod,
+    eps: f64,
+    len: usize,
+    checked: bool,
+    live_index: bool,
+) -> PyResult<Bound<'py, PyAny>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let ring = linestring_from_buffer(py, &orig)?;
+    let size = ring.0.len();
+
+    // Reduce without holding the GIL, keeping the positions of the retained vertices
+    let indices = threads::allow_threads(py, || -> PyResult<_> {
+        let polygon = if checked {
+            closed_polygon(ring, vec![])?
+        } else {
+            Polygon::new(ring, vec![])
+        };
+        let closed_len = polygon.exterior().0.len();
+        let index = segment_index(live_index);
+        let (polygon, reversed) = if checked {
+            // Preparing winds the exterior clockwise for these methods by reversing it
+            let reversed = matches!(method, ReductionMethod::Rdp | ReductionMethod::Vw)
+                && polygon.exterior().is_ccw();
+            (polygon.prepare(method)?, reversed)
+        } else {
+            (polygon, false)
+        };
+        let mut indices = polygon.reduce_indices(method, eps, len, index);
+        ring_positions(&mut indices, closed_len, reversed);
+        Ok(indices)
+    })?;
+
+    Ok(indices_into_pyarray(py, indices, size))
+}
+
+/// Reduce a single precision polygon, running the reduction in `f32` throughout.
+#[pyfunction]
+#[pyo3(signature = (orig, method, eps, len, *, checked = true, live_index = false))]
+fn reduce_polygon_array_f32<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f32>,
+    method: ReductionMethod,
+    eps: f32,
+    len: usize,
+    checked: bool,
+    live_index: bool,
+) -> PyResult<Bound<'py, PyArray2<f32>>> {
+    // Instantiate a Polygon from a buffer of coordinates
+    let ring = linestring_from_buffer(py, &orig)?;
+    let polygon = if checked {
+        closed_polygon(ring, vec![])?
+    } else {
+        Polygon::new(ring, vec![])
+    };
+
+    // Reduce without holding the GIL
+    let exterior = threads::allow_threads(py, || -> PyResult<_> {
+        let index = segment_index(live_index);
+        let reduced = if checked {
+            polygon
+                .prepare(method)?
+                .reduce_indexed(method, eps, len, index)
+        } else {
+            polygon.reduce_indexed(method, eps, len, index)
+        };
+        Ok(reduced.into_inner().0)
+    })?;
+
+    Ok(linestring_into_pyarray(py, exterior))
+}
+
+/// Validate and reduce a batch of polygons in parallel, reporting the first invalid polygon.
+fn reduce_batch<T>(
+    polygons: Vec<Polygon<T>>,
+    method: ReductionMethod,
+    eps: T,
+    len: usize,
+    index: SegmentIndex,
+) -> PyResult<Vec<Polygon<T>>>
+where
+    T: GeoFloat + SpadeNum + RTreeNum + Send + Sync,
+{
+    batch_result(par_map_balanced(
+        polygons,
+        |polygon| -> Result<_, InvalidPolygon> {
+            Ok(polygon
+                .prepare(method)?
+                .reduce_indexed(method, eps, len, index))
+        },
+    ))
+}
+
+/// Build a polygon from each ring of a batch, reporting the first which is open.
+fn closed_batch<T: GeoFloat>(rings: Vec<LineString<T>>) -> PyResult<Vec<Polygon<T>>> {
+    batch_result(
+        rings
+            .into_iter()
+            .map(|ls| closed_polygon(ls, vec![]))
+            .collect(),
+    )
+}
+
+/// Collect the results of a batch, reporting the first invalid polygon.
+fn batch_result<R>(results: Vec<Result<R, InvalidPolygon>>) -> PyResult<Vec<R>> {
+    labelled_result(results, 0..)
+}
+
+/// Collect the results of a batch, reporting the first invalid polygon by its label.
+fn labelled_result<R>(
+    results: Vec<Result<R, InvalidPolygon>>,
+    labels: impl IntoIterator<Item = usize>,
+) -> PyResult<Vec<R>> {
+    results
+        .into_iter()
+        .zip(labels)
+        .map(|(result, label)| {
+            result.map_err(|err| PyValueError::new_err(format!("Polygon {label}: {err}")))
+        })
+        .collect()
+}
+
+#[pyfunction]
+#[pyo3(signature = (polygons, method, eps, len, *, live_index = false))]
+fn reduce_polygon_batch(
+    py: Python<'_>,
+    polygons: Vec<Vec<[f64; 2]>>,
+    method: ReductionMethod,
+    eps: f64,
+    len: usize,
+    live_index: bool,
+) -> PyResult<Vec<Vec<(f64, f64)>>> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate Polygons from Vecs of coordinates
+        let polygons = closed_batch(polygons.into_iter().map(LineString::from).collect())?;
+
+        // Reduce in parallel and extract coordinates
+        let reduced: Vec<Vec<_>> =
+            reduce_batch(polygons, method, eps, len, segment_index(live_index))?
+                .into_iter()
+                .map(|polygon| polygon.exterior().coords().map(|c| c.x_y()).collect())
+                .collect();
+
+        Ok(reduced)
+    })
+}
+
+type Ring = Vec<(f64, f64)>;
+
+#[pyfunction]
+#[pyo3(signature = (parts, method, eps, len, *, groups = None, live_index = false))]
+fn reduce_polygon_parts(
+    py: Python<'_>,
+    parts: Vec<(Vec<[f64; 2]>, Vec<Vec<[f64; 2]>>)>,
+    method: ReductionMethod,
+    eps: f64,
+    len: usize,
+    groups: Option<Vec<usize>>,
+    live_index: bool,
+) -> PyResult<Vec<(Ring, Vec<Ring>)>> {
+    // By default every part belongs to the same multi-polygon, and errors name the part
+    let labels = groups.clone().unwrap_or_else(|| (0..parts.len()).collect());
+    let groups = groups.unwrap_or_else(|| vec![0; parts.len()]);
+    if groups.len() != parts.len() {
+        return Err(PyValueError::new_err("Expected a group for every part"));
+    }
+
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate Polygons from exterior and interior coordinates
+        let polygons = labelled_result(
+            parts
+                .into_iter()
+                .map(|(exterior, interiors)| {
+                    let interiors = interiors.into_iter().map(LineString::from).collect();
+                    closed_polygon(exterior.into(), interiors)
+                })
+                .collect(),
+            labels.iter().copied(),
+        )?;
+
+        // Reduce each part in parallel, keeping parts apart, and extract coordinates
+        let polygons = labelled_result(
+            par_map_balanced(polygons, |polygon| polygon.prepare(method)),
+            labels.iter().copied(),
+        )?;
+        let index = segment_index(live_index);
+        let into_ring = |ls: LineString<f64>| -> Ring { ls.into_iter().map(|c| c.x_y()).collect() };
+        let reduced = reduce_disjoint(&polygons, &groups, method, eps, len, index)
+            .into_iter()
+            .map(|polygon| {
+                let (exterior, interiors) = polygon.into_inner();
+                (
+                    into_ring(exterior),
+                    interiors.into_iter().map(into_ring).collect(),
+                )
+            })
+            .collect();
+
+        Ok(reduced)
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (coords, offsets, method, eps, len, *, live_index = false))]
+fn reduce_polygon_batch_array<'py>(
+    py: Python<'py>,
+    coords: PyBuffer<f64>,
+    offsets: PyBuffer<i64>,
+    method: ReductionMethod,
+    eps: f64,
+    len: usize,
+    live_index: bool,
+) -> PyResult<(Bound<'py, PyArray2<f64>>, Bound<'py, PyArray1<i64>>)> {
+    // Split the coordinate buffer into rings
+    let rings = linestrings_from_buffers(py, &coords, &offsets)?;
+
+    // Reduce in parallel without holding the GIL
+    let flat = threads::allow_threads(py, || -> PyResult<_> {
+        let polygons = closed_batch(rings)?;
+        let reduced = reduce_batch(polygons, method, eps, len, segment_index(live_index))?
+            .into_iter()
+            .map(|polygon| polygon.into_inner().0)
+            .collect();
+        Ok(flatten_linestrings(reduced))
+    })?;
+
+    Ok(flat_into_pyarrays(py, flat))
+}
+
+#[pyfunction]
+#[pyo3(signature = (coords, offsets, method, eps, len, *, live_index = false))]
+fn reduce_polygon_batch_array_f32<'py>(
+    py: Python<'py>,
+    coords: PyBuffer<f32>,
+    offsets: PyBuffer<i64>,
+    method: ReductionMethod,
+    eps: f32,
+    len: usize,
+    live_index: bool,
+) -> PyResult<(Bound<'py, PyArray2<f32>>, Bound<'py, PyArray1<i64>>)> {
+    // Split the coordinate buffer into rings
+    let rings = linestrings_from_buffers(py, &coords, &offsets)?;
+
+    // Reduce in parallel, in single precision, without holding the GIL
+    let flat = threads::allow_threads(py, || -> PyResult<_> {
+        let polygons = closed_batch(rings)?;
+        let reduced = reduce_batch(polygons, method, eps, len, segment_index(live_index))?
+            .into_iter()
+            .map(|polygon| polygon.into_inner().0)
+            .collect();
+        Ok(flatten_linestrings(reduced))
+    })?;
+
+    Ok(flat_into_pyarrays(py, flat))
+}
+
+/// A polygon given to a background reduction, either as a coordinate buffer or a sequence.
+#[derive(FromPyObject)]
+enum TaskPolygon {
+    Array(PyBuffer<f64>),
+    Coords(Vec<[f64; 2]>),
+}
+
+/// The cancellation state of a background reduction, shared with the pool thread running it.
+#[derive(Default)]
+struct TaskState {
+    cancelled: AtomicBool,
+    skipped: AtomicUsize,
+}
+
+/// A batch of polygons reduced in the background, which may be cancelled.
+#[pyclass(frozen, name = "ReductionTask")]
+struct PyReductionTask {
+    state: Arc<TaskState>,
+}
+
+#[pymethods]
+impl PyReductionTask {
+    /// Skip every polygon of the batch not yet started.
+    fn cancel(&self) {
+        self.state.cancelled.store(true, Relaxed);
+    }
+
+    #[getter]
+    fn cancelled(&self) -> bool {
+        self.state.cancelled.load(Relaxed)
+    }
+
+    /// Number of polygons skipped since the task was cancelled.
+    #[getter]
+    fn skipped(&self) -> usize {
+        self.state.skipped.load(Relaxed)
+    }
+}
+
+/// Convert the polygons reduced by a background task, or `None` if any was cancelled.
+fn task_results<'py>(
+    py: Python<'py>,
+    reduced: Vec<Option<Result<Polygon<f64>, InvalidPolygon>>>,
+    arrays: &[bool],
+) -> PyResult<Option<Bound<'py, PyList>>> {
+    let mut results = Vec::with_capacity(reduced.len());
+    for (index, (result, &array)) in reduced.into_iter().zip(arrays).enumerate() {
+        let Some(result) = result else {
+            return Ok(None);
+        };
+        let polygon =
+            result.map_err(|err| PyValueError::new_err(format!("Polygon {index}: {err}")))?;
+        let (exterior, _) = polygon.into_inner();
+
+        // Polygons given as buffers are returned as arrays
+        let object = if array {
+            linestring_into_pyarray(py, exterior).into_any()
+        } else {
+            let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
+            coords.into_pyobject(py)?
+        };
+        results.push(object);
+    }
+    PyList::new(py, results).map(Some)
+}
+
+/// Reduce a batch of polygons in the background, returning without waiting for the result.
+///
+/// Once the batch is reduced, `callback` is called from a pool thread with the list of reduced
+/// polygons and an exception, either of which is `None`. Both are `None` if the task was
+/// cancelled.
+#[pyfunction]
+#[pyo3(signature = (polygons, method, eps, len, callback, *, checked = true, live_index = false))]
+fn submit_reduction(
+    py: Python<'_>,
+    polygons: Vec<TaskPolygon>,
+    method: ReductionMethod,
+    eps: f64,
+    len: usize,
+    callback: PyObject,
+    checked: bool,
+    live_index: bool,
+) -> PyResult<PyReductionTask> {
+    // Copy every polygon out of Python while the GIL is held
+    let arrays = polygons
+        .iter()
+        .map(|polygon| matches!(polygon, TaskPolygon::Array(_)))
+        .collect::<Vec<_>>();
+    let rings = polygons
+        .into_iter()
+        .map(|polygon| match polygon {
+            TaskPolygon::Array(buf) => linestring_from_buffer(py, &buf),
+            TaskPolygon::Coords(coords) => Ok(coords.into()),
+        })
+        .collect::<PyResult<Vec<LineString<f64>>>>()?;
+
+    let index = segment_index(live_index);
+    let state = Arc::new(TaskState::default());
+    let task = PyReductionTask {
+        state: state.clone(),
+    };
+
+    threads::spawn(move || {
+        // Open rings are reported with the other invalid polygons, as building a polygon would
+        // close them
+        let polygons = if checked {
+            closed_batch(rings)
+        } else {
+            Ok(rings
+                .into_iter()
+                .map(|ls| Polygon::new(ls, vec![]))
+                .collect())
+        };
+        let reduced = polygons.map(|polygons| {
+            par_map_balanced(polygons, |polygon| {
+                // Polygons not yet started once the task is cancelled are skipped
+                if state.cancelled.load(Relaxed) {
+                    state.skipped.fetch_add(1, Relaxed);
+                    return None;
+                }
+                let polygon = if checked {
+                    polygon.prepare(method)
+                } else {
+                    Ok(polygon)
+                };
+                Some(polygon.map(|polygon| polygon.reduce_indexed(method, eps, len, index)))
+            })
+        });
+
+        Python::with_gil(|py| {
+            let results = reduced.and_then(|reduced| task_results(py, reduced, &arrays));
+            let (result, error) = match results {
+                Ok(result) => (result.map(Bound::into_any), None),
+                Err(err) => (None, Some(err.into_value(py).into_bound(py).into_any())),
+            };
+            if let Err(err) = callback.call1(py, (result, error)) {
+                err.write_unraisable(py, None);
+            }
+        });
+    });
+
+    Ok(task)
+}
+
+/// The removal order of every vertex of a polygon, from which any resolution can be extracted.
+#[pyclass(frozen, name = "ReductionProfile")]
+struct PyReductionProfile {
+    inner: Profile<f64>,
+}
+
+impl PyReductionProfile {
+    /// Wrap a profile, listing vertices in the order of the original polygon.
+    fn new(profile: Profile<f64>, reversed: bool) -> Self {
+        let inner = if reversed {
+            profile.reversed()
+        } else {
+            profile
+        };
+        PyReductionProfile { inner }
+    }
+}
+
+#[pymethods]
+impl PyReductionProfile {
+    fn __len__(&self) -> usize {
+        self.inner.coords().len()
+    }
+
+    #[getter]
+    fn tolerances(&self) -> Vec<f64> {
+        self.inner.tolerances().to_vec()
+    }
+
+    #[getter]
+    fn ranks(&self) -> Vec<usize> {
+        self.inner.ranks()
+    }
+
+    fn at_epsilon(&self, eps: f64) -> Vec<(f64, f64)> {
+        let exterior = self.inner.extract(eps);
+        exterior.into_iter().map(|c| c.x_y()).collect()
+    }
+
+    fn at_length(&self, len: usize) -> Vec<(f64, f64)> {
+        // The closing coordinate is counted towards the length
+        let exterior = self.inner.extract_len(len.saturating_sub(1));
+        exterior.into_iter().map(|c| c.x_y()).collect()
+    }
+}
+
+#[pyfunction]
+fn profile_polygon(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    method: ReductionMethod,
+) -> PyResult<PyReductionProfile> {
+    threads::allow_threads(py, || -> PyResult<_> {
+        // Instantiate a Polygon from a Vec of coordinates
+        let polygon = closed_polygon(orig.into(), vec![])?;
+        let reversed = !polygon.exterior().is_cw();
+
+        let prepared = PreparedPolygon::new(polygon)?;
+        let profile = prepared.profile(method);
+
+        Ok(PyReductionProfile::new(profile, reversed))
+    })
+}
+
+/// A validated polygon, caching its triangulation and hull segments across reductions.
+#[pyclass(frozen, name = "PreparedPolygon")]
+struct PyPreparedPolygon {
+    inner: PreparedPolygon<f64>,
+}
+
+#[pymethods]
+impl PyPreparedPolygon {
+    #[new]
+    #[pyo3(signature = (exterior, interiors = Vec::new()))]
+    fn new(
+        py: Python<'_>,
+        exterior: Vec<[f64; 2]>,
+        interiors: Vec<Vec<[f64; 2]>>,
+    ) -> PyResult<Self> {
+        threads::allow_threads(py, || -> PyResult<_> {
+            let interiors = interiors.into_iter().map(LineString::from).collect();
+            let polygon = closed_polygon(exterior.into(), interiors)?;
+            Ok(PyPreparedPolygon {
+                inner: PreparedPolygon::new(polygon)?,
+            })
+        })
+    }
+
+    #[pyo3(signature = (method, eps, len, *, live_index = false))]
+    fn reduce(
+        &self,
+        py: Python<'_>,
+        method: ReductionMethod,
+        eps: f64,
+        len: usize,
+        live_index: bool,
+    ) -> Vec<(f64, f64)> {
+        let index = segment_index(live_index);
+        threads::allow_threads(py, || {
+            let (exterior, _) = self
+                .inner
+                .reduce_indexed(method, eps, len, index)
+                .into_inner();
+            exterior.into_iter().map(|c| c.x_y()).collect()
+        })
+    }
+
+    fn reduce_auto(&self, py: Python<'_>, method: ReductionMethod) -> Vec<(f64, f64)> {
+        threads::allow_threads(py, || {
+            let (exterior, _) = self.inner.reduce_auto(method).into_inner();
+            exterior.into_iter().map(|c| c.x_y()).collect()
+        })
+    }
+
+    fn profile(&self, py: Python<'_>, method: ReductionMethod) -> PyReductionProfile {
+        let profile = threads::allow_threads(py, || self.inner.profile(method));
+        PyReductionProfile::new(profile, self.inner.is_reversed())
+    }
+
+    #[pyo3(signature = (method, eps, len, *, live_index = false))]
+    fn reduce_array<'py>(
+        &self,
+        py: Python<'py>,
+        method: ReductionMethod,
+        eps: f64,
+        len: usize,
+        live_index: bool,
+    ) -> Bound<'py, PyArray2<f64>> {
+        let index = segment_index(live_index);
+        let (exterior, _) =
+            threads::allow_threads(py, || self.inner.reduce_indexed(method, eps, len, index))
+                .into_inner();
+        linestring_into_pyarray(py, exterior)
+    }
+
+    #[pyo3(signature = (method, eps, len, *, live_index = false))]
+    fn reduce_parts(
+        &self,
+        py: Python<'_>,
+        method: ReductionMethod,
+        eps: f64,
+        len: usize,
+        live_index: bool,
+    ) -> (Ring, Vec<Ring>) {
+        let index = segment_index(live_index);
+        threads::allow_threads(py, || {
+            let into_ring =
+                |ls: LineString<f64>| -> Ring { ls.into_iter().map(|c| c.x_y()).collect() };
+            let (exterior, interiors) = self
+                .inner
+                .reduce_indexed(method, eps, len, index)
+                .into_inner();
+            (
+                into_ring(exterior),
+                interiors.into_iter().map(into_ring).collect(),
+            )
+        })
+    }
+}
+
+#[pyfunction]
+fn is_valid(py: Python<'_>, poly: Vec<[f64; 2]>) -> PyResult<bool> {
+    threads::allow_threads(py, || {
+        let valid = closed_polygon(poly.into(), vec![])
+            .is_ok_and(|poly| poly.is_valid() && poly.exterior().is_cw());
+        Ok(valid)
+    })
+}
+
+/// The changes made to a polygon by the repair stage.
+#[pyclass(frozen, name = "RepairReport")]
+struct PyRepairReport {
+    inner: Repairs,
+}
+
+#[pymethods]
+impl PyRepairReport {
+    #[getter]
+    fn closed(&self) -> usize {
+        self.inner.closed
+    }
+
+    #[getter]
+    fn reversed(&self) -> usize {
+        self.inner.reversed
+    }
+
+    #[getter]
+    fn duplicates(&self) -> usize {
+        self.inner.duplicates
+    }
+
+    #[getter]
+    fn collinear(&self) -> usize {
+        self.inner.collinear
+    }
+
+    fn __bool__(&self) -> bool {
+        !self.inner.is_empty()
+    }
+
+    fn __repr__(&self) -> String {
+        let Repairs {
+            closed,
+            reversed,
+            duplicates,
+            collinear,
+        } = self.inner;
+        format!(
+            "RepairReport(closed={closed}, reversed={reversed}, duplicates={duplicates}, \
+             collinear={collinear})"
+        )
+    }
+}
+
+/// Timings and counts collected from every reduction made within a `with` block.
+#[pyclass(name = "ReductionStats")]
+struct PyReductionStats {
+    collector: Option<Collector>,
+    inner: Stats,
+}
+
+#[pymethods]
+impl PyReductionStats {
+    #[new]
+    fn new() -> Self {
+        PyReductionStats {
+            collector: None,
+            inner: Stats::default(),
+        }
+    }
+
+    fn __enter__(mut slf: PyRefMut<'_, Self>) -> PyResult<PyRefMut<'_, Self>> {
+        if slf.collector.is_some() {
+            return Err(PyRuntimeError::new_err(
+                "Statistics are already being collected",
+            ));
+        }
+        slf.collector = Some(Collector::begin());
+        Ok(slf)
+    }
+
+    fn __exit__(
+        &mut self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_value: &Bound<'_, PyAny>,
+        _traceback: &Bound<'_, PyAny>,
+    ) -> bool {
+        if let Some(collector) = self.collector.take() {
+            self.inner = collector.finish();
+        }
+        false
+    }
+
+    /// Seconds spent in each phase, summed over every thread.
+    #[getter]
+    fn phases<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let phases = PyDict::new(py);
+        for (phase, nanos) in Phase::ALL.iter().zip(self.inner.phases) {
+            phases.set_item(phase.name(), nanos as f64 * 1e-9)?;
+        }
+        Ok(phases)
+    }
+
+    #[getter]
+    fn counters<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let counters = PyDict::new(py);
+        for (name, count) in Counters::NAMES.iter().zip(self.inner.counters) {
+            counters.set_item(name, count)?;
+        }
+        counters.set_item("max_depth", self.inner.max_depth)?;
+        Ok(counters)
+    }
+
+    fn __repr__(&self) -> String {
+        let phases = Phase::ALL
+            .iter()
+            .zip(self.inner.phases)
+            .map(|(phase, nanos)| format!("{}={:.6}", phase.name(), nanos as f64 * 1e-9));
+        let counters = Counters::NAMES
+            .iter()
+            .zip(self.inner.counters)
+            .map(|(name, count)| format!("{name}={count}"))
+            .chain([format!("max_depth={}", self.inner.max_depth)]);
+        format!(
+            "ReductionStats({})",
+            phases.chain(counters).collect::<Vec<_>>().join(", ")
+        )
+    }
+}
+
+/// Set the number of threads reductions run on, or `None` for a thread per core.
+#[pyfunction]
+#[pyo3(signature = (num_threads = None))]
+fn set_num_threads(num_threads: Option<usize>) -> PyResult<()> {
+    if num_threads == Some(0) {
+        return Err(PyValueError::new_err("num_threads must be at least 1"));
+    }
+    threads::set_default_threads(num_threads.unwrap_or(0));
+    Ok(())
+}
+
+/// The number of threads reductions made on the calling thread run on.
+#[pyfunction]
+fn get_num_threads() -> usize {
+    threads::current_threads()
+}
+
+/// Run reductions made on the calling thread within a `with` block on a pool of the given size.
+#[pyclass(name = "ThreadLimit")]
+struct PyThreadLimit {
+    num_threads: Option<usize>,
+    previous: Option<Option<usize>>,
+}
+
+#[pymethods]
+impl PyThreadLimit {
+    #[new]
+    #[pyo3(signature = (num_threads = None))]
+    fn new(num_threads: Option<usize>) -> PyResult<Self> {
+        if num_threads == Some(0) {
+            return Err(PyValueError::new_err("num_threads must be at least 1"));
+        }
+        Ok(PyThreadLimit {
+            num_threads,
+            previous: None,
+        })
+    }
+
+    fn __enter__(mut slf: PyRefMut<'_, Self>) -> PyResult<PyRefMut<'_, Self>> {
+        if slf.previous.is_some() {
+            return Err(PyRuntimeError::new_err("Thread limit is already in use"));
+        }
+        // Without a number of threads, the limit in force is left unchanged
+        if let Some(num_threads) = slf.num_threads {
+            slf.previous = Some(threads::set_thread_override(Some(num_threads)));
+        }
+        Ok(slf)
+    }
+
+    fn __exit__(
+        &mut self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_value: &Bound<'_, PyAny>,
+        _traceback: &Bound<'_, PyAny>,
+    ) -> bool {
+        if let Some(previous) = self.previous.take() {
+            threads::set_thread_override(previous);
+        }
+        false
+    }
+}
+
+/// Optionally repair a ring, then validate it and wind it clockwise.
+///
+/// The ring is repaired before it is built into a polygon, which would close it, so that open
+/// rings are either closed by the repair or rejected. Along with the polygon, returns the position
+/// in `ring` of each coordinate of its exterior.
+fn validate_repaired(
+    ring: LineString<f64>,
+    repair: bool,
+) -> PyResult<(Polygon<f64>, Vec<usize>, Repairs)> {
+    let (ring, mut positions, repairs) = if repair {
+        ring.repair_positions()
+    } else {
+        let len = ring.0.len();
+        let mut positions = (0..len).collect::<Vec<_>>();
+        ring_positions(&mut positions, len, false);
+        (ring, positions, Repairs::default())
+    };
+
+    let mut polygon = closed_polygon(ring, vec![])?.validate()?;
+    stats::timed(Phase::Winding, || {
+        if polygon.exterior().is_ccw() {
+            polygon.exterior_mut(|ls| ls.make_cw_winding());
+            positions.reverse();
+        }
+    });
+    Ok((polygon, positions, repairs))
+}
+
+/// Validate a polygon once, returning it wound clockwise for the unchecked functions.
+///
+/// Also returns the position in `orig` of each returned coordinate.
+#[pyfunction]
+#[pyo3(signature = (orig, *, repair = false))]
+fn validate_polygon(
+    py: Python<'_>,
+    orig: Vec<[f64; 2]>,
+    repair: bool,
+) -> PyResult<(Vec<(f64, f64)>, Vec<usize>, PyRepairReport)> {
+    let (polygon, positions, repairs) =
+        threads::allow_threads(py, || validate_repaired(orig.into(), repair))?;
+
+    let (exterior, _) = polygon.into_inner();
     let coords = exterior.into_iter().map(|c| c.x_y()).collect::<Vec<_>>();
 
-    Ok(coords)
+    Ok((coords, positions, PyRepairReport { inner: repairs }))
 }
 
 #[pyfunction]
-fn is_valid(poly: Vec<[f64; 2]>) -> PyResult<bool> {
-    let poly = Polygon::new(poly.into(), vec![]);
-    Ok(poly.is_valid() && poly.exterior().is_cw())
+#[pyo3(signature = (orig, *, repair = false))]
+fn validate_polygon_array<'py>(
+    py: Python<'py>,
+    orig: PyBuffer<f64>,
+    repair: bool,
+) -> PyResult<(Bound<'py, PyArray2<f64>>, Bound<'py, PyAny>, PyRepairReport)> {
+    // Instantiate a ring from a buffer of coordinates
+    let ring = linestring_from_buffer(py, &orig)?;
+    let size = ring.0.len();
+
+    // Validate without holding the GIL
+    let (polygon, positions, repairs) =
+        threads::allow_threads(py, || validate_repaired(ring, repair))?;
+
+    let (exterior, _) = polygon.into_inner();
+    let positions = indices_into_pyarray(py, positions, size);
+    let report = PyRepairReport { inner: repairs };
+    Ok((linestring_into_pyarray(py, exterior), positions, report))
 }
 
 #[pymodule]
@@ -135,7 +1199,42 @@ fn _polyshell(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(reduce_polygon_char_unchecked, m)?)?;
     m.add_function(wrap_pyfunction!(reduce_polygon_rdp_unchecked, m)?)?;
 
+    m.add_function(wrap_pyfunction!(reduce_polygon_vw_array, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_char_array, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_rdp_array, m)?)?;
+
+    m.add_function(wrap_pyfunction!(reduce_polygon_vw_array_unchecked, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_char_array_unchecked, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_rdp_array_unchecked, m)?)?;
+
+    m.add_function(wrap_pyfunction!(reduce_polygon_auto, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_auto_array, m)?)?;
+
+    m.add_function(wrap_pyfunction!(reduce_polygon_indices, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_array_f32, m)?)?;
+
+    m.add_function(wrap_pyfunction!(reduce_polygon_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_batch_array, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_batch_array_f32, m)?)?;
+    m.add_function(wrap_pyfunction!(reduce_polygon_parts, m)?)?;
+
+    m.add_function(wrap_pyfunction!(submit_reduction, m)?)?;
+    m.add_class::<PyReductionTask>()?;
+
+    m.add_function(wrap_pyfunction!(profile_polygon, m)?)?;
+    m.add_class::<PyReductionProfile>()?;
+    m.add_class::<PyPreparedPolygon>()?;
+
     m.add_function(wrap_pyfunction!(is_valid, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_polygon, m)?)?;
+    m.add_class::<PyRepairReport>()?;
+    m.add_function(wrap_pyfunction!(validate_polygon_array, m)?)?;
+
+    m.add_class::<PyReductionStats>()?;
+
+    m.add_function(wrap_pyfunction!(set_num_threads, m)?)?;
+    m.add_function(wrap_pyfunction!(get_num_threads, m)?)?;
+    m.add_class::<PyThreadLimit>()?;
 
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
 
@@ -22,9 +22,13 @@
 
 """Fixtures and test cases."""
 
+import pytest
 from polyshell import ReductionMethod, ReductionMode, reduce_polygon
 from pytest_cases import fixture, parametrize_with_cases  # type: ignore
 
+# Report the values compared by the shared assertion helpers
+pytest.register_assert_rewrite("tests.polygon_cases")
+
 
 @fixture(scope="class")
 @parametrize_with_cases("method", cases=".method_cases", scope="class")
@@ -27,7 +27,9 @@ from collections.abc import Sequence
 
 import numpy as np
 from numpy.typing import NDArray
+from polyshell import synthetic
 from shapely import Polygon as ShapelyPolygon
+from shapely import is_valid  # type: ignore
 
 
 class CaseLarge:
@@ -64,6 +66,37 @@ class CaseLarge:
             return pickle.load(f)
 
 
+# Large polygon shared by the tests of individual features
+BAFFIN_ISLAND = CaseLarge().case_baffin_island()
+
+
+def assert_contains(simplified, original) -> None:
+    """Check a reduced polygon is valid and contains the original."""
+    simplified = ShapelyPolygon(simplified)
+    assert is_valid(simplified)
+    assert simplified.contains(ShapelyPolygon(original))
+
+
+class CaseSynthetic:
+    """Generated polygons, which stress particular parts of the algorithms."""
+
+    def case_coastline(self) -> NDArray[np.floating]:
+        """A fractal coastline."""
+        return synthetic.coastline(10_000)
+
+    def case_spiral(self) -> NDArray[np.floating]:
+        """A narrow spiral arm."""
+        return synthetic.spiral(10_000)
+
+    def case_comb(self) -> NDArray[np.floating]:
+        """A comb of teeth and deep fjords."""
+        return synthetic.comb(10_000)
+
+    def case_collinear(self) -> NDArray[np.floating]:
+        """A square of almost collinear runs."""
+        return synthetic.collinear(10_000)
+
+
 class CaseSmall:
     """Polygons with a small number of vertices."""
 
@@ -148,6 +181,19 @@ class CaseSmall:
                 ]
             )
 
+        def case_array_fortran(self) -> NDArray[np.floating]:
+            """A polygon as a non-contiguous numpy array."""
+            return np.asfortranarray(
+                [
+                    [0.0, 0.0],
+                    [0.0, 1.0],
+                    [0.5, 0.5],
+                    [1.0, 1.0],
+                    [1.0, 0.0],
+                    [0.0, 0.0],
+                ]
+            )
+
         def case_shapely(self) -> ShapelyPolygon:
             """A shapely Polygon."""
             return ShapelyPolygon(
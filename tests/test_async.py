@@ -0,0 +1,174 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for reductions awaited from an event loop."""
+
+import asyncio
+import threading
+
+import numpy as np
+import polyshell
+import pytest
+from polyshell import (
+    ValidatedPolygon,
+    reduce_polygon,
+    reduce_polygon_async,
+    reduce_polygons,
+    reduce_polygons_async,
+)
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+class TestAsync:
+    """Test awaited reductions match those made synchronously."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_reduce(self, method: str):
+        """An awaited reduction matches the synchronous reduction."""
+        expected = reduce_polygon(POLYGON, "epsilon", 1e-2, method)
+        reduced = asyncio.run(reduce_polygon_async(POLYGON, "epsilon", 1e-2, method))
+        assert reduced == expected
+
+    def test_array(self):
+        """Arrays are reduced into arrays."""
+        polygon = np.array(POLYGON)
+        expected = reduce_polygon(polygon, "length", 1_000, "vw")
+        reduced = asyncio.run(reduce_polygon_async(polygon, "length", 1_000, "vw"))
+        assert isinstance(reduced, np.ndarray)
+        np.testing.assert_array_equal(reduced, expected)
+
+    def test_validated(self):
+        """Validated polygons are reduced without validating again."""
+        validated = ValidatedPolygon(POLYGON)
+        expected = reduce_polygon(validated, "epsilon", 1e-2, "rdp")
+        reduced = asyncio.run(reduce_polygon_async(validated, "epsilon", 1e-2, "rdp"))
+        assert reduced == expected
+
+    def test_invalid(self):
+        """Invalid polygons raise once awaited."""
+        polygon = [(0.0, 0.0), (1.0, 1.0), (1.0, 0.0), (0.0, 1.0), (0.0, 0.0)]
+        with pytest.raises(ValueError):
+            asyncio.run(reduce_polygon_async(polygon, "epsilon", 1e-2, "vw"))
+
+    def test_auto(self):
+        """Automatic reduction is rejected, naming the supported modes."""
+        with pytest.raises(ValueError, match="length"):
+            asyncio.run(reduce_polygon_async(POLYGON, "auto", "vw"))
+
+
+class TestAsyncBatch:
+    """Test awaited batches, with and without a bound on the polygons pending."""
+
+    @pytest.mark.parametrize("max_pending", [None, 1, 2])
+    def test_batch(self, max_pending: int | None):
+        """An awaited batch matches the synchronous batch, in order."""
+        polygons = [POLYGON, POLYGON[::-1], POLYGON]
+        expected = reduce_polygons(polygons, "epsilon", 1e-2, "rdp")
+        reduced = asyncio.run(
+            reduce_polygons_async(
+                polygons, "epsilon", 1e-2, "rdp", max_pending=max_pending
+            )
+        )
+        assert reduced == expected
+
+    @pytest.mark.parametrize("max_pending", [1, 2])
+    def test_async_iterable(self, monkeypatch: pytest.MonkeyPatch, max_pending: int):
+        """Polygons are read from an asynchronous iterable no faster than reduced."""
+        finished = 0
+        pending = []
+
+        def count(_):
+            nonlocal finished
+            finished += 1
+
+        original = polyshell.submit
+
+        def submit(*args, **kwargs):
+            future = original(*args, **kwargs)
+            future.add_done_callback(count)
+            return future
+
+        async def polygons():
+            for read in range(8):
+                pending.append(read - finished)
+                yield POLYGON
+
+        async def reduce():
+            return await reduce_polygons_async(
+                polygons(), "epsilon", 1e-2, "vw", max_pending=max_pending
+            )
+
+        monkeypatch.setattr(polyshell, "submit", submit)
+        reduced = asyncio.run(reduce())
+
+        assert len(pending) == 8
+        assert max(pending) < max_pending
+        assert reduced == [reduce_polygon(POLYGON, "epsilon", 1e-2, "vw")] * 8
+
+    def test_cancel(self, monkeypatch: pytest.MonkeyPatch):
+        """Cancelling the awaiting task skips the polygons not yet started."""
+        original = polyshell.submit_reduction
+        tasks = []
+
+        def submit_reduction(*args, **kwargs):
+            *args, callback = args
+            done = threading.Event()
+
+            def complete(*outcome):
+                callback(*outcome)
+                done.set()
+
+            task = original(*args, complete, **kwargs)
+            tasks.append((task, done))
+            return task
+
+        async def cancel():
+            task = asyncio.ensure_future(
+                reduce_polygons_async(
+                    [POLYGON] * 64, "epsilon", 1e-3, "charshape", num_threads=1
+                )
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            # The event loop is still free to reduce other polygons
+            return await reduce_polygon_async(POLYGON, "epsilon", 1e-2, "rdp")
+
+        monkeypatch.setattr(polyshell, "submit_reduction", submit_reduction)
+        assert asyncio.run(cancel()) == reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+
+        # The cancelled batch completes once the polygon already started is reduced
+        task, done = tasks[0]
+        assert done.wait(timeout=60)
+        assert task.cancelled
+        assert task.skipped > 0
+
+    def test_max_pending(self):
+        """At least one polygon must be allowed to be pending."""
+        with pytest.raises(ValueError):
+            asyncio.run(
+                reduce_polygons_async([POLYGON], "epsilon", 1e-2, "vw", max_pending=0)
+            )
@@ -0,0 +1,51 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for automatic reduction."""
+
+from polyshell import PreparedPolygon, ReductionMethod, ReductionMode, reduce_polygon
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+from .polygon_cases import assert_contains
+
+
+class TestAuto:
+    """Test ReductionMode.AUTO against requirements."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_requirements(self, method: ReductionMethod):
+        """Automatic reductions are valid, contain the original and remove vertices."""
+        simplified = reduce_polygon(POLYGON, ReductionMode.AUTO, method)
+
+        assert_contains(simplified, POLYGON)
+        assert set(map(tuple, simplified)) <= set(map(tuple, POLYGON))
+        assert 3 < len(simplified) < len(POLYGON)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_prepared(self, method: ReductionMethod):
+        """Prepared polygons choose the same reduction."""
+        expected = reduce_polygon(POLYGON, ReductionMode.AUTO, method)
+        reduced = PreparedPolygon(POLYGON).reduce(ReductionMode.AUTO, method)
+
+        assert set(map(tuple, reduced)) == set(map(tuple, expected))
@@ -0,0 +1,80 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for reduce_polygons."""
+
+import numpy as np
+import pytest
+from polyshell import ReductionMethod, ReductionMode, reduce_polygon, reduce_polygons
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND, CaseSmall
+
+POLYGONS = [
+    BAFFIN_ISLAND,
+    CaseSmall.CaseSelfIntersection().case_interlocking_teeth(),
+    CaseSmall.CaseTypes().case_list_tuple(),
+    CaseSmall().case_triangle(),
+]
+
+
+class TestBatch:
+    """Test reduce_polygons against reduce_polygon."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_sequence(self, method: ReductionMethod):
+        """Batched reductions match individual reductions."""
+        expected = [
+            reduce_polygon(polygon, ReductionMode.EPSILON, 1e-6, method)
+            for polygon in POLYGONS
+        ]
+        reduced = reduce_polygons(POLYGONS, ReductionMode.EPSILON, 1e-6, method)
+
+        assert reduced == expected
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_offsets(self, method: ReductionMethod):
+        """The flat layout gives the same polygons as the sequence layout."""
+        coords = np.concatenate([np.asarray(polygon) for polygon in POLYGONS])
+        offsets = np.cumsum([0] + [len(polygon) for polygon in POLYGONS])
+
+        reduced_coords, reduced_offsets = reduce_polygons(
+            coords, ReductionMode.EPSILON, 1e-6, method, offsets=offsets
+        )
+        expected = reduce_polygons(POLYGONS, ReductionMode.EPSILON, 1e-6, method)
+
+        assert len(reduced_offsets) == len(POLYGONS) + 1
+        for start, end, polygon in zip(reduced_offsets, reduced_offsets[1:], expected):
+            np.testing.assert_array_equal(
+                reduced_coords[start:end], np.asarray(polygon)
+            )
+
+    def test_invalid(self):
+        """Invalid polygons are reported by position."""
+        polygons = [POLYGONS[2], [(0.0, 0.0), (1.0, 1.0), (0.0, 0.0)]]
+        with pytest.raises(ValueError, match="Polygon 1"):
+            reduce_polygons(polygons, ReductionMode.EPSILON, 1e-6, ReductionMethod.VW)
+
+    def test_auto(self):
+        """Automatic reduction is rejected, naming the supported modes."""
+        with pytest.raises(ValueError, match="epsilon"):
+            reduce_polygons(POLYGONS, ReductionMode.AUTO, ReductionMethod.VW)
@@ -0,0 +1,100 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for the streaming reduce command."""
+
+import json
+
+import pytest
+from shapely import from_wkb, to_wkb  # type: ignore
+from shapely.geometry import LineString, MultiPolygon
+from shapely.geometry import Polygon as ShapelyPolygon
+from shapely.geometry import mapping, shape
+
+from .polygon_cases import BAFFIN_ISLAND
+
+typer = pytest.importorskip("typer")
+
+from polyshell._cli import app  # noqa: E402
+from typer.testing import CliRunner  # noqa: E402
+
+POLYGON = ShapelyPolygon(BAFFIN_ISLAND)
+SQUARE = ShapelyPolygon([(20.0, 0.0), (20.0, 1.0), (21.0, 1.0), (21.0, 0.0)])
+BOWTIE = ShapelyPolygon([(0.0, 0.0), (1.0, 1.0), (1.0, 0.0), (0.0, 1.0)])
+
+
+class TestReduce:
+    """Test the reduce command against requirements."""
+
+    def test_geojsonseq(self, tmp_path):
+        """Features are reduced in order, keeping their properties."""
+        geometries = [
+            POLYGON,
+            MultiPolygon([POLYGON, SQUARE]),
+            LineString([(0, 0), (1, 1)]),
+        ]
+        source = tmp_path / "input.geojsonl"
+        with open(source, "w") as f:
+            for index, geometry in enumerate(geometries):
+                feature = {
+                    "type": "Feature",
+                    "properties": {"index": index},
+                    "geometry": mapping(geometry),
+                }
+                f.write(json.dumps(feature) + "\n")
+
+        destination = tmp_path / "output.geojsonl"
+        args = [str(source), str(destination), "0.01", "rdp", "--chunk-size", "2"]
+        result = CliRunner().invoke(app, ["reduce", *args])
+        assert result.exit_code == 0, result.output
+        assert "vertices/s" in result.output
+
+        with open(destination) as f:
+            features = [json.loads(line) for line in f]
+
+        assert [feature["properties"]["index"] for feature in features] == [0, 1, 2]
+        reduced = [shape(feature["geometry"]) for feature in features]
+        assert len(reduced[0].exterior.coords) < len(POLYGON.exterior.coords)
+        assert reduced[0].contains(POLYGON)
+        assert reduced[1].contains(geometries[1])
+        assert reduced[2].equals(geometries[2])
+
+    def test_wkb(self, tmp_path):
+        """Invalid polygons are copied through unchanged."""
+        source = tmp_path / "input.wkb"
+        with open(source, "w") as f:
+            for geometry in [POLYGON, BOWTIE, SQUARE]:
+                f.write(to_wkb(geometry, hex=True) + "\n")
+
+        destination = tmp_path / "output.wkb"
+        result = CliRunner().invoke(
+            app, ["reduce", str(source), str(destination), "0.01", "vw"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "1 invalid" in result.output
+
+        with open(destination) as f:
+            reduced = [from_wkb(line.strip()) for line in f]
+
+        assert reduced[0].contains(POLYGON)
+        assert reduced[1].equals(BOWTIE)
+        assert reduced[2].equals(SQUARE)
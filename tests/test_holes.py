@@ -0,0 +1,158 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for polygons with holes and multi-polygons."""
+
+import math
+
+import pytest
+from polyshell import ReductionMethod, ReductionMode, reduce_polygon, reduce_polygons
+from pytest_cases import parametrize_with_cases  # type: ignore
+from shapely import is_valid  # type: ignore
+from shapely.geometry import MultiPolygon as ShapelyMultiPolygon
+from shapely.geometry import Polygon as ShapelyPolygon
+
+
+def star(
+    center: tuple[float, float], inner: float, outer: float, points: int
+) -> list[tuple[float, float]]:
+    """A star-shaped ring, alternating between inner and outer radii."""
+    cx, cy = center
+    ring = []
+    for i in range(2 * points):
+        radius = outer if i % 2 == 0 else inner
+        angle = math.pi * i / points
+        ring.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
+    return ring
+
+
+EXTERIOR = star((0.0, 0.0), 8.0, 10.0, 64)
+HOLES = [star((-3.0, 0.0), 1.0, 2.0, 16), star((3.0, 0.0), 1.5, 2.5, 32)]
+
+POLYGON = ShapelyPolygon(EXTERIOR, HOLES)
+MULTIPOLYGON = ShapelyMultiPolygon(
+    [POLYGON, ShapelyPolygon(star((30.0, 0.0), 4.0, 6.0, 32))]
+)
+
+# A block sitting in the notch of a C, which the C fills once reduced
+CLOSE = ShapelyMultiPolygon(
+    [
+        ShapelyPolygon(
+            [(0, 0), (0, 10), (10, 10), (10, 7), (3, 7), (3, 3), (10, 3), (10, 0)]
+        ),
+        ShapelyPolygon([(5, 4), (5, 6), (8, 6), (8, 4)]),
+    ]
+)
+# An island in a spike of a star-shaped hole, which the hole leaves once reduced
+ISLAND = ShapelyMultiPolygon(
+    [
+        ShapelyPolygon(
+            [(-20, -20), (-20, 20), (20, 20), (20, -20)],
+            [star((0.0, 0.0), 4.0, 8.0, 16)],
+        ),
+        ShapelyPolygon(star((5.0, 0.0), 0.15, 0.25, 8)),
+    ]
+)
+
+
+def vertices(polygon: ShapelyPolygon) -> set[tuple[float, float]]:
+    rings = [polygon.exterior, *polygon.interiors]
+    return {tuple(coord) for ring in rings for coord in ring.coords}
+
+
+class TestHoles:
+    """Test reduce_polygon on polygons with holes."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_polygon(self, method: ReductionMethod):
+        """Holes are kept and reduced inwards."""
+        simplified = reduce_polygon(POLYGON, ReductionMode.EPSILON, 0.5, method)
+
+        assert isinstance(simplified, ShapelyPolygon)
+        assert is_valid(simplified)
+        assert len(simplified.interiors) == len(POLYGON.interiors)
+        assert vertices(simplified) <= vertices(POLYGON)
+        assert simplified.contains(POLYGON)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_multipolygon(self, method: ReductionMethod):
+        """Each part of a multi-polygon is reduced."""
+        simplified = reduce_polygon(MULTIPOLYGON, ReductionMode.EPSILON, 0.5, method)
+
+        assert isinstance(simplified, ShapelyMultiPolygon)
+        assert len(simplified.geoms) == len(MULTIPOLYGON.geoms)
+        for part, original in zip(simplified.geoms, MULTIPOLYGON.geoms):
+            assert is_valid(part)
+            assert vertices(part) <= vertices(original)
+            assert part.contains(original)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    @pytest.mark.parametrize("multipolygon", [CLOSE, ISLAND], ids=["close", "island"])
+    def test_collision(
+        self, method: ReductionMethod, multipolygon: ShapelyMultiPolygon
+    ):
+        """Parts which would collide once reduced are reduced less, keeping them apart."""
+        assert is_valid(multipolygon)
+        simplified = reduce_polygon(multipolygon, ReductionMode.EPSILON, 100.0, method)
+
+        assert is_valid(simplified)
+        assert len(simplified.geoms) == len(multipolygon.geoms)
+        for part, original in zip(simplified.geoms, multipolygon.geoms):
+            assert vertices(part) <= vertices(original)
+            assert part.contains(original)
+
+    def test_hole_outside(self):
+        """A hole outside its exterior is rejected."""
+        polygon = ShapelyPolygon(EXTERIOR, [star((30.0, 0.0), 1.0, 2.0, 16)])
+
+        with pytest.raises(ValueError, match="hole outside"):
+            reduce_polygon(polygon, ReductionMode.EPSILON, 0.5, ReductionMethod.VW)
+
+    def test_length(self):
+        """Fixed length reduction is not supported for polygons with holes."""
+        with pytest.raises(NotImplementedError):
+            reduce_polygon(POLYGON, ReductionMode.LENGTH, 16, ReductionMethod.VW)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_batch(self, method: ReductionMethod):
+        """Batches keep holes and parts, reducing each geometry as reduce_polygon would."""
+        polygons = [POLYGON, list(POLYGON.exterior.coords), MULTIPOLYGON]
+        expected = [
+            reduce_polygon(polygon, ReductionMode.EPSILON, 0.5, method)
+            for polygon in polygons
+        ]
+        simplified = reduce_polygons(polygons, ReductionMode.EPSILON, 0.5, method)
+
+        assert isinstance(simplified[0], ShapelyPolygon)
+        assert isinstance(simplified[2], ShapelyMultiPolygon)
+        assert simplified == expected
+
+    def test_batch_invalid(self):
+        """Invalid geometries in a batch are reported by position."""
+        polygons = [
+            MULTIPOLYGON,
+            ShapelyPolygon(EXTERIOR, [star((30.0, 0.0), 1.0, 2.0, 16)]),
+        ]
+
+        with pytest.raises(ValueError, match="Polygon 1"):
+            reduce_polygons(polygons, ReductionMode.EPSILON, 0.5, ReductionMethod.VW)
@@ -0,0 +1,47 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for the cost of importing polyshell."""
+
+import subprocess
+import sys
+
+PROBE = """
+import sys
+import polyshell
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+class TestImport:
+    """Test that optional dependencies are only imported once used."""
+
+    def test_lazy(self):
+        """Importing polyshell loads neither NumPy nor Shapely."""
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE], capture_output=True, check=True, text=True
+        )
+        modules = {name.partition(".")[0] for name in result.stdout.split()}
+
+        assert "polyshell" in modules
+        assert "numpy" not in modules
+        assert "shapely" not in modules
@@ -0,0 +1,100 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for reduction returning the indices of retained vertices."""
+
+import numpy as np
+from polyshell import ReductionMethod, ReductionMode, ValidatedPolygon, reduce_polygon
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+class TestIndices:
+    """Test index output against coordinate output."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_epsilon(self, method: ReductionMethod):
+        """Indices select the reduced coordinates from the original ring."""
+        expected = reduce_polygon(POLYGON, ReductionMode.EPSILON, 1e-3, method)
+        indices = reduce_polygon(
+            POLYGON, ReductionMode.EPSILON, 1e-3, method, return_indices=True
+        )
+
+        assert indices.dtype == np.uint32
+        np.testing.assert_array_equal(np.asarray(POLYGON)[indices], expected)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_length(self, method: ReductionMethod):
+        """Indices select the reduced coordinates at a fixed length."""
+        expected = reduce_polygon(POLYGON, ReductionMode.LENGTH, 100, method)
+        indices = reduce_polygon(
+            POLYGON, ReductionMode.LENGTH, 100, method, return_indices=True
+        )
+
+        assert len(indices) == 100
+        np.testing.assert_array_equal(np.asarray(POLYGON)[indices], expected)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_validated(self, method: ReductionMethod):
+        """Indices of a validated polygon refer to its validated coordinates."""
+        validated = ValidatedPolygon(POLYGON)
+        expected = reduce_polygon(validated, ReductionMode.EPSILON, 1e-3, method)
+        indices = reduce_polygon(
+            validated, ReductionMode.EPSILON, 1e-3, method, return_indices=True
+        )
+
+        np.testing.assert_array_equal(np.asarray(validated.coords)[indices], expected)
+
+    def test_array(self):
+        """Array and sequence polygons give the same indices."""
+        method = ReductionMethod.RDP
+        expected = reduce_polygon(
+            POLYGON, ReductionMode.EPSILON, 1e-3, method, return_indices=True
+        )
+        array = np.asarray(POLYGON)
+        indices = reduce_polygon(
+            array, ReductionMode.EPSILON, 1e-3, method, return_indices=True
+        )
+
+        np.testing.assert_array_equal(indices, expected)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_repaired(self, method: ReductionMethod):
+        """Indices of a repaired polygon refer to the coordinates given."""
+        # Open, counter-clockwise and with a duplicate vertex
+        damaged = list(POLYGON[::-1][:-1])
+        damaged.insert(10, damaged[10])
+        expected = reduce_polygon(
+            damaged, ReductionMode.EPSILON, 1e-3, method, repair=True
+        )
+
+        for polygon in (damaged, np.asarray(damaged)):
+            indices = reduce_polygon(
+                polygon,
+                ReductionMode.EPSILON,
+                1e-3,
+                method,
+                return_indices=True,
+                repair=True,
+            )
+            np.testing.assert_array_equal(np.asarray(damaged)[indices], expected)
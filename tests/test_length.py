@@ -0,0 +1,80 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for fixed length reduction with RDP and Visvalingam-Whyatt."""
+
+from polyshell import ReductionMethod, ReductionMode, profile_polygon, reduce_polygon
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+from .polygon_cases import assert_contains
+
+
+class TestLengthRDP:
+    """Test fixed length RDP against requirements."""
+
+    def test_length(self):
+        """The target length is obtained by a valid, containing reduction."""
+        for length in [len(POLYGON) // 2, len(POLYGON) // 10]:
+            simplified = reduce_polygon(
+                POLYGON, ReductionMode.LENGTH, length, ReductionMethod.RDP
+            )
+
+            assert len(simplified) == length
+            assert_contains(simplified, POLYGON)
+            assert set(map(tuple, simplified)) <= set(map(tuple, POLYGON))
+
+    def test_epsilon(self):
+        """Without a binding length, refinement matches the recursive algorithm."""
+        expected = reduce_polygon(
+            POLYGON, ReductionMode.EPSILON, 0.0, ReductionMethod.RDP
+        )
+        simplified = reduce_polygon(
+            POLYGON, ReductionMode.LENGTH, len(POLYGON), ReductionMethod.RDP
+        )
+
+        assert set(map(tuple, simplified)) == set(map(tuple, expected))
+
+
+class TestLengthVW:
+    """Test fixed length Visvalingam-Whyatt against requirements."""
+
+    def test_length(self):
+        """The target length is obtained by a valid, containing reduction."""
+        for length in [len(POLYGON) // 2, len(POLYGON) // 10]:
+            simplified = reduce_polygon(
+                POLYGON, ReductionMode.LENGTH, length, ReductionMethod.VW
+            )
+
+            assert len(simplified) == length
+            assert_contains(simplified, POLYGON)
+            assert set(map(tuple, simplified)) <= set(map(tuple, POLYGON))
+
+    def test_profile(self):
+        """Segments reduced in parallel keep the most significant points."""
+        length = len(POLYGON) // 10
+        profile = profile_polygon(POLYGON, ReductionMethod.VW)
+        simplified = reduce_polygon(
+            POLYGON, ReductionMode.LENGTH, length, ReductionMethod.VW
+        )
+
+        assert set(map(tuple, simplified)) == set(profile.at_length(length))
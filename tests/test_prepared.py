@@ -0,0 +1,66 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for PreparedPolygon."""
+
+import pytest
+from polyshell import PreparedPolygon, ReductionMethod, ReductionMode, reduce_polygon
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+def vertices(polygon) -> set[tuple[float, float]]:
+    return {tuple(coord) for coord in polygon}
+
+
+class TestPrepared:
+    """Test PreparedPolygon against reduce_polygon."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_epsilon(self, method: ReductionMethod):
+        """Repeated reductions match individual reductions."""
+        prepared = PreparedPolygon(POLYGON)
+        for eps in [1e-1, 1e-2, 1e-3, 1e-4]:
+            expected = reduce_polygon(POLYGON, ReductionMode.EPSILON, eps, method)
+            reduced = prepared.reduce(ReductionMode.EPSILON, eps, method)
+
+            assert vertices(reduced) == vertices(expected)
+
+    def test_length(self):
+        """Prepared polygons can be reduced to a fixed length."""
+        prepared = PreparedPolygon(POLYGON)
+        for length in [1000, 100, 10]:
+            expected = reduce_polygon(
+                POLYGON, ReductionMode.LENGTH, length, ReductionMethod.VW
+            )
+            reduced = prepared.reduce(ReductionMode.LENGTH, length, ReductionMethod.VW)
+
+            assert vertices(reduced) == vertices(expected)
+
+    def test_invalid(self):
+        """Invalid polygons are rejected when prepared."""
+        with pytest.raises(ValueError):
+            PreparedPolygon(
+                [(0.0, 0.0), (1.0, 1.0), (0.0, 1.0), (1.0, 0.0), (0.0, 0.0)]
+            )
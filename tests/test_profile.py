@@ -0,0 +1,66 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for progressive reduction with profile_polygon."""
+
+from polyshell import ReductionMethod, ReductionMode, profile_polygon, reduce_polygon
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+from .polygon_cases import assert_contains
+
+
+def vertices(polygon) -> set[tuple[float, float]]:
+    return {tuple(coord) for coord in polygon}
+
+
+class TestProfile:
+    """Test profile_polygon against reduce_polygon."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_ranks(self, method: ReductionMethod):
+        """Every vertex of the original is ranked exactly once."""
+        profile = profile_polygon(POLYGON, method)
+
+        assert len(profile) == len(POLYGON) - 1
+        assert len(profile.tolerances) == len(profile)
+        assert sorted(profile.ranks) == list(range(len(profile)))
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_epsilon(self, method: ReductionMethod):
+        """Extracting at a tolerance matches reducing at that tolerance."""
+        profile = profile_polygon(POLYGON, method)
+        for eps in [1e-1, 1e-2, 1e-3]:
+            expected = reduce_polygon(POLYGON, ReductionMode.EPSILON, eps, method)
+
+            assert vertices(profile.at_epsilon(eps)) == vertices(expected)
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_length(self, method: ReductionMethod):
+        """Extracting at a length gives a valid, containing reduction."""
+        profile = profile_polygon(POLYGON, method)
+        for length in [len(POLYGON) // 2, len(POLYGON) // 10]:
+            simplified = profile.at_length(length)
+
+            assert len(simplified) == length
+            assert_contains(simplified, POLYGON)
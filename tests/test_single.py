@@ -0,0 +1,70 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for reduction in single precision."""
+
+import numpy as np
+from polyshell import ReductionMethod, ReductionMode, reduce_polygon, reduce_polygons
+from pytest_cases import parametrize_with_cases  # type: ignore
+from shapely import is_valid  # type: ignore
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from .polygon_cases import BAFFIN_ISLAND, assert_contains
+
+POLYGON = np.asarray(BAFFIN_ISLAND, dtype=np.float32)
+
+
+class TestSingle:
+    """Test float32 reduction against requirements."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_epsilon(self, method: ReductionMethod):
+        """Reduction is valid, containing and returned in single precision."""
+        simplified = reduce_polygon(POLYGON, ReductionMode.EPSILON, 1e-3, method)
+
+        assert simplified.dtype == np.float32
+        assert_contains(simplified, POLYGON)
+        assert set(map(tuple, simplified)) <= set(map(tuple, POLYGON))
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_length(self, method: ReductionMethod):
+        """The target length is obtained in single precision."""
+        simplified = reduce_polygon(POLYGON, ReductionMode.LENGTH, 100, method)
+
+        assert simplified.dtype == np.float32
+        assert len(simplified) == 100
+        assert is_valid(ShapelyPolygon(simplified))
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_offsets(self, method: ReductionMethod):
+        """Batches of float32 polygons are reduced in single precision."""
+        coords = np.concatenate([POLYGON, POLYGON])
+        offsets = np.cumsum([0, len(POLYGON), len(POLYGON)])
+
+        reduced_coords, reduced_offsets = reduce_polygons(
+            coords, ReductionMode.EPSILON, 1e-3, method, offsets=offsets
+        )
+        expected = reduce_polygon(POLYGON, ReductionMode.EPSILON, 1e-3, method)
+
+        assert reduced_coords.dtype == np.float32
+        for start, end in zip(reduced_offsets, reduced_offsets[1:]):
+            np.testing.assert_array_equal(reduced_coords[start:end], expected)
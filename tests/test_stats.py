@@ -0,0 +1,98 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for the collection of reduction statistics."""
+
+import numpy as np
+import pytest
+from polyshell import ReductionStats, reduce_polygon
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+class TestStats:
+    """Test statistics are collected within, and only within, a with block."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_phases(self, method: str):
+        """Validation and reduction are timed, and heap operations counted."""
+        with ReductionStats() as stats:
+            reduce_polygon(POLYGON, "epsilon", 1e-2, method)
+
+        assert stats.phases["validation"] > 0
+        assert stats.phases["reduction"] > 0
+        assert stats.phases["output"] == 0
+        assert stats.counters["heap_pops"] <= stats.counters["heap_pushes"]
+
+    def test_counters(self):
+        """Each algorithm counts the work particular to it."""
+        with ReductionStats() as vw:
+            reduce_polygon(POLYGON, "length", 1_000, "vw")
+        with ReductionStats() as rdp:
+            reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+
+        assert vw.counters["heap_pops"] > 0
+        assert vw.counters["stale_skipped"] > 0
+        assert vw.counters["intersection_candidates"] > 0
+        assert rdp.counters["visibility_edges"] > 0
+        assert rdp.counters["max_depth"] > 0
+
+    def test_array(self):
+        """Reading and writing arrays is timed."""
+        with ReductionStats() as stats:
+            reduce_polygon(np.array(POLYGON), "epsilon", 1e-2, "vw")
+
+        assert stats.phases["input"] > 0
+        assert stats.phases["output"] > 0
+
+    def test_outside(self):
+        """Nothing is collected outside of the with block."""
+        stats = ReductionStats()
+        reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+        with stats:
+            pass
+        reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+
+        assert not any(stats.phases.values())
+        assert not any(stats.counters.values())
+
+    def test_nested(self):
+        """Nested blocks collect the reductions made within them."""
+        with ReductionStats() as outer:
+            reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+            with ReductionStats() as inner:
+                reduce_polygon(POLYGON, "epsilon", 1e-2, "rdp")
+
+        edges = inner.counters["visibility_edges"]
+        assert edges > 0
+        assert outer.counters["visibility_edges"] == 2 * edges
+        assert outer.counters["max_depth"] == inner.counters["max_depth"]
+
+    def test_reentry(self):
+        """A collector cannot be entered while it is active."""
+        stats = ReductionStats()
+        with stats:
+            with pytest.raises(RuntimeError):
+                with stats:
+                    pass
@@ -0,0 +1,66 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for the synthetic polygon generators."""
+
+import numpy as np
+import pytest
+from polyshell import reduce_polygon
+from polyshell._polyshell import is_valid as polyshell_is_valid
+from polyshell.synthetic import SHAPES, generate
+from shapely import LinearRing, is_valid  # type: ignore
+from shapely.geometry import Polygon as ShapelyPolygon
+
+
+@pytest.mark.parametrize("shape", list(SHAPES))
+class TestSynthetic:
+    """Test generated polygons are valid, and reproducible."""
+
+    @pytest.mark.parametrize("n", [32, 33, 34, 35, 1_000, 100_001])
+    def test_valid(self, shape: str, n: int):
+        """Polygons are valid, clockwise and of exactly the requested size."""
+        polygon = generate(shape, n)
+
+        assert polygon.shape == (n, 2)
+        assert len(set(map(tuple, polygon[:-1]))) == n - 1
+        assert not LinearRing(polygon).is_ccw
+        assert is_valid(ShapelyPolygon(polygon))
+        assert polyshell_is_valid(polygon)
+
+    def test_deterministic(self, shape: str):
+        """The same seed gives the same polygon, and a different seed another."""
+        assert np.array_equal(generate(shape, 1_000), generate(shape, 1_000))
+        assert not np.array_equal(generate(shape, 1_000), generate(shape, 1_000, 1))
+
+    def test_reduction(self, shape: str):
+        """Generated polygons reduce to a target length."""
+        simplified = reduce_polygon(generate(shape, 10_000), "length", 1_000, "vw")
+
+        assert len(simplified) == 1_000
+        assert is_valid(ShapelyPolygon(simplified))
+
+
+def test_unknown_shape():
+    """Unknown shapes are rejected."""
+    with pytest.raises(ValueError):
+        generate("star", 100)
@@ -0,0 +1,120 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+"""Testing for control over the number of threads reductions run on."""
+
+import numpy as np
+import pytest
+from polyshell import (
+    PreparedPolygon,
+    ThreadLimit,
+    get_num_threads,
+    reduce_polygon,
+    reduce_polygons,
+    set_num_threads,
+)
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+class TestThreads:
+    """Test reductions are unchanged by the number of threads they run on."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_reduce(self, method: str):
+        """A reduction is the same whichever number of threads it runs on."""
+        expected = reduce_polygon(POLYGON, "epsilon", 1e-2, method)
+        for num_threads in (1, 2):
+            reduced = reduce_polygon(
+                POLYGON, "epsilon", 1e-2, method, num_threads=num_threads
+            )
+            assert reduced == expected
+
+    def test_length(self):
+        """Fixed length reductions also take a number of threads."""
+        expected = reduce_polygon(POLYGON, "length", 1_000, "vw")
+        reduced = reduce_polygon(POLYGON, "length", 1_000, "vw", num_threads=1)
+        assert reduced == expected
+
+    def test_batch(self):
+        """Batches are reduced the same whichever number of threads they run on."""
+        polygons = [POLYGON, np.array(POLYGON)]
+        expected = reduce_polygons(polygons, "epsilon", 1e-2, "rdp")
+        reduced = reduce_polygons(polygons, "epsilon", 1e-2, "rdp", num_threads=1)
+        assert [np.array(r).tolist() for r in reduced] == [
+            np.array(r).tolist() for r in expected
+        ]
+
+    def test_prepared(self):
+        """Prepared polygons take a number of threads."""
+        prepared = PreparedPolygon(POLYGON)
+        expected = prepared.reduce("epsilon", 1e-2, "vw")
+        assert prepared.reduce("epsilon", 1e-2, "vw", num_threads=1) == expected
+
+
+class TestThreadLimit:
+    """Test the number of threads is set by, and only within, a with block."""
+
+    def test_limit(self):
+        """The number of threads is limited within the block and restored after."""
+        default = get_num_threads()
+        with ThreadLimit(1):
+            assert get_num_threads() == 1
+            with ThreadLimit(2):
+                assert get_num_threads() == 2
+            assert get_num_threads() == 1
+        assert get_num_threads() == default
+
+    def test_unlimited(self):
+        """Without a number of threads, the limit in force is left unchanged."""
+        with ThreadLimit(1):
+            with ThreadLimit():
+                assert get_num_threads() == 1
+
+    def test_default(self):
+        """The default number of threads applies outside of any block."""
+        try:
+            set_num_threads(1)
+            assert get_num_threads() == 1
+            with ThreadLimit(2):
+                assert get_num_threads() == 2
+        finally:
+            set_num_threads(None)
+        assert get_num_threads() >= 1
+
+    def test_zero(self):
+        """A limit of zero threads is rejected, leaving the default unchanged."""
+        default = get_num_threads()
+        with pytest.raises(ValueError):
+            ThreadLimit(0)
+        with pytest.raises(ValueError):
+            set_num_threads(0)
+        assert get_num_threads() == default
+
+    def test_reentry(self):
+        """A limit cannot be entered while it is active."""
+        limit = ThreadLimit(1)
+        with limit:
+            with pytest.raises(RuntimeError):
+                with limit:
+                    pass
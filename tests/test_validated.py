@@ -0,0 +1,144 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for reduction of validated polygons."""
+
+import numpy as np
+import pytest
+from polyshell import (
+    ReductionMethod,
+    ReductionMode,
+    ValidatedPolygon,
+    reduce_polygon,
+    reduce_polygons,
+    synthetic,
+)
+from polyshell._polyshell import is_valid
+from pytest_cases import parametrize_with_cases  # type: ignore
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+
+
+class TestValidated:
+    """Test reduction of validated polygons against checked reduction."""
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_epsilon(self, method: ReductionMethod):
+        """Validated polygons reduce to the same vertices as checked polygons."""
+        validated = ValidatedPolygon(POLYGON)
+        expected = reduce_polygon(POLYGON, ReductionMode.EPSILON, 1e-3, method)
+        simplified = reduce_polygon(validated, ReductionMode.EPSILON, 1e-3, method)
+
+        assert set(map(tuple, simplified)) == set(map(tuple, expected))
+
+    @parametrize_with_cases("method", cases=".method_cases")
+    def test_length(self, method: ReductionMethod):
+        """Validated polygons reduce to the same length as checked polygons."""
+        validated = ValidatedPolygon(POLYGON)
+        simplified = reduce_polygon(validated, ReductionMode.LENGTH, 100, method)
+
+        assert len(simplified) == 100
+
+    def test_invalid(self):
+        """Invalid polygons are rejected when validated."""
+        bowtie = [(0.0, 0.0), (1.0, 1.0), (1.0, 0.0), (0.0, 1.0), (0.0, 0.0)]
+        with pytest.raises(ValueError):
+            ValidatedPolygon(bowtie)
+
+    def test_read_only(self):
+        """Validated coordinates cannot be changed once checked."""
+        validated = ValidatedPolygon(np.array(POLYGON))
+        with pytest.raises(ValueError):
+            validated.coords[1] = validated.coords[0]
+
+        validated = ValidatedPolygon(POLYGON)
+        with pytest.raises(TypeError):
+            validated.coords[1] = validated.coords[0]
+        with pytest.raises(AttributeError):
+            validated.coords = POLYGON
+
+
+class TestRepair:
+    """Test the repair stage against requirements."""
+
+    def test_repair(self):
+        """Open, counter-clockwise polygons with redundant points are repaired."""
+        square = [
+            (0.0, 0.0),
+            (1.0, 0.0),
+            (1.0, 0.0),
+            (2.0, 0.0),
+            (2.0, 2.0),
+            (0.0, 2.0),
+        ]
+        validated = ValidatedPolygon(square, repair=True)
+
+        assert validated.repairs
+        assert validated.repairs.closed == 1
+        assert validated.repairs.reversed == 1
+        assert validated.repairs.duplicates == 1
+        assert validated.repairs.collinear == 1
+        assert len(validated) == 5
+        assert validated.coords[0] == validated.coords[-1]
+
+    def test_unchanged(self):
+        """Valid polygons without straight runs are left unchanged."""
+        polygon = synthetic.coastline(10_000)
+        validated = ValidatedPolygon(polygon, repair=True)
+
+        assert not validated.repairs
+        np.testing.assert_array_equal(validated.coords, polygon)
+
+    def test_collinear(self):
+        """The middle points of exactly straight runs are dropped, and nothing else."""
+        validated = ValidatedPolygon(POLYGON, repair=True)
+
+        assert validated.repairs.closed == 0
+        assert validated.repairs.reversed == 0
+        assert validated.repairs.duplicates == 0
+        assert validated.repairs.collinear == 10
+        assert len(validated) == len(POLYGON) - 10
+
+    @pytest.mark.parametrize("mode, value", [("epsilon", 1e-3), ("length", 100)])
+    def test_reduce(self, mode: str, value: float):
+        """Polygons are repaired when reduced with repair."""
+        square = [(0.0, 0.0), (0.0, 2.0), (2.0, 2.0), (2.0, 0.0)]
+        with pytest.raises(ValueError):
+            reduce_polygon(square, mode, value, "vw")
+
+        reduced = reduce_polygon(square, mode, value, "vw", repair=True)
+        assert reduced[0] == reduced[-1]
+        assert len(reduced) == 5
+
+    def test_rejected(self):
+        """Open polygons are rejected without repair."""
+        square = [(0.0, 0.0), (0.0, 2.0), (2.0, 2.0), (2.0, 0.0)]
+        with pytest.raises(ValueError, match="not closed"):
+            ValidatedPolygon(square)
+        with pytest.raises(ValueError, match="not closed"):
+            ValidatedPolygon(np.array(square))
+        with pytest.raises(ValueError, match="Polygon 1: Polygon is not closed"):
+            reduce_polygons([POLYGON, square], "epsilon", 1e-3, "rdp")
+
+        assert not is_valid(square)
+        assert is_valid(square + square[:1])
@@ -0,0 +1,105 @@
+#
+# Copyright 2025- European Centre for Medium-Range Weather Forecasts (ECMWF)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation nor
+# does it submit to any jurisdiction.
+#
+# Copyright 2025- Niall Oswald and Kenneth Martin and Jo Wayne Tan
+#
+
+
+"""Testing for Visvalingam-Whyatt with a live spatial index."""
+
+import numpy as np
+import pytest
+from polyshell import (
+    PreparedPolygon,
+    ReductionMethod,
+    ReductionMode,
+    reduce_polygon,
+    reduce_polygons,
+)
+from polyshell._polyshell import reduce_polygon_vw
+from shapely import is_valid  # type: ignore
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from .polygon_cases import BAFFIN_ISLAND as POLYGON
+from .polygon_cases import CaseLarge, assert_contains
+
+
+class TestLiveIndex:
+    """Test reduction with a live index against requirements."""
+
+    def test_epsilon(self):
+        """Reduction is valid and containing at every tolerance."""
+        for eps in [1e-4, 1e-2, 1.0]:
+            simplified = reduce_polygon_vw(POLYGON, eps, 0, live_index=True)
+
+            assert_contains(simplified, POLYGON)
+            assert set(map(tuple, simplified)) <= set(map(tuple, POLYGON))
+
+    def test_length(self):
+        """The target length is obtained."""
+        length = len(POLYGON) // 10
+        simplified = reduce_polygon_vw(POLYGON, float("inf"), length, live_index=True)
+
+        assert len(simplified) == length
+        assert is_valid(ShapelyPolygon(simplified))
+
+
+@pytest.mark.parametrize(
+    "mode, target", [(ReductionMode.EPSILON, 1e-2), (ReductionMode.LENGTH, 1000)]
+)
+class TestLiveStatic:
+    """Test the live index against the static index on the same input."""
+
+    def test_single(self, mode, target):
+        """A single polygon reduces to the same result with either index."""
+        static = reduce_polygon(POLYGON, mode, target, ReductionMethod.VW)
+        live = reduce_polygon(
+            POLYGON, mode, target, ReductionMethod.VW, live_index=True
+        )
+
+        np.testing.assert_array_equal(live, static)
+
+    def test_array(self, mode, target):
+        """An array reduces to the same result with either index."""
+        polygon = np.array(POLYGON)
+        static = reduce_polygon(polygon, mode, target, ReductionMethod.VW)
+        live = reduce_polygon(
+            polygon, mode, target, ReductionMethod.VW, live_index=True
+        )
+
+        np.testing.assert_array_equal(live, static)
+
+    def test_batch(self, mode, target):
+        """A batch reduces to the same result with either index."""
+        polygons = [POLYGON, CaseLarge().case_greenland()]
+        static = reduce_polygons(polygons, mode, target, ReductionMethod.VW)
+        live = reduce_polygons(
+            polygons, mode, target, ReductionMethod.VW, live_index=True
+        )
+
+        for a, b in zip(live, static, strict=True):
+            np.testing.assert_array_equal(a, b)
+
+    def test_prepared(self, mode, target):
+        """A prepared polygon reduces to the same result with either index."""
+        prepared = PreparedPolygon(POLYGON)
+        static = prepared.reduce(mode, target, ReductionMethod.VW)
+        live = prepared.reduce(mode, target, ReductionMethod.VW, live_index=True)
+
+        np.testing.assert_array_equal(live, static)